@@ -0,0 +1,95 @@
+"""
+JSON codec micro-benchmark.
+
+Compares every available codec (stdlib json, orjson if installed) on the
+work handle_call_tool does per response: decoding the Ashby body, then
+encoding the result indented (default) or compact. Reports throughput and
+peak traced memory per operation.
+
+    uv run python benchmarks/codecs.py
+    uv run python benchmarks/codecs.py --payload-dir recorded/   # *.json Ashby response bodies
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import synthetic  # noqa: E402
+from json_codec import StdlibCodec, available_codecs  # noqa: E402
+
+SYNTHETIC_PAYLOADS = {
+    "candidate_list x100": ("candidate", 100),
+    "application_list x100": ("application", 100),
+    "job_list x50": ("job", 50),
+    "feedback_list x20": ("feedback", 20),
+}
+
+
+def load_payloads(payload_dir: Optional[str] = None) -> dict[str, bytes]:
+    """Raw response bodies keyed by a display name."""
+    stdlib = StdlibCodec()
+    if payload_dir:
+        return {path.name: path.read_bytes() for path in sorted(Path(payload_dir).glob("*.json"))}
+    return {
+        name: stdlib.dumps(synthetic.list_response(kind, count)).encode()
+        for name, (kind, count) in SYNTHETIC_PAYLOADS.items()
+    }
+
+
+def throughput(fn, min_seconds: float) -> float:
+    """Calls per second of fn(), run repeatedly for at least min_seconds."""
+    calls = 0
+    started = time.perf_counter()
+    while True:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_seconds:
+            return calls / elapsed
+
+
+def peak_memory(fn) -> int:
+    """Peak bytes allocated during one call of fn()."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare JSON codecs on Ashby payloads")
+    parser.add_argument("--payload-dir", help="Directory of recorded Ashby response bodies (*.json)")
+    parser.add_argument("--seconds", type=float, default=0.5, help="Minimum run time per measurement")
+    args = parser.parse_args()
+
+    payloads = load_payloads(args.payload_dir)
+    codecs = available_codecs()
+    if "orjson" not in codecs:
+        print("orjson not installed - only the standard library is measured (uv pip install orjson)\n")
+
+    print(f"{'payload':<24} {'KB':>7} {'codec':<7} {'operation':<14} {'ops/sec':>9} {'MB/sec':>8} {'peak KB':>9}")
+    for payload_name, body in payloads.items():
+        document = StdlibCodec().loads(body)
+        size_mb = len(body) / 1e6
+        for codec_name, codec in codecs.items():
+            operations = {
+                "decode": lambda: codec.loads(body),
+                "encode indent": lambda: codec.dumps(document, indent=True),
+                "encode compact": lambda: codec.dumps(document),
+            }
+            for operation, fn in operations.items():
+                ops = throughput(fn, args.seconds)
+                peak = peak_memory(fn)
+                print(f"{payload_name:<24} {len(body) / 1024:>7.0f} {codec_name:<7} {operation:<14} "
+                      f"{ops:>9.0f} {ops * size_mb:>8.1f} {peak / 1024:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Concurrency benchmark for the Ashby MCP server.
+
+Drives handle_call_tool against a local mock Ashby server and reports
+throughput at several concurrency levels:
+
+    uv run python benchmarks/concurrency.py --latency 0.05 --calls 256
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("ASHBY_API_KEY", "benchmark")
+# Synthetic or recorded candidates never go into the real full-text index
+os.environ.setdefault("ASHBY_FULLTEXT_PATH", ":memory:")
+# Measure the transport, not the client-side rate limiter
+os.environ.setdefault("ASHBY_RATE_LIMIT", "1000000")
+os.environ.setdefault("ASHBY_RATE_BURST", "1000")
+
+import mock_ashby  # noqa: E402
+import server as ashby_server  # noqa: E402
+import synthetic  # noqa: E402
+
+DATASET_SIZE = 500
+
+
+async def run_level(concurrency: int, calls: int) -> float:
+    """Issue `calls` tool calls with at most `concurrency` in flight; return calls/sec."""
+    semaphore = asyncio.Semaphore(concurrency)
+    candidate_ids = [c["id"] for c in synthetic.records("candidate", DATASET_SIZE)]
+
+    async def one(i: int):
+        async with semaphore:
+            candidate_id = candidate_ids[i % DATASET_SIZE]
+            await ashby_server.handle_call_tool("candidate_info", {"candidateId": candidate_id})
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(calls)))
+    elapsed = time.perf_counter() - started
+    return calls / elapsed
+
+
+async def main_async(args):
+    mock, base_url = mock_ashby.start_in_process(latency=args.latency, size=DATASET_SIZE)
+    ashby_server.get_ashby_client().base_url = base_url
+    try:
+        # Warm the connection pool so the first level isn't charged for handshakes
+        await run_level(max(args.levels), max(args.levels))
+
+        print(f"mock latency: {args.latency * 1000:.0f} ms, calls per level: {args.calls}")
+        print(f"{'concurrency':>11}  {'calls/sec':>10}")
+        for level in args.levels:
+            throughput = await run_level(level, args.calls)
+            print(f"{level:>11}  {throughput:>10.1f}")
+    finally:
+        await ashby_server.get_ashby_client().aclose()
+        mock.terminate()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark concurrent Ashby tool calls")
+    parser.add_argument("--latency", type=float, default=0.05, help="Mock upstream latency in seconds")
+    parser.add_argument("--calls", type=int, default=256, help="Tool calls per concurrency level")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 8, 32])
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Load test for the Ashby MCP server.
+
+Starts the mock Ashby API in a child process and drives handle_call_tool
+open-loop at a target request rate with a weighted mix of read and write
+tools, then reports achieved throughput, latency percentiles per tool,
+errors by status and memory use:
+
+    uv run python benchmarks/loadtest.py --rate 50 --duration 30
+    uv run python benchmarks/loadtest.py --rate 200 --size 5000 --latency 0.1 --jitter 0.1 --error-rate 0.02
+    uv run python benchmarks/loadtest.py --mix candidate_info=1 --rate 500
+    uv run python benchmarks/loadtest.py --record trace.ndjson.gz   # then replay with benchmarks/replay.py
+
+Open-loop means calls start on schedule whether or not earlier ones have
+finished, so a server that falls behind shows up as growing latency and
+in-flight count rather than a quietly lower request rate.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import resource
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("ASHBY_API_KEY", "benchmark")
+# Synthetic or recorded candidates never go into the real full-text index
+os.environ.setdefault("ASHBY_FULLTEXT_PATH", ":memory:")
+# Measure the server, not the client-side rate limiter
+os.environ.setdefault("ASHBY_RATE_LIMIT", "1000000")
+os.environ.setdefault("ASHBY_RATE_BURST", "1000")
+
+import mock_ashby  # noqa: E402
+import server as ashby_server  # noqa: E402
+import synthetic  # noqa: E402
+from metrics import percentile  # noqa: E402
+
+# Tool -> (default weight, arguments built from the dataset)
+WORKLOAD = {
+    "candidate_info": (30, lambda d, rng: {"candidateId": rng.choice(d.kinds["candidate"])["id"]}),
+    "candidate_list": (10, lambda d, rng: {"limit": 100}),
+    "candidate_search": (10, lambda d, rng: {"name": rng.choice(d.kinds["candidate"])["name"].split()[0]}),
+    "application_info": (15, lambda d, rng: {"applicationId": rng.choice(d.kinds["application"])["id"]}),
+    "application_list": (10, lambda d, rng: {"jobId": rng.choice(d.kinds["job"])["id"]}),
+    "job_list": (5, lambda d, rng: {}),
+    "candidate_list_notes": (5, lambda d, rng: {"candidateId": rng.choice(d.kinds["candidate"])["id"]}),
+    "feedback_list": (5, lambda d, rng: {"applicationId": rng.choice(d.kinds["application"])["id"]}),
+    "source_list": (5, lambda d, rng: {}),
+    "candidate_add_note": (3, lambda d, rng: {"candidateId": rng.choice(d.kinds["candidate"])["id"],
+                                              "note": "Load test note"}),
+    "application_change_stage": (2, lambda d, rng: {"applicationId": rng.choice(d.kinds["application"])["id"],
+                                                    "interviewStageId": rng.choice(d.kinds["interview_stage"])["id"]}),
+}
+
+
+def parse_mix(values: list[str]) -> dict[str, int]:
+    """tool=weight pairs, defaulting to the built-in workload."""
+    if not values:
+        return {tool: weight for tool, (weight, _) in WORKLOAD.items()}
+    mix = {}
+    for value in values:
+        tool, _, weight = value.partition("=")
+        if tool not in WORKLOAD:
+            raise SystemExit(f"unknown tool in --mix: {tool} (have: {', '.join(WORKLOAD)})")
+        mix[tool] = int(weight or 1)
+    return mix
+
+
+def rss_mb() -> float:
+    """Peak resident set size of this process so far, in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def run(args, dataset: synthetic.Dataset, mix: dict[str, int]) -> tuple[dict[str, list[float]], float, int]:
+    """Issue calls at args.rate for args.duration seconds.
+
+    Returns latencies per tool, the wall time until the last call finished,
+    and the most calls that were in flight at once.
+    """
+    rng = random.Random(args.seed)
+    tools, weights = list(mix), list(mix.values())
+    latencies: dict[str, list[float]] = {tool: [] for tool in tools}
+    in_flight = 0
+    max_in_flight = 0
+
+    async def one(tool: str, arguments: dict):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        started = time.perf_counter()
+        try:
+            await ashby_server.handle_call_tool(tool, arguments)
+        finally:
+            latencies[tool].append(time.perf_counter() - started)
+            in_flight -= 1
+
+    total = int(args.rate * args.duration)
+    tasks = []
+    started = time.perf_counter()
+    for i in range(total):
+        delay = started + i / args.rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tool = rng.choices(tools, weights)[0]
+        tasks.append(asyncio.ensure_future(one(tool, WORKLOAD[tool][1](dataset, rng))))
+    await asyncio.gather(*tasks)
+    return latencies, time.perf_counter() - started, max_in_flight
+
+
+async def main_async(args):
+    mix = parse_mix(args.mix)
+    if args.record:
+        os.environ["ASHBY_TRANSPORT"] = "record"
+        os.environ["ASHBY_CASSETTE"] = args.record
+    dataset = synthetic.Dataset(args.size, args.seed)
+    mock, base_url = mock_ashby.start_in_process(
+        latency=args.latency, size=args.size, seed=args.seed, jitter=args.jitter,
+        error_rate=args.error_rate, error_statuses=tuple(args.error_statuses),
+    )
+    ashby_server.get_ashby_client().base_url = base_url
+    if args.tracemalloc:
+        tracemalloc.start()
+    rss_before = rss_mb()
+    try:
+        latencies, elapsed, max_in_flight = await run(args, dataset, mix)
+    finally:
+        await ashby_server.get_ashby_client().aclose()
+        mock.terminate()
+
+    calls = sum(len(samples) for samples in latencies.values())
+    print(f"target {args.rate:.0f} calls/s for {args.duration:.0f}s against {args.size} candidates, "
+          f"mock latency {args.latency * 1000:.0f}+{args.jitter * 1000:.0f} ms, error rate {args.error_rate:.1%}")
+    print(f"achieved {calls / elapsed:.1f} calls/s ({calls} calls in {elapsed:.1f}s), "
+          f"max in flight {max_in_flight}")
+
+    print(f"\n{'tool':<26} {'calls':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    everything = []
+    for tool, samples in sorted(latencies.items()):
+        if not samples:
+            continue
+        ordered = sorted(samples)
+        everything.extend(ordered)
+        print(f"{tool:<26} {len(ordered):>6} {percentile(ordered, 0.5) * 1000:>8.1f} "
+              f"{percentile(ordered, 0.95) * 1000:>8.1f} {percentile(ordered, 0.99) * 1000:>8.1f} "
+              f"{ordered[-1] * 1000:>8.1f}")
+    everything.sort()
+    print(f"{'all':<26} {len(everything):>6} {percentile(everything, 0.5) * 1000:>8.1f} "
+          f"{percentile(everything, 0.95) * 1000:>8.1f} {percentile(everything, 0.99) * 1000:>8.1f} "
+          f"{everything[-1] * 1000:>8.1f}")
+
+    errors = ashby_server.metrics.errors_by_status()
+    print(f"\nerrors: {', '.join(f'{status}={count}' for status, count in sorted(errors.items())) or 'none'}")
+    print(f"retries after 429: {ashby_server.get_ashby_client().retries}")
+    print(f"peak RSS: {rss_mb():.1f} MB (was {rss_before:.1f} MB before the run)")
+    if args.tracemalloc:
+        current, peak = tracemalloc.get_traced_memory()
+        print(f"traced Python memory: {current / 1e6:.1f} MB now, {peak / 1e6:.1f} MB peak")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the Ashby MCP server against the mock API")
+    parser.add_argument("--rate", type=float, default=50, help="Target tool calls per second")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds to generate load for")
+    parser.add_argument("--mix", nargs="*", metavar="TOOL=WEIGHT", help="Tool mix (default: built-in read-heavy mix)")
+    parser.add_argument("--size", type=int, default=2000, help="Candidates in the mock dataset")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.05, help="Mock upstream latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random mock latency of up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of mock responses that are errors")
+    parser.add_argument("--error-statuses", type=int, nargs="+", default=[429, 500, 503])
+    parser.add_argument("--tracemalloc", action="store_true", help="Also trace Python allocations (slower)")
+    parser.add_argument("--record", metavar="CASSETTE", help="Record upstream traffic to this cassette")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Replay a recorded Ashby trace through the MCP server.
+
+Re-issues every request in a cassette (see cassette.py) as the tool call
+that produced it, with the recorded spacing between calls, and serves the
+responses from the cassette. Reports throughput, latency per tool and the
+server's own overhead (tool time minus upstream time):
+
+    ASHBY_TRANSPORT=record uv run python server.py             # record a real session
+    uv run python benchmarks/replay.py ashby-cassette.ndjson.gz --speed 10
+    uv run python benchmarks/replay.py trace.ndjson.gz --speed 0 --concurrency 1    # overhead without contention
+
+--speed scales both the gaps between calls and the recorded upstream
+latency; 0 removes them, leaving only the server's own work.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import cassette  # noqa: E402
+from metrics import percentile  # noqa: E402
+
+
+async def replay(ashby_server, entries: list[dict], speed: float, concurrency: int) -> tuple[dict[str, list[float]], float]:
+    tool_for_endpoint = {endpoint: tool for tool, endpoint in ashby_server.ENDPOINT_MAP.items()}
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: dict[str, list[float]] = {}
+
+    async def one(tool: str, arguments: dict):
+        async with semaphore:
+            started = time.perf_counter()
+            await ashby_server.handle_call_tool(tool, arguments)
+            latencies.setdefault(tool, []).append(time.perf_counter() - started)
+
+    tasks = []
+    started = time.perf_counter()
+    first_at = entries[0]["at"] if entries else 0.0
+    for entry in entries:
+        tool = tool_for_endpoint.get(entry["p"])
+        if tool is None:
+            continue
+        if speed:
+            delay = started + (entry["at"] - first_at) / speed - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        tasks.append(asyncio.ensure_future(one(tool, entry["q"])))
+    await asyncio.gather(*tasks)
+    return latencies, time.perf_counter() - started
+
+
+async def main_async(args):
+    os.environ["ASHBY_TRANSPORT"] = "replay"
+    os.environ["ASHBY_CASSETTE"] = args.cassette
+    os.environ["ASHBY_REPLAY_SPEED"] = str(args.speed)
+    # Replay every recorded request rather than serving repeats from memory
+    os.environ.setdefault("ASHBY_CACHE_SIZE", "0")
+    # Synthetic or recorded candidates never go into the real full-text index
+    os.environ.setdefault("ASHBY_FULLTEXT_PATH", ":memory:")
+    os.environ.setdefault("ASHBY_RATE_LIMIT", "1000000")
+    os.environ.setdefault("ASHBY_RATE_BURST", "1000")
+    import server as ashby_server
+
+    entries = list(cassette.read_cassette(args.cassette))
+    recorded_seconds = entries[-1]["at"] - entries[0]["at"] if entries else 0.0
+    try:
+        latencies, elapsed = await replay(ashby_server, entries, args.speed, args.concurrency)
+    finally:
+        await ashby_server.get_ashby_client().aclose()
+
+    calls = sum(len(samples) for samples in latencies.values())
+    print(f"{len(entries)} recorded requests over {recorded_seconds:.1f}s, replayed at "
+          f"{'full speed' if not args.speed else f'{args.speed:g}x'}")
+    print(f"{calls} calls in {elapsed:.2f}s = {calls / elapsed if elapsed else 0:.1f} calls/s")
+
+    print(f"\n{'tool':<26} {'calls':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'overhead ms':>12}")
+    for tool, samples in sorted(latencies.items()):
+        ordered = sorted(samples)
+        total = ashby_server.metrics.histogram("tool", tool)
+        upstream = ashby_server.metrics.histogram("upstream", tool)
+        overhead = (total.sum - (upstream.sum if upstream else 0.0)) / total.count if total else 0.0
+        print(f"{tool:<26} {len(ordered):>6} {percentile(ordered, 0.5) * 1000:>8.2f} "
+              f"{percentile(ordered, 0.95) * 1000:>8.2f} {percentile(ordered, 0.99) * 1000:>8.2f} "
+              f"{overhead * 1000:>12.3f}")
+
+    errors = ashby_server.metrics.errors_by_status()
+    if errors:
+        print(f"\nerrors: {', '.join(f'{status}={count}' for status, count in sorted(errors.items()))}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded Ashby trace through the MCP server")
+    parser.add_argument("cassette", help="Cassette recorded with ASHBY_TRANSPORT=record")
+    parser.add_argument("--speed", type=float, default=10, help="Replay speed multiple; 0 for no delays")
+    parser.add_argument("--concurrency", type=int, default=256, help="Maximum calls in flight")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
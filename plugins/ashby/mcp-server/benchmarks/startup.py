@@ -0,0 +1,112 @@
+"""
+Cold-start benchmark for the Ashby MCP server.
+
+Reports:
+- import cost per top-level module (from `python -X importtime`)
+- time from process launch to the initialize response over stdio
+- time to answer tools/list
+
+    uv run python benchmarks/startup.py --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+SERVER_DIR = Path(__file__).resolve().parent.parent
+
+
+def import_costs(top: int) -> list[tuple[str, float]]:
+    """Cumulative import time in ms per top-level package imported by server.py."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import server"],
+        cwd=SERVER_DIR,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "ASHBY_API_KEY": "benchmark", "ASHBY_FULLTEXT_PATH": ":memory:"},
+    )
+    totals: dict[str, float] = defaultdict(float)
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, self_us, _cumulative_us, name = (part.strip() for part in line.replace("import time:", "|").split("|"))
+        totals[name.split(".")[0]] += int(self_us) / 1000
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def _request(process: subprocess.Popen, message: dict) -> dict:
+    process.stdin.write(json.dumps(message) + "\n")
+    process.stdin.flush()
+    while True:
+        line = process.stdout.readline()
+        if not line:
+            raise RuntimeError("server exited before responding")
+        response = json.loads(line)
+        if response.get("id") == message["id"]:
+            return response
+
+
+def handshake_times() -> tuple[float, float]:
+    """Seconds from launch to initialize response, and for one tools/list."""
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "server.py"],
+        cwd=SERVER_DIR,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        env={**os.environ, "ASHBY_API_KEY": "benchmark", "ASHBY_FULLTEXT_PATH": ":memory:"},
+    )
+    try:
+        _request(process, {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "clientInfo": {"name": "startup-benchmark", "version": "0"},
+            },
+        })
+        initialized = time.perf_counter() - started
+        process.stdin.write(json.dumps({"jsonrpc": "2.0", "method": "notifications/initialized"}) + "\n")
+
+        list_started = time.perf_counter()
+        response = _request(process, {"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        listed = time.perf_counter() - list_started
+        if "result" not in response:
+            raise RuntimeError(f"tools/list failed: {response}")
+        return initialized, listed
+    finally:
+        process.kill()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Ashby MCP server cold start")
+    parser.add_argument("--runs", type=int, default=5, help="Server launches to time")
+    parser.add_argument("--top", type=int, default=12, help="Modules to list by import cost")
+    args = parser.parse_args()
+
+    print("Import cost by top-level module (ms, self time summed over submodules)")
+    for name, ms in import_costs(args.top):
+        print(f"  {name:<24} {ms:>8.1f}")
+
+    runs = [handshake_times() for _ in range(args.runs)]
+    init_ms = [initialized * 1000 for initialized, _ in runs]
+    list_ms = [listed * 1000 for _, listed in runs]
+    print(f"\nTime to initialize over stdio ({args.runs} runs)")
+    print(f"  median {statistics.median(init_ms):8.1f} ms   min {min(init_ms):8.1f} ms   max {max(init_ms):8.1f} ms")
+    print("tools/list round trip")
+    print(f"  median {statistics.median(list_ms):8.1f} ms   min {min(list_ms):8.1f} ms   max {max(list_ms):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
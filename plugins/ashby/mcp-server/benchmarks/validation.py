@@ -0,0 +1,103 @@
+"""
+Tool argument validation micro-benchmark.
+
+Measures the per-call cost of checking arguments against a tool's
+inputSchema three ways: the precompiled validators the server uses
+(validation.py), jsonschema.validate as the MCP SDK calls it per request,
+and a jsonschema validator built once. Each tool is timed on valid
+arguments and on arguments with a mistake, where the compiled validator
+also builds its error message.
+
+    uv run python benchmarks/validation.py
+    uv run python benchmarks/validation.py --seconds 1
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("ASHBY_API_KEY", "benchmark")
+# Synthetic or recorded candidates never go into the real full-text index
+os.environ.setdefault("ASHBY_FULLTEXT_PATH", ":memory:")
+
+import jsonschema  # noqa: E402
+
+import server  # noqa: E402
+from validation import ArgumentError, compile_tools  # noqa: E402
+
+ID = "3ae2b801-19f6-41ef-ad28-214bd731948f"
+
+# tool -> (valid arguments, invalid arguments)
+CASES = {
+    "candidate_info": (
+        {"candidateId": ID},
+        {"candidateID": ID},
+    ),
+    "candidate_list": (
+        {"limit": 50, "all_pages": True, "max_rows": 500, "fields": ["id", "name"], "compact": True},
+        {"limit": "50", "all_pages": True},
+    ),
+    "application_change_stage": (
+        {"applicationId": ID, "interviewStageId": ID},
+        {"applicationId": ID},
+    ),
+    "batch": (
+        {"operations": [
+            {"id": str(i), "tool": "candidate_info", "arguments": {"candidateId": ID}} for i in range(20)
+        ]},
+        {"operations": [{"tool": "candidate_info", "arguments": {"candidateId": ID}}], "concurrency": "8"},
+    ),
+}
+
+
+def throughput(fn, min_seconds: float) -> float:
+    """Calls per second of fn(), run repeatedly for at least min_seconds."""
+    calls = 0
+    started = time.perf_counter()
+    while True:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_seconds:
+            return calls / elapsed
+
+
+def rejects(validate):
+    """fn() that calls validate and swallows the expected validation error."""
+    def fn():
+        try:
+            validate()
+        except (ArgumentError, jsonschema.ValidationError):
+            pass
+    return fn
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure per-call tool argument validation overhead")
+    parser.add_argument("--seconds", type=float, default=0.5, help="Minimum run time per measurement")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    validators = compile_tools({tool.name: tool.inputSchema for tool in server.TOOLS})
+    print(f"compiled {len(server.TOOLS)} tool schemas in {(time.perf_counter() - started) * 1000:.1f} ms\n")
+
+    print(f"{'tool':<26} {'arguments':<9} {'compiled us':>12} {'jsonschema us':>14} {'prebuilt us':>12} {'speedup':>8}")
+    for name, (valid, invalid) in CASES.items():
+        schema = server.TOOLS_BY_NAME[name].inputSchema
+        prebuilt = jsonschema.validators.validator_for(schema)(schema)
+        for label, arguments in (("valid", valid), ("invalid", invalid)):
+            methods = {
+                "compiled": lambda: validators[name](arguments),
+                "jsonschema": lambda: jsonschema.validate(arguments, schema),
+                "prebuilt": lambda: prebuilt.validate(arguments),
+            }
+            micros = {method: 1e6 / throughput(rejects(fn), args.seconds) for method, fn in methods.items()}
+            print(f"{name:<26} {label:<9} {micros['compiled']:>12.2f} {micros['jsonschema']:>14.1f} "
+                  f"{micros['prebuilt']:>12.1f} {micros['jsonschema'] / micros['compiled']:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
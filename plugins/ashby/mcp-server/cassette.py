@@ -0,0 +1,132 @@
+"""
+Record/replay httpx transports for the Ashby client.
+
+A cassette is newline-delimited JSON, gzipped when the path ends in .gz.
+Each line is one request/response pair:
+
+    {"at": 0.412, "p": "/candidate.info", "q": {...}, "s": 200, "t": 0.087, "j": {...}}
+
+`at` is seconds since recording started, `p`/`q` the endpoint and request
+body, `s` the status, `t` the upstream time, `j` the JSON response body (or
+`b` for a non-JSON body) and `r` a Retry-After header when there was one.
+Request headers are never written, so cassettes hold no credentials.
+
+Replay matches on endpoint and request body. Repeated identical requests
+get the recorded responses in order, then the last one again.
+"""
+
+import asyncio
+import gzip
+import json
+import time
+from collections import deque
+from typing import Any, Iterator, Optional
+
+import httpx
+
+
+class CassetteMiss(LookupError):
+    """A replayed request that the cassette has no response for."""
+
+
+def _open(path: str, mode: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _request_body(request: httpx.Request) -> Any:
+    return json.loads(request.content) if request.content else {}
+
+
+def request_key(path: str, body: Any) -> str:
+    return path + " " + json.dumps(body, sort_keys=True, separators=(",", ":"))
+
+
+def read_cassette(path: str) -> Iterator[dict]:
+    """Yield the entries of a cassette in recorded order."""
+    with _open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _prepared(entry: dict) -> tuple[int, dict, bytes, float]:
+    """Status, headers, body and upstream time, encoded once at load."""
+    headers = {"Content-Type": "application/json"}
+    if "r" in entry:
+        headers["Retry-After"] = entry["r"]
+    content = json.dumps(entry["j"]).encode() if "j" in entry else entry.get("b", "").encode()
+    return entry["s"], headers, content, entry.get("t", 0.0)
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Forwards requests to a real transport and appends each exchange to a cassette."""
+
+    def __init__(self, path: str, transport: httpx.AsyncBaseTransport):
+        self.path = path
+        self.transport = transport
+        self.started = time.monotonic()
+        self.recorded = 0
+        self._file = _open(path, "a")
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        sent_at = time.monotonic()
+        response = await self.transport.handle_async_request(request)
+        content = await response.aread()
+        await response.aclose()
+
+        entry: dict[str, Any] = {
+            "at": round(sent_at - self.started, 4),
+            "p": request.url.path,
+            "q": _request_body(request),
+            "s": response.status_code,
+            "t": round(time.monotonic() - sent_at, 4),
+        }
+        if "Retry-After" in response.headers:
+            entry["r"] = response.headers["Retry-After"]
+        try:
+            entry["j"] = json.loads(content)
+        except ValueError:
+            entry["b"] = content.decode(errors="replace")
+        self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self.recorded += 1
+
+        # aread() has already undone any Content-Encoding
+        headers = [(k, v) for k, v in response.headers.items() if k not in ("content-encoding", "content-length")]
+        return httpx.Response(response.status_code, headers=headers, content=content,
+                              request=request, extensions=response.extensions)
+
+    async def aclose(self) -> None:
+        self._file.close()
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Serves responses from a cassette instead of the network.
+
+    With `speed` set, each response is delayed by its recorded upstream time
+    divided by `speed` (1 = as recorded, 10 = ten times faster). Without it
+    responses are immediate, which isolates the server's own overhead.
+    """
+
+    def __init__(self, path: str, speed: Optional[float] = None):
+        self.path = path
+        self.speed = speed
+        self.responses: dict[str, deque] = {}
+        for entry in read_cassette(path):
+            self.responses.setdefault(request_key(entry["p"], entry["q"]), deque()).append(_prepared(entry))
+        self.replayed = 0
+        self.misses = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = request_key(request.url.path, _request_body(request))
+        queue = self.responses.get(key)
+        if not queue:
+            self.misses += 1
+            raise CassetteMiss(f"no recorded response for {key[:200]}")
+        status, headers, content, upstream_seconds = queue.popleft() if len(queue) > 1 else queue[0]
+        if self.speed:
+            await asyncio.sleep(upstream_seconds / self.speed)
+        self.replayed += 1
+        return httpx.Response(status, headers=headers, content=content, request=request)
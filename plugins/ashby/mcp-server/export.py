@@ -0,0 +1,374 @@
+"""
+Streaming export of Ashby records to NDJSON or Parquet.
+
+Pages are written to disk as they arrive, so memory stays flat however
+large the account is. After each durable write the cursor of the next page
+is saved to `<path>.checkpoint.json`; an interrupted export started again
+with the same path and format picks up from there, and output written after
+the last checkpoint is discarded first so no row appears twice. An existing
+file or directory is only replaced when its checkpoint (or, for Parquet, the
+marker file inside it) shows an export wrote it; anything else is left alone.
+
+The next page is always in flight while the current one is written. Ashby
+lists feedback per application, so the feedback export walks application
+pages and fetches the feedback of each page's applications concurrently.
+
+Used by the export_data tool and as a command line tool:
+
+    uv run python export.py applications candidates feedback
+    uv run python export.py applications --format parquet --out exports/
+    uv run python export.py applications --filter status=Active
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import sys
+import time
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, Callable, Optional
+
+# (list tool, arguments) -> page responses in order, starting at arguments["cursor"]
+PageSource = Callable[[str, dict], AsyncGenerator[dict, None]]
+
+# dataset -> list tool; feedback is fetched per application
+DATASETS = {
+    "applications": "application_list",
+    "candidates": "candidate_list",
+    "jobs": "job_list",
+    "interview_schedules": "interview_schedule_list",
+    "offers": "offer_list",
+    "users": "user_list",
+    "feedback": "feedback_list",
+}
+FORMATS = ("ndjson", "parquet")
+PAGE_SIZE = 100
+# Applications whose feedback is fetched at once
+FEEDBACK_CONCURRENCY = 8
+# Rows per Parquet file; also the most rows held in memory
+PARQUET_PART_ROWS = 50000
+# Written into every Parquet output directory so a later export may replace it
+PARQUET_MARKER = ".ashby-export"
+
+
+def default_path(directory: str, dataset: str, output_format: str) -> str:
+    """NDJSON goes to one file, Parquet to a directory of part files."""
+    return os.path.join(directory, dataset + (".ndjson" if output_format == "ndjson" else ""))
+
+
+class NDJSONWriter:
+    """One JSON document per line, appended to a single file."""
+
+    def __init__(self, path: str, state: Optional[dict] = None):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, "ab" if state else "wb")
+        self.bytes = state["bytes"] if state else 0
+        if state:
+            # Drop anything written after the checkpoint
+            self._file.truncate(self.bytes)
+
+    def state(self) -> dict:
+        return {"bytes": self.bytes}
+
+    def write(self, rows: list[dict]) -> None:
+        data = "".join(json.dumps(row, separators=(",", ":")) + "\n" for row in rows).encode()
+        self._file.write(data)
+        self.bytes += len(data)
+
+    def commit(self, final: bool = False) -> Optional[dict]:
+        """Make everything written so far durable and return the resume state."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self.state()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetWriter:
+    """A directory of part-NNNNN.parquet files of up to `part_rows` rows each.
+
+    Top-level fields become string columns: strings as they are, everything
+    else JSON-encoded. Parts can have different columns; read the directory
+    with pyarrow.dataset and a unified schema.
+    """
+
+    def __init__(self, path: str, state: Optional[dict] = None, part_rows: int = PARQUET_PART_ROWS):
+        # Imported here so pyarrow only costs startup time when Parquet is used
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise RuntimeError("Parquet export needs pyarrow - install it with `uv pip install pyarrow`")
+        self._pyarrow = pyarrow
+        self.path = path
+        self.part_rows = part_rows
+        self.parts = state["parts"] if state else 0
+        self.bytes = state.get("bytes", 0) if state else 0
+        self._buffer: list[dict] = []
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, PARQUET_MARKER), "w"):
+            pass
+        # Drop parts written after the checkpoint
+        for name in os.listdir(path):
+            if name.startswith("part-") and int(name[5:10]) >= self.parts:
+                os.remove(os.path.join(path, name))
+
+    def write(self, rows: list[dict]) -> None:
+        self._buffer.extend(rows)
+
+    def state(self) -> dict:
+        return {"parts": self.parts, "bytes": self.bytes}
+
+    def commit(self, final: bool = False) -> Optional[dict]:
+        """Write a part once enough rows are buffered; None until then."""
+        if len(self._buffer) < self.part_rows and not (final and self._buffer):
+            return self.state() if final else None
+        columns: dict[str, list] = {}
+        for index, row in enumerate(self._buffer):
+            for key, value in row.items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [None] * index
+                column.append(value if value is None or isinstance(value, str)
+                              else json.dumps(value, separators=(",", ":")))
+            for column in columns.values():
+                if len(column) < index + 1:
+                    column.append(None)
+        pa = self._pyarrow
+        table = pa.table({key: pa.array(values, pa.string()) for key, values in columns.items()})
+        part_path = os.path.join(self.path, f"part-{self.parts:05d}.parquet")
+        pa.parquet.write_table(table, part_path)
+        self.bytes += os.path.getsize(part_path)
+        self.parts += 1
+        self._buffer = []
+        return self.state()
+
+    def close(self) -> None:
+        self._buffer = []
+
+
+WRITERS = {"ndjson": NDJSONWriter, "parquet": ParquetWriter}
+
+
+def _next_cursor(response: dict) -> Optional[str]:
+    return response.get("nextCursor") if response.get("moreDataAvailable") else None
+
+
+class Exporter:
+    """Exports one dataset to one path, resuming from its checkpoint."""
+
+    def __init__(self, pages: PageSource, dataset: str, path: str, output_format: str = "ndjson",
+                 filters: Optional[dict] = None, resume: bool = True):
+        if dataset not in DATASETS:
+            raise ValueError(f"Unknown dataset {dataset!r} (have: {', '.join(DATASETS)})")
+        if output_format not in FORMATS:
+            raise ValueError(f"Unknown format {output_format!r} (have: {', '.join(FORMATS)})")
+        self.pages = pages
+        self.dataset = dataset
+        self.path = path
+        self.format = output_format
+        self.filters = filters or {}
+        self.resume = resume
+        self.checkpoint_path = path.rstrip("/") + ".checkpoint.json"
+        self.status = "pending"
+        self.error: Optional[str] = None
+        self.rows = 0
+        self.pages_done = 0
+        self.resumed_from: Optional[int] = None
+        self.started = 0.0
+        self.finished: Optional[float] = None
+        self._writer = None
+
+    def _load_checkpoint(self) -> Optional[dict]:
+        if not self.resume or not os.path.exists(self.checkpoint_path):
+            return None
+        with open(self.checkpoint_path) as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("complete") or (checkpoint.get("dataset"), checkpoint.get("format"),
+                                          checkpoint.get("filters")) != (self.dataset, self.format, self.filters):
+            return None
+        if not os.path.exists(self.path) or (
+                self.format == "ndjson" and os.path.getsize(self.path) < checkpoint["writer"]["bytes"]):
+            # The output was moved or cut short since; start over
+            return None
+        return checkpoint
+
+    def _owns_output(self) -> bool:
+        """Whether the existing output at `path` was written by an export."""
+        if os.path.exists(self.checkpoint_path):
+            return True
+        return os.path.isdir(self.path) and os.path.exists(os.path.join(self.path, PARQUET_MARKER))
+
+    def _clear_output(self) -> None:
+        """Remove a previous export's output before starting over."""
+        if not os.path.lexists(self.path):
+            return
+        if not self._owns_output():
+            raise FileExistsError(f"{self.path} already exists and was not written by an export - "
+                                  "choose another path or remove it first")
+        if os.path.isdir(self.path) and not os.path.islink(self.path):
+            shutil.rmtree(self.path)
+        else:
+            os.remove(self.path)
+
+    def _save_checkpoint(self, cursor: Optional[str], writer_state: dict, complete: bool = False) -> None:
+        checkpoint = {
+            "dataset": self.dataset,
+            "format": self.format,
+            "filters": self.filters,
+            "cursor": cursor,
+            "rows": self.rows,
+            "writer": writer_state,
+            "complete": complete,
+            "savedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+        temporary = self.checkpoint_path + ".tmp"
+        with open(temporary, "w") as f:
+            json.dump(checkpoint, f)
+        os.replace(temporary, self.checkpoint_path)
+
+    async def _feedback_rows(self, applications: list[dict]) -> list[dict]:
+        semaphore = asyncio.Semaphore(FEEDBACK_CONCURRENCY)
+
+        async def for_application(application_id: str) -> list[dict]:
+            async with semaphore:
+                rows = []
+                async with aclosing(self.pages("feedback_list", {"applicationId": application_id})) as pages:
+                    async for response in pages:
+                        if not response.get("success"):
+                            raise RuntimeError(f"feedback_list failed for {application_id}: {response.get('errors')}")
+                        rows.extend(response.get("results", []))
+                return rows
+
+        per_application = await asyncio.gather(*(for_application(a["id"]) for a in applications if a.get("id")))
+        return [row for rows in per_application for row in rows]
+
+    async def run(self) -> dict:
+        self.status = "running"
+        self.started = time.perf_counter()
+        checkpoint = self._load_checkpoint()
+        cursor = checkpoint["cursor"] if checkpoint else None
+        if checkpoint:
+            self.rows = self.resumed_from = checkpoint["rows"]
+
+        tool = "application_list" if self.dataset == "feedback" else DATASETS[self.dataset]
+        arguments: dict[str, Any] = {**self.filters, "limit": PAGE_SIZE}
+        if cursor:
+            arguments["cursor"] = cursor
+        try:
+            if checkpoint is None:
+                self._clear_output()
+            self._writer = WRITERS[self.format](self.path, checkpoint["writer"] if checkpoint else None)
+            if checkpoint is None:
+                # Marks the new output as this export's before any row is written
+                self._save_checkpoint(cursor, self._writer.state())
+            async with aclosing(self.pages(tool, arguments)) as pages:
+                async for response in pages:
+                    if not response.get("success"):
+                        raise RuntimeError(f"{tool} failed: {response.get('errors')}")
+                    rows = response.get("results", [])
+                    if self.dataset == "feedback":
+                        rows = await self._feedback_rows(rows)
+                    self._writer.write(rows)
+                    self.rows += len(rows)
+                    self.pages_done += 1
+                    next_cursor = _next_cursor(response)
+                    state = self._writer.commit(final=next_cursor is None)
+                    if state is not None:
+                        self._save_checkpoint(next_cursor, state, complete=next_cursor is None)
+            self.status = "complete"
+        except asyncio.CancelledError:
+            self.status = "cancelled"
+            raise
+        except Exception as e:
+            self.status = "failed"
+            self.error = str(e)
+            raise
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+            self.finished = time.perf_counter()
+        return self.stats()
+
+    def stats(self) -> dict:
+        end = self.finished or time.perf_counter()
+        seconds = end - self.started if self.started else 0.0
+        new_rows = self.rows - (self.resumed_from or 0)
+        stats = {
+            "dataset": self.dataset,
+            "format": self.format,
+            "path": self.path,
+            "status": self.status,
+            "rows": self.rows,
+            "pages": self.pages_done,
+            "bytes": self._writer.bytes if self._writer else 0,
+            "seconds": round(seconds, 2),
+            "rowsPerSecond": round(new_rows / seconds, 1) if seconds else 0.0,
+        }
+        if self.resumed_from is not None:
+            stats["resumedFromRow"] = self.resumed_from
+        if self.error:
+            stats["error"] = self.error
+        return stats
+
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+async def _report(exporters: list[Exporter], interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        for exporter in exporters:
+            if exporter.status == "running":
+                stats = exporter.stats()
+                print(f"{stats['dataset']}: {stats['rows']} rows, {stats['rowsPerSecond']:.0f} rows/s",
+                      file=sys.stderr)
+
+
+async def main_async(args) -> int:
+    import server as ashby_server
+
+    filters = dict(item.split("=", 1) for item in args.filter)
+    exporters = [
+        Exporter(ashby_server.export_pages, dataset, default_path(args.out, dataset, args.format),
+                 args.format, filters=filters, resume=not args.restart)
+        for dataset in args.datasets
+    ]
+    reporter = asyncio.ensure_future(_report(exporters, args.progress))
+    try:
+        results = await asyncio.gather(*(e.run() for e in exporters), return_exceptions=True)
+    finally:
+        reporter.cancel()
+        await ashby_server.get_ashby_client().aclose()
+
+    failed = 0
+    for exporter, result in zip(exporters, results):
+        stats = exporter.stats()
+        resumed = f", resumed at row {stats['resumedFromRow']}" if "resumedFromRow" in stats else ""
+        print(f"{stats['dataset']}: {stats['status']} - {stats['rows']} rows, {stats['bytes'] / 1e6:.1f} MB "
+              f"in {stats['seconds']:.1f}s ({stats['rowsPerSecond']:.0f} rows/s) -> {stats['path']}{resumed}")
+        if isinstance(result, BaseException):
+            failed += 1
+            print(f"  error: {result} - run the same command again to resume", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export Ashby records to NDJSON or Parquet")
+    parser.add_argument("datasets", nargs="+", choices=list(DATASETS), help="What to export; several run concurrently")
+    parser.add_argument("--format", choices=FORMATS, default="ndjson")
+    parser.add_argument("--out", default="exports", help="Output directory")
+    parser.add_argument("--filter", action="append", default=[], metavar="FIELD=VALUE",
+                        help="Filter passed to the list endpoint, e.g. status=Active")
+    parser.add_argument("--restart", action="store_true", help="Ignore checkpoints and start over")
+    parser.add_argument("--progress", type=float, default=5, help="Seconds between progress lines")
+    sys.exit(asyncio.run(main_async(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Local full-text index over candidate profiles and notes.
+
+Candidates and notes are indexed as they pass through the server (list,
+info and search responses, and notes written with candidate_add_note), so
+the index fills up with whatever has been looked at and stays current
+without a separate sync. Searches run against SQLite FTS5 and rank with
+BM25, weighting names above emails, tags and locations, and those above
+note text.
+"""
+
+import os
+import re
+import sqlite3
+import time
+from typing import Iterable, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    rowid INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    doc_id TEXT NOT NULL,
+    candidate_id TEXT NOT NULL,
+    indexed_at REAL NOT NULL,
+    UNIQUE (kind, doc_id)
+);
+CREATE INDEX IF NOT EXISTS documents_candidate ON documents (candidate_id);
+CREATE TABLE IF NOT EXISTS profiles (
+    candidate_id TEXT PRIMARY KEY,
+    name TEXT,
+    email TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5 (
+    name, emails, location, tags, body,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+# BM25 weights for name, emails, location, tags, body
+COLUMN_WEIGHTS = (10.0, 5.0, 2.0, 3.0, 1.0)
+
+# Profile and note hits fetched per candidate requested, before grouping
+HITS_PER_RESULT = 5
+
+_TAG = re.compile(r"<[^>]+>")
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+
+def _text(value: Optional[str]) -> str:
+    """Plain text from a value that may contain HTML markup."""
+    return _TAG.sub(" ", value or "")
+
+
+def _profile_columns(c: dict) -> tuple:
+    emails = {e.get("value") for e in c.get("emailAddresses") or [] if e.get("value")}
+    primary = (c.get("primaryEmailAddress") or {}).get("value")
+    if primary:
+        emails.add(primary)
+    location = c.get("location") or {}
+    places = [location.get("locationSummary")]
+    places += [part.get("name") for part in location.get("locationComponents") or []]
+    tags = [tag.get("title") for tag in c.get("tags") or []]
+    body = [c.get("position"), c.get("company"), c.get("school")]
+    return (
+        c.get("name") or "",
+        " ".join(sorted(emails)),
+        " ".join(p for p in places if p),
+        " ".join(t for t in tags if t),
+        " ".join(b for b in body if b),
+    )
+
+
+def match_expression(query: str) -> str:
+    """FTS5 query matching every word of `query`, the last one as a prefix.
+
+    Words are quoted, so punctuation and FTS5 operators in user input are
+    searched for literally rather than parsed.
+    """
+    terms = _TERM.findall(query)
+    if not terms:
+        raise ValueError("query has no searchable words")
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+class FullTextIndex:
+    """SQLite FTS5 index of candidate profiles and notes."""
+
+    def __init__(self, path: str):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+        self.last_query_ms = 0.0
+
+    def close(self) -> None:
+        self.db.close()
+
+    # -------------------------------------------------------------------------
+    # Indexing
+    # -------------------------------------------------------------------------
+
+    def _upsert(self, kind: str, doc_id: str, candidate_id: str, columns: tuple) -> None:
+        row = self.db.execute(
+            "SELECT rowid FROM documents WHERE kind = ? AND doc_id = ?", (kind, doc_id)
+        ).fetchone()
+        if row is None:
+            rowid = self.db.execute(
+                "INSERT INTO documents (kind, doc_id, candidate_id, indexed_at) VALUES (?, ?, ?, ?)",
+                (kind, doc_id, candidate_id, time.time()),
+            ).lastrowid
+        else:
+            rowid = row["rowid"]
+            self.db.execute("UPDATE documents SET indexed_at = ? WHERE rowid = ?", (time.time(), rowid))
+            self.db.execute("DELETE FROM documents_fts WHERE rowid = ?", (rowid,))
+        self.db.execute(
+            "INSERT INTO documents_fts (rowid, name, emails, location, tags, body) VALUES (?, ?, ?, ?, ?, ?)",
+            (rowid, *columns),
+        )
+
+    def add_candidates(self, candidates: Iterable[dict]) -> int:
+        """Index or re-index candidate profiles; returns how many were written."""
+        count = 0
+        with self.db:
+            for c in candidates:
+                if not c.get("id"):
+                    continue
+                columns = _profile_columns(c)
+                self._upsert("profile", c["id"], c["id"], columns)
+                self.db.execute(
+                    "INSERT OR REPLACE INTO profiles (candidate_id, name, email) VALUES (?, ?, ?)",
+                    (c["id"], c.get("name"), (c.get("primaryEmailAddress") or {}).get("value")),
+                )
+                count += 1
+        return count
+
+    def add_notes(self, candidate_id: str, notes: Iterable[dict]) -> int:
+        """Index or re-index notes on one candidate; returns how many were written."""
+        count = 0
+        with self.db:
+            for note in notes:
+                if not note.get("id"):
+                    continue
+                self._upsert("note", note["id"], candidate_id, ("", "", "", "", _text(note.get("content"))))
+                count += 1
+        return count
+
+    # -------------------------------------------------------------------------
+    # Search
+    # -------------------------------------------------------------------------
+
+    def search(self, query: str, kinds: Optional[list[str]] = None, limit: int = 20) -> list[dict]:
+        """Best-matching candidates for `query`, each with its matching documents.
+
+        A candidate's score is its best document's BM25 rank, negated so that
+        higher is better.
+        """
+        started = time.perf_counter()
+        weights = ", ".join(str(w) for w in COLUMN_WEIGHTS)
+        sql = f"""
+            SELECT d.kind, d.doc_id, d.candidate_id,
+                   bm25(documents_fts, {weights}) AS rank,
+                   snippet(documents_fts, -1, '[', ']', '...', 12) AS snippet
+            FROM documents_fts
+            JOIN documents d ON d.rowid = documents_fts.rowid
+            WHERE documents_fts MATCH ?
+        """
+        params: list = [match_expression(query)]
+        if kinds:
+            sql += f" AND d.kind IN ({', '.join('?' for _ in kinds)})"
+            params.extend(kinds)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit * HITS_PER_RESULT)
+
+        results: dict[str, dict] = {}
+        for hit in self.db.execute(sql, params):
+            result = results.get(hit["candidate_id"])
+            if result is None:
+                if len(results) >= limit:
+                    continue
+                result = results[hit["candidate_id"]] = {
+                    "candidateId": hit["candidate_id"],
+                    "score": round(-hit["rank"], 3),
+                    "matches": [],
+                }
+            match = {"kind": hit["kind"], "snippet": hit["snippet"]}
+            if hit["kind"] == "note":
+                match["noteId"] = hit["doc_id"]
+            result["matches"].append(match)
+
+        if results:
+            ids = list(results)
+            for row in self.db.execute(
+                f"SELECT candidate_id, name, email FROM profiles WHERE candidate_id IN ({', '.join('?' for _ in ids)})",
+                ids,
+            ):
+                results[row["candidate_id"]]["name"] = row["name"]
+                results[row["candidate_id"]]["email"] = row["email"]
+        self.last_query_ms = round((time.perf_counter() - started) * 1000, 2)
+        return list(results.values())
+
+    def stats(self) -> dict:
+        counts = {row["kind"]: row["n"] for row in
+                  self.db.execute("SELECT kind, COUNT(*) AS n FROM documents GROUP BY kind")}
+        return {"path": self.path, "profiles": counts.get("profile", 0), "notes": counts.get("note", 0)}
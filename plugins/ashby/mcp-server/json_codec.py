@@ -0,0 +1,76 @@
+"""
+Pluggable JSON encoding/decoding for the Ashby MCP server.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Select explicitly with ASHBY_JSON_CODEC=json|orjson (default:
+auto).
+"""
+
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class StdlibCodec:
+    """The standard library json module."""
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any, indent: bool = False) -> str:
+        if indent:
+            return json.dumps(obj, indent=2)
+        return json.dumps(obj, separators=(",", ":"))
+
+    def dumps_canonical(self, obj: Any) -> str:
+        """Compact, key-sorted encoding for use as a lookup key."""
+        return json.dumps(obj, sort_keys=True, separators=(",", ":"))
+
+
+class OrjsonCodec:
+    """orjson, falling back to the standard library for what it can't encode."""
+
+    name = "orjson"
+
+    def __init__(self):
+        self._fallback = StdlibCodec()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any, indent: bool = False) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits or non-string keys
+            return self._fallback.dumps(obj, indent)
+
+    def dumps_canonical(self, obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+        except TypeError:
+            return self._fallback.dumps_canonical(obj)
+
+
+def available_codecs() -> dict:
+    """Every codec usable in this environment, by name."""
+    codecs = {"json": StdlibCodec()}
+    if orjson is not None:
+        codecs["orjson"] = OrjsonCodec()
+    return codecs
+
+
+def get_codec(name: Optional[str] = None):
+    """Return the requested codec, or the fastest available one for "auto"."""
+    codecs = available_codecs()
+    if not name or name == "auto":
+        return codecs.get("orjson", codecs["json"])
+    if name not in codecs:
+        raise ValueError(f"JSON codec {name!r} is not available (have: {', '.join(codecs)})")
+    return codecs[name]
@@ -0,0 +1,145 @@
+"""
+In-process metrics for the Ashby MCP server.
+
+Latencies are kept two ways: cumulative Prometheus-style buckets (cheap,
+never reset) and a window of recent samples for exact p50/p95/p99.
+"""
+
+import os
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Optional
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    rank = max(int(round(fraction * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+class LatencyHistogram:
+    """Bucketed latency distribution plus a window of recent samples."""
+
+    def __init__(self, window: int = 1024):
+        self.bucket_counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.recent: deque[float] = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        self.bucket_counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.recent.append(seconds)
+
+    def summary(self) -> dict:
+        """Percentiles over the recent window, in milliseconds."""
+        ordered = sorted(self.recent)
+        return {
+            "count": self.count,
+            "p50": round(percentile(ordered, 0.50) * 1000, 2),
+            "p95": round(percentile(ordered, 0.95) * 1000, 2),
+            "p99": round(percentile(ordered, 0.99) * 1000, 2),
+            "max": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+        }
+
+
+class Metrics:
+    """Per-tool latency histograms and error counts."""
+
+    # Histogram families: total tool call, time waiting on Ashby, time serializing output
+    KINDS = ("tool", "upstream", "serialization")
+
+    def __init__(self):
+        self.started = time.time()
+        self.histograms: dict[tuple[str, str], LatencyHistogram] = {}
+        self.errors: dict[tuple[str, str], int] = {}
+
+    def observe(self, kind: str, tool: str, seconds: float) -> None:
+        histogram = self.histograms.get((kind, tool))
+        if histogram is None:
+            histogram = self.histograms[(kind, tool)] = LatencyHistogram()
+        histogram.observe(seconds)
+
+    def error(self, tool: str, status: str) -> None:
+        self.errors[(tool, status)] = self.errors.get((tool, status), 0) + 1
+
+    def histogram(self, kind: str, tool: str) -> Optional[LatencyHistogram]:
+        """The histogram for one tool, or None if it has no samples yet."""
+        return self.histograms.get((kind, tool))
+
+    def summary(self) -> dict:
+        tools: dict[str, dict] = {}
+        for (kind, tool), histogram in sorted(self.histograms.items()):
+            tools.setdefault(tool, {})[f"{kind}Ms"] = histogram.summary()
+        for (tool, status), count in sorted(self.errors.items()):
+            tools.setdefault(tool, {}).setdefault("errors", {})[status] = count
+        return tools
+
+    def errors_by_status(self) -> dict[str, int]:
+        totals: dict[str, int] = {}
+        for (_, status), count in self.errors.items():
+            totals[status] = totals.get(status, 0) + count
+        return totals
+
+
+def _labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    parts = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        parts.append(f'{key}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def render_prometheus(metrics: Metrics, counters: dict[str, tuple[str, dict]],
+                      gauges: dict[str, tuple[str, dict]], prefix: str = "ashby_mcp") -> str:
+    """Render metrics in the Prometheus text exposition format.
+
+    `counters` and `gauges` map a metric name to (help text, {label tuple: value})
+    where each label tuple is a tuple of (key, value) pairs.
+    """
+    lines = []
+    for kind in Metrics.KINDS:
+        name = f"{prefix}_{kind}_duration_seconds"
+        lines.append(f"# HELP {name} {kind.capitalize()} latency per tool")
+        lines.append(f"# TYPE {name} histogram")
+        for (histogram_kind, tool), histogram in sorted(metrics.histograms.items()):
+            if histogram_kind != kind:
+                continue
+            cumulative = 0
+            for bound, count in zip(BUCKETS, histogram.bucket_counts):
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels({'tool': tool, 'le': bound})} {cumulative}")
+            lines.append(f"{name}_bucket{_labels({'tool': tool, 'le': '+Inf'})} {histogram.count}")
+            lines.append(f"{name}_sum{_labels({'tool': tool})} {histogram.sum:.6f}")
+            lines.append(f"{name}_count{_labels({'tool': tool})} {histogram.count}")
+
+    name = f"{prefix}_tool_errors_total"
+    lines.append(f"# HELP {name} Failed tool calls by status")
+    lines.append(f"# TYPE {name} counter")
+    for (tool, status), count in sorted(metrics.errors.items()):
+        lines.append(f"{name}{_labels({'tool': tool, 'status': status})} {count}")
+
+    for metric_type, family in (("counter", counters), ("gauge", gauges)):
+        for metric, (help_text, samples) in family.items():
+            name = f"{prefix}_{metric}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in samples.items():
+                lines.append(f"{name}{_labels(dict(labels))} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(path: str, text: str) -> None:
+    """Atomically replace a node_exporter textfile-collector file."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
@@ -0,0 +1,375 @@
+"""
+Local SQLite mirror of Ashby candidates, jobs, applications and interview schedules.
+
+The mirror is filled from the Ashby list endpoints and kept current with
+Ashby's sync tokens: the last page of a full listing returns a syncToken,
+and passing it back on the next sync returns only records changed since.
+Incremental results only add and update rows, so records reported deleted
+are removed as they arrive, and a full listing (forced once the last one
+is older than full_sync_seconds) drops every row Ashby no longer returns.
+Archived records are listed and kept, so they can still be filtered on. Read-only queries (filters and joins) are answered locally in milliseconds.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+# (tool_name, arguments) -> Ashby response envelope
+FetchPage = Callable[[str, dict], Awaitable[dict]]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidates (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    email TEXT,
+    updated_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    title TEXT,
+    status TEXT,
+    department_id TEXT,
+    location_id TEXT,
+    updated_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS applications (
+    id TEXT PRIMARY KEY,
+    candidate_id TEXT,
+    job_id TEXT,
+    status TEXT,
+    stage_id TEXT,
+    stage_title TEXT,
+    source_id TEXT,
+    source_title TEXT,
+    updated_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS applications_job ON applications (job_id, stage_title);
+CREATE INDEX IF NOT EXISTS applications_candidate ON applications (candidate_id);
+CREATE TABLE IF NOT EXISTS interview_schedules (
+    id TEXT PRIMARY KEY,
+    application_id TEXT,
+    status TEXT,
+    start_time TEXT,
+    end_time TEXT,
+    updated_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS interview_schedules_application ON interview_schedules (application_id);
+CREATE INDEX IF NOT EXISTS interview_schedules_start ON interview_schedules (start_time);
+CREATE TABLE IF NOT EXISTS sync_state (
+    table_name TEXT PRIMARY KEY,
+    sync_token TEXT,
+    last_synced_at REAL,
+    last_full_sync_at REAL
+);
+"""
+
+
+def _candidate_row(c: dict) -> tuple:
+    email = (c.get("primaryEmailAddress") or {}).get("value")
+    return (c["id"], c.get("name"), email, c.get("updatedAt"), json.dumps(c))
+
+
+def _job_row(j: dict) -> tuple:
+    return (j["id"], j.get("title"), j.get("status"), j.get("departmentId"),
+            j.get("locationId"), j.get("updatedAt"), json.dumps(j))
+
+
+def _application_row(a: dict) -> tuple:
+    stage = a.get("currentInterviewStage") or {}
+    source = a.get("source") or {}
+    return (
+        a["id"],
+        a.get("candidateId") or (a.get("candidate") or {}).get("id"),
+        a.get("jobId") or (a.get("job") or {}).get("id"),
+        a.get("status"),
+        stage.get("id"),
+        stage.get("title"),
+        source.get("id"),
+        source.get("title"),
+        a.get("updatedAt"),
+        json.dumps(a),
+    )
+
+
+def _interview_schedule_row(s: dict) -> tuple:
+    events = s.get("interviewEvents") or []
+    starts = [e["startTime"] for e in events if e.get("startTime")]
+    ends = [e["endTime"] for e in events if e.get("endTime")]
+    return (
+        s["id"],
+        s.get("applicationId"),
+        s.get("status"),
+        min(starts) if starts else s.get("startTime"),
+        max(ends) if ends else s.get("endTime"),
+        s.get("updatedAt"),
+        json.dumps(s),
+    )
+
+
+def _removed(record: dict) -> bool:
+    """Whether a sync result reports the record as deleted."""
+    return bool(record.get("isDeleted") or record.get("deletedAt"))
+
+
+# table -> (list tool, columns, row builder)
+TABLES = {
+    "candidates": (
+        "candidate_list",
+        ("id", "name", "email", "updated_at", "data"),
+        _candidate_row,
+    ),
+    "jobs": (
+        "job_list",
+        ("id", "title", "status", "department_id", "location_id", "updated_at", "data"),
+        _job_row,
+    ),
+    "applications": (
+        "application_list",
+        ("id", "candidate_id", "job_id", "status", "stage_id", "stage_title",
+         "source_id", "source_title", "updated_at", "data"),
+        _application_row,
+    ),
+    "interview_schedules": (
+        "interview_schedule_list",
+        ("id", "application_id", "status", "start_time", "end_time", "updated_at", "data"),
+        _interview_schedule_row,
+    ),
+}
+
+# table -> extra list arguments; archived jobs are left out of job.list by default
+LIST_ARGUMENTS = {
+    "jobs": {"includeArchived": True},
+}
+
+
+class AshbyMirror:
+    """SQLite-backed copy of the core Ashby records."""
+
+    def __init__(self, path: str, full_sync_seconds: float = 86400.0):
+        self.path = path
+        self.full_sync_seconds = full_sync_seconds
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+        self.last_query_ms = 0.0
+
+    def close(self) -> None:
+        self.db.close()
+
+    # -------------------------------------------------------------------------
+    # Sync
+    # -------------------------------------------------------------------------
+
+    async def sync(self, fetch_page: FetchPage, table: str, full: bool = False) -> dict:
+        """Bring one table up to date; incremental when a sync token is stored.
+
+        A full listing runs when asked, when there is no token, or when the
+        last one is older than full_sync_seconds, and removes the rows Ashby
+        no longer returns.
+        """
+        tool_name, columns, build_row = TABLES[table]
+        state = self.db.execute(
+            "SELECT sync_token, last_full_sync_at FROM sync_state WHERE table_name = ?", (table,)
+        ).fetchone()
+        started = time.time()
+        if state is not None and self.full_sync_seconds > 0 and (
+                state["last_full_sync_at"] is None
+                or started - state["last_full_sync_at"] >= self.full_sync_seconds):
+            full = True
+        sync_token = None if full or state is None else state["sync_token"]
+
+        upserted, removed, sync_token, full = await self._pull(
+            fetch_page, table, tool_name, columns, build_row, sync_token)
+
+        with self.db:
+            self.db.execute(
+                """INSERT INTO sync_state (table_name, sync_token, last_synced_at, last_full_sync_at)
+                   VALUES (?, ?, ?, ?)
+                   ON CONFLICT (table_name) DO UPDATE SET
+                     sync_token = excluded.sync_token,
+                     last_synced_at = excluded.last_synced_at,
+                     last_full_sync_at = COALESCE(excluded.last_full_sync_at, last_full_sync_at)""",
+                (table, sync_token, started, started if full else None),
+            )
+        return {
+            "table": table,
+            "mode": "full" if full else "incremental",
+            "upserted": upserted,
+            "removed": removed,
+            "seconds": round(time.time() - started, 3),
+        }
+
+    async def _pull(self, fetch_page: FetchPage, table: str, tool_name: str, columns: tuple,
+                    build_row: Callable, sync_token: Optional[str]) -> tuple[int, int, Optional[str], bool]:
+        insert = (
+            f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})"
+        )
+        delete = f"DELETE FROM {table} WHERE id = ?"
+        upserted = removed = 0
+        # ids a full listing returned; anything else in the table is gone from Ashby
+        seen: set[str] = set()
+        cursor = None
+        while True:
+            arguments: dict[str, Any] = {**LIST_ARGUMENTS.get(table, {}), "limit": 100}
+            if cursor:
+                arguments["cursor"] = cursor
+            if sync_token:
+                arguments["syncToken"] = sync_token
+            response = await fetch_page(tool_name, arguments)
+
+            if not response.get("success"):
+                errors = response.get("errors") or []
+                if sync_token and any("sync_token_expired" in str(e) for e in errors):
+                    # Ashby expires old tokens; fall back to a full listing
+                    return await self._pull(fetch_page, table, tool_name, columns, build_row, None)
+                raise RuntimeError(f"{tool_name} failed during sync: {errors}")
+
+            records = response.get("results", [])
+            gone = [(record["id"],) for record in records if _removed(record)]
+            rows = [build_row(record) for record in records if not _removed(record)]
+            with self.db:
+                self.db.executemany(insert, rows)
+                removed += self.db.executemany(delete, gone).rowcount
+            upserted += len(rows)
+            if sync_token is None:
+                seen.update(row[0] for row in rows)
+
+            if not response.get("moreDataAvailable"):
+                if sync_token is None:
+                    stale = [(row["id"],) for row in self.db.execute(f"SELECT id FROM {table}")
+                             if row["id"] not in seen]
+                    with self.db:
+                        self.db.executemany(delete, stale)
+                    removed += len(stale)
+                return upserted, removed, response.get("syncToken"), sync_token is None
+            cursor = response.get("nextCursor")
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def freshness(self, tables: Optional[list[str]] = None) -> dict:
+        """Row count and age of the last sync for each table."""
+        now = time.time()
+        result = {}
+        for table in tables or TABLES:
+            state = self.db.execute(
+                "SELECT last_synced_at, last_full_sync_at, sync_token FROM sync_state WHERE table_name = ?",
+                (table,),
+            ).fetchone()
+            rows = self.db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            if state is None or state["last_synced_at"] is None:
+                result[table] = {"rows": rows, "lastSyncedAt": None, "ageSeconds": None}
+                continue
+            result[table] = {
+                "rows": rows,
+                "lastSyncedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(state["last_synced_at"])),
+                "ageSeconds": round(now - state["last_synced_at"]),
+                "incremental": state["sync_token"] is not None,
+            }
+        return result
+
+    def _select(self, sql: str, params: list, limit: int) -> list[dict]:
+        started = time.perf_counter()
+        rows = [dict(row) for row in self.db.execute(f"{sql} LIMIT ?", (*params, limit))]
+        self.last_query_ms = round((time.perf_counter() - started) * 1000, 2)
+        return rows
+
+    def candidates(self, name: Optional[str] = None, email: Optional[str] = None, limit: int = 100) -> list[dict]:
+        where, params = [], []
+        if name:
+            where.append("name LIKE ?")
+            params.append(f"%{name}%")
+        if email:
+            where.append("email LIKE ?")
+            params.append(f"%{email}%")
+        sql = "SELECT id, name, email, updated_at FROM candidates"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        return self._select(sql + " ORDER BY name", params, limit)
+
+    def jobs(self, title: Optional[str] = None, status: Optional[str] = None, limit: int = 100) -> list[dict]:
+        where, params = [], []
+        if title:
+            where.append("title LIKE ?")
+            params.append(f"%{title}%")
+        if status:
+            where.append("status = ?")
+            params.append(status)
+        sql = "SELECT id, title, status, department_id, location_id, updated_at FROM jobs"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        return self._select(sql + " ORDER BY title", params, limit)
+
+    def applications(self, job_id: Optional[str] = None, job_title: Optional[str] = None,
+                     stage: Optional[str] = None, status: Optional[str] = None,
+                     candidate_name: Optional[str] = None, limit: int = 100) -> list[dict]:
+        """Applications joined with their candidate and job."""
+        where, params = [], []
+        if job_id:
+            where.append("a.job_id = ?")
+            params.append(job_id)
+        if job_title:
+            where.append("j.title LIKE ?")
+            params.append(f"%{job_title}%")
+        if stage:
+            where.append("(a.stage_id = ? OR a.stage_title LIKE ?)")
+            params.extend([stage, f"%{stage}%"])
+        if status:
+            where.append("a.status = ?")
+            params.append(status)
+        if candidate_name:
+            where.append("c.name LIKE ?")
+            params.append(f"%{candidate_name}%")
+        sql = """
+            SELECT a.id AS application_id, a.status, a.stage_title, a.source_title, a.updated_at,
+                   c.id AS candidate_id, c.name AS candidate_name, c.email AS candidate_email,
+                   j.id AS job_id, j.title AS job_title
+            FROM applications a
+            LEFT JOIN candidates c ON c.id = a.candidate_id
+            LEFT JOIN jobs j ON j.id = a.job_id
+        """
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        return self._select(sql + " ORDER BY a.updated_at DESC", params, limit)
+
+    def interview_schedules(self, start_after: Optional[str] = None, start_before: Optional[str] = None,
+                            job_id: Optional[str] = None, candidate_id: Optional[str] = None,
+                            limit: int = 100) -> list[dict]:
+        """Interview schedules joined with their application, candidate and job."""
+        where, params = [], []
+        if start_after:
+            where.append("s.start_time >= ?")
+            params.append(start_after)
+        if start_before:
+            where.append("s.start_time < ?")
+            params.append(start_before)
+        if job_id:
+            where.append("a.job_id = ?")
+            params.append(job_id)
+        if candidate_id:
+            where.append("a.candidate_id = ?")
+            params.append(candidate_id)
+        sql = """
+            SELECT s.id AS interview_schedule_id, s.status, s.start_time, s.end_time,
+                   a.id AS application_id, a.stage_title,
+                   c.id AS candidate_id, c.name AS candidate_name,
+                   j.id AS job_id, j.title AS job_title
+            FROM interview_schedules s
+            LEFT JOIN applications a ON a.id = s.application_id
+            LEFT JOIN candidates c ON c.id = a.candidate_id
+            LEFT JOIN jobs j ON j.id = a.job_id
+        """
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        return self._select(sql + " ORDER BY s.start_time", params, limit)
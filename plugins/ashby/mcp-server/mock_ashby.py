@@ -0,0 +1,362 @@
+"""
+Mock Ashby API server for local benchmarking and load tests.
+
+Implements every endpoint the MCP server calls against a linked synthetic
+dataset (see synthetic.Dataset): list endpoints paginate with nextCursor and
+hand out sync tokens, info/search endpoints look records up, and writes
+update the dataset. Latency, jitter and HTTP errors can be injected. Run
+standalone or start it in a background thread or process:
+
+    python mock_ashby.py --port 8765 --latency 0.05 --size 2000 --error-rate 0.01
+"""
+
+import argparse
+import json
+import multiprocessing
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+
+import synthetic
+
+MAX_PAGE_SIZE = 100
+
+# List endpoint -> (record kind, request fields that filter on a record path)
+LIST_ENDPOINTS = {
+    "/candidate.list": ("candidate", {}),
+    "/job.list": ("job", {"status": "status"}),
+    "/application.list": ("application", {"jobId": "job.id", "candidateId": "candidate.id", "status": "status"}),
+    "/interview.list": ("interview", {}),
+    "/interviewSchedule.list": ("interview_schedule", {"applicationId": "applicationId"}),
+    "/user.list": ("user", {}),
+    "/department.list": ("department", {}),
+    "/location.list": ("location", {}),
+    "/offer.list": ("offer", {"applicationId": "applicationId"}),
+    "/interviewStage.list": ("interview_stage", {"interviewPlanId": "interviewPlanId"}),
+    "/source.list": ("source", {}),
+    "/candidateTag.list": ("candidate_tag", {}),
+    "/archiveReason.list": ("archive_reason", {}),
+    "/applicationFeedback.list": ("feedback", {"applicationId": "applicationId"}),
+    "/feedbackFormDefinition.list": ("feedback_form", {}),
+}
+
+# Info endpoint -> (record kind, id field in the request)
+INFO_ENDPOINTS = {
+    "/candidate.info": ("candidate", "candidateId"),
+    "/job.info": ("job", "jobId"),
+    "/application.info": ("application", "applicationId"),
+}
+
+# Search endpoint -> (record kind, request field -> record path matched case-insensitively)
+SEARCH_ENDPOINTS = {
+    "/candidate.search": ("candidate", {"name": "name", "email": "primaryEmailAddress.value"}),
+    "/job.search": ("job", {"title": "title", "status": "status", "departmentId": "departmentId",
+                            "locationId": "locationId"}),
+    "/user.search": ("user", {"email": "email", "name": "firstName"}),
+}
+
+CREATE_ENDPOINTS = {
+    "/candidate.create": "candidate",
+    "/job.create": "job",
+    "/application.create": "application",
+    "/interviewSchedule.create": "interview_schedule",
+    "/offer.create": "offer",
+}
+
+# Update endpoint -> (record kind, id field in the request)
+UPDATE_ENDPOINTS = {
+    "/candidate.update": ("candidate", "candidateId"),
+    "/job.setStatus": ("job", "jobId"),
+    "/application.update": ("application", "applicationId"),
+    "/application.change_source": ("application", "applicationId"),
+    "/interviewSchedule.update": ("interview_schedule", "interviewScheduleId"),
+}
+
+
+def _get_path(record: dict, path: str) -> Any:
+    for key in path.split("."):
+        record = record.get(key) if isinstance(record, dict) else None
+    return record
+
+
+class MockAshbyState:
+    """The dataset plus a change log for sync tokens, shared by handler threads."""
+
+    def __init__(self, size: int = 500, seed: int = 0):
+        self.dataset = synthetic.Dataset(size, seed)
+        self.lock = threading.Lock()
+        # Bumped on every write; sync tokens carry the version they were issued at
+        self.version = 0
+        self.changed_at: dict[str, int] = {}
+
+    def _touch(self, record: dict) -> dict:
+        self.version += 1
+        self.changed_at[record["id"]] = self.version
+        record["updatedAt"] = time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())
+        return record
+
+    def handle(self, path: str, body: dict) -> Optional[dict]:
+        """The Ashby response for one request, or None for an unknown endpoint."""
+        with self.lock:
+            if path in LIST_ENDPOINTS:
+                return self.list(path, body)
+            if path in INFO_ENDPOINTS:
+                kind, id_field = INFO_ENDPOINTS[path]
+                return self.lookup(kind, body.get(id_field))
+            if path in SEARCH_ENDPOINTS:
+                return self.search(path, body)
+            if path in CREATE_ENDPOINTS:
+                return self.create(CREATE_ENDPOINTS[path], body)
+            if path in UPDATE_ENDPOINTS:
+                kind, id_field = UPDATE_ENDPOINTS[path]
+                return self.update(kind, body.get(id_field), body)
+            if path == "/candidate.listNotes":
+                notes = self.dataset.notes_by_candidate.get(body.get("candidateId"), [])
+                return self.paginate(notes, body)
+            if path == "/candidate.createNote":
+                return self.create_note(body)
+            if path == "/candidate.addTag":
+                return self.add_tag(body)
+            if path == "/application.change_stage":
+                return self.change_stage(body)
+            if path == "/interviewSchedule.cancel":
+                return self.update("interview_schedule", body.get("interviewScheduleId"), {"status": "Cancelled"})
+        return None
+
+    def paginate(self, rows: list[dict], body: dict, sync_token: Optional[str] = None) -> dict:
+        cursor = body.get("cursor")
+        offset = int(cursor[1:]) if isinstance(cursor, str) and cursor.startswith("c") else 0
+        limit = min(int(body.get("limit") or MAX_PAGE_SIZE), MAX_PAGE_SIZE)
+        page = rows[offset:offset + limit]
+        more = offset + limit < len(rows)
+        response = {
+            "success": True,
+            "results": page,
+            "moreDataAvailable": more,
+            "nextCursor": f"c{offset + limit}" if more else None,
+        }
+        if not more and sync_token is not None:
+            response["syncToken"] = sync_token
+        return response
+
+    def list(self, path: str, body: dict) -> dict:
+        kind, filters = LIST_ENDPOINTS[path]
+        rows = self.dataset.kinds[kind]
+        for field, record_path in filters.items():
+            if body.get(field) is not None:
+                rows = [r for r in rows if _get_path(r, record_path) == body[field]]
+        # Like Ashby, job.list leaves archived jobs out unless asked for them
+        if path == "/job.list" and not body.get("includeArchived") and body.get("status") != "Archived":
+            rows = [r for r in rows if r.get("status") != "Archived"]
+        sync_token = body.get("syncToken")
+        if sync_token is not None:
+            if not (isinstance(sync_token, str) and sync_token.startswith("v") and sync_token[1:].isdigit()):
+                return {"success": False, "errors": ["sync_token_expired"]}
+            since = int(sync_token[1:])
+            rows = [r for r in rows if self.changed_at.get(r["id"], 0) > since]
+        return self.paginate(rows, body, sync_token=f"v{self.version}")
+
+    def lookup(self, kind: str, record_id: Any) -> dict:
+        record = self.dataset.by_id[kind].get(record_id)
+        if record is None:
+            return {"success": False, "errors": [f"{kind}_not_found"]}
+        return {"success": True, "results": record}
+
+    def search(self, path: str, body: dict) -> dict:
+        kind, fields = SEARCH_ENDPOINTS[path]
+        terms = {record_path: str(body[field]).lower() for field, record_path in fields.items() if body.get(field)}
+        if not terms:
+            return {"success": False, "errors": ["missing_search_terms"]}
+        rows = [
+            r for r in self.dataset.kinds[kind]
+            if all(term in str(_get_path(r, record_path) or "").lower() for record_path, term in terms.items())
+        ]
+        return {"success": True, "results": rows[:MAX_PAGE_SIZE]}
+
+    def create(self, kind: str, body: dict) -> dict:
+        rng = random.Random(f"{kind}:create:{self.version}")
+        record = {**synthetic.GENERATORS[kind](rng, len(self.dataset.kinds[kind])), **body}
+        if kind == "interview_schedule":
+            self.set_schedule_events(record, body)
+        self.dataset.kinds[kind].append(record)
+        self.dataset.by_id[kind][record["id"]] = record
+        return {"success": True, "results": self._touch(record)}
+
+    def update(self, kind: str, record_id: Any, body: dict) -> dict:
+        record = self.dataset.by_id[kind].get(record_id)
+        if record is None:
+            return {"success": False, "errors": [f"{kind}_not_found"]}
+        record.update({key: value for key, value in body.items() if not key.endswith("Id")})
+        if kind == "interview_schedule":
+            self.set_schedule_events(record, body)
+        return {"success": True, "results": self._touch(record)}
+
+    def set_schedule_events(self, record: dict, body: dict) -> None:
+        """Make a schedule's first event match the times and interviewers in a request."""
+        if not any(key in body for key in ("startTime", "endTime", "interviewerUserIds")):
+            return
+        event = (record.get("interviewEvents") or [{}])[0]
+        record["interviewEvents"] = [event]
+        for key in ("startTime", "endTime"):
+            if key in body:
+                event[key] = body[key]
+        if "interviewerUserIds" in body:
+            users = self.dataset.by_id["user"]
+            event["interviewers"] = [users.get(user_id, {"id": user_id}) for user_id in body["interviewerUserIds"]]
+
+    def create_note(self, body: dict) -> dict:
+        candidate_id = body.get("candidateId")
+        if candidate_id not in self.dataset.by_id["candidate"]:
+            return {"success": False, "errors": ["candidate_not_found"]}
+        rng = random.Random(f"note:create:{self.version}")
+        note = {**synthetic.note(rng, 0), "content": body.get("note", "")}
+        self.dataset.notes_by_candidate.setdefault(candidate_id, []).insert(0, note)
+        self._touch(self.dataset.by_id["candidate"][candidate_id])
+        return {"success": True, "results": note}
+
+    def add_tag(self, body: dict) -> dict:
+        candidate = self.dataset.by_id["candidate"].get(body.get("candidateId"))
+        tag = self.dataset.by_id["candidate_tag"].get(body.get("tagId"))
+        if candidate is None or tag is None:
+            return {"success": False, "errors": ["candidate_or_tag_not_found"]}
+        if tag not in candidate["tags"]:
+            candidate["tags"].append(tag)
+        return {"success": True, "results": self._touch(candidate)}
+
+    def change_stage(self, body: dict) -> dict:
+        application = self.dataset.by_id["application"].get(body.get("applicationId"))
+        stage = self.dataset.by_id["interview_stage"].get(body.get("interviewStageId"))
+        if application is None or stage is None:
+            return {"success": False, "errors": ["application_or_stage_not_found"]}
+        application["currentInterviewStage"] = dict(stage)
+        return {"success": True, "results": self._touch(application)}
+
+
+class MockAshbyHandler(BaseHTTPRequestHandler):
+    """Handles Ashby-style POST requests."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        mock = self.server
+
+        delay = mock.latency + (mock.rng.uniform(0, mock.jitter) if mock.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+
+        if mock.error_rate and mock.rng.random() < mock.error_rate:
+            status = mock.rng.choice(mock.error_statuses)
+            headers = {"Retry-After": "1"} if status == 429 else {}
+            self._send(status, {"success": False, "errors": [f"injected_{status}"]}, headers)
+            return
+
+        response = mock.state.handle(self.path, body)
+        if response is None:
+            self._send(404, {"success": False, "errors": [f"unknown_endpoint {self.path}"]})
+        else:
+            self._send(200, response)
+
+    def _send(self, status: int, document: dict, headers: Optional[dict] = None) -> None:
+        payload = json.dumps(document).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockAshbyServer(ThreadingHTTPServer):
+    """Threaded HTTP server carrying the mock configuration."""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, size: int = 500,
+                 seed: int = 0, jitter: float = 0.0, error_rate: float = 0.0, error_statuses: tuple = (429, 500, 503)):
+        super().__init__((host, port), MockAshbyHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.rng = random.Random(seed)
+        self.state = MockAshbyState(size, seed)
+
+    def handle_error(self, request, client_address):
+        # Clients that hit their own timeout hang up mid-response; that's expected
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_in_thread(host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, **options) -> MockAshbyServer:
+    """Start a mock server on a daemon thread and return it (call shutdown() to stop)."""
+    mock = MockAshbyServer(host, port, latency, **options)
+    thread = threading.Thread(target=mock.serve_forever, daemon=True)
+    thread.start()
+    return mock
+
+
+def _serve(host: str, port: int, latency: float, options: dict, ready) -> None:
+    mock = MockAshbyServer(host, port, latency, **options)
+    ready.send(mock.base_url)
+    ready.close()
+    mock.serve_forever()
+
+
+def start_in_process(host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                     **options) -> tuple[multiprocessing.Process, str]:
+    """Start a mock server in a child process so it doesn't share the caller's GIL.
+
+    Returns the process (call terminate() to stop) and the server's base URL.
+    Keyword options are passed to MockAshbyServer.
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_serve, args=(host, port, latency, options, sender), daemon=True)
+    process.start()
+    base_url = receiver.recv()
+    receiver.close()
+    return process, base_url
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="Run a mock Ashby API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds to wait before responding")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random delay of up to this many seconds")
+    parser.add_argument("--size", type=int, default=500, help="Candidates in the dataset (other kinds scale from it)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with an error")
+    parser.add_argument("--error-statuses", type=int, nargs="+", default=[429, 500, 503],
+                        help="HTTP statuses to pick injected errors from")
+    args = parser.parse_args(argv)
+
+    mock = MockAshbyServer(args.host, args.port, args.latency, size=args.size, seed=args.seed, jitter=args.jitter,
+                           error_rate=args.error_rate, error_statuses=args.error_statuses)
+    print(f"Mock Ashby API listening on {mock.base_url} ({args.size} candidates)")
+    try:
+        mock.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        mock.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Circuit breakers and request hedging for the Ashby client.
+
+Breakers are kept per endpoint family (the part of the endpoint before the
+dot, e.g. "candidate" for /candidate.info). After `threshold` consecutive
+upstream failures a family's breaker opens and calls fail immediately for
+`reset_seconds`; then a single trial call is let through, which closes it
+again on success.
+
+Hedging sends a second copy of a slow idempotent request once it has taken
+longer than the endpoint's recent p95, and uses whichever answers first.
+"""
+
+import time
+from collections import deque
+from typing import Optional
+
+from metrics import percentile
+
+
+def endpoint_family(endpoint: str) -> str:
+    return endpoint.lstrip("/").split(".", 1)[0]
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint family whose breaker is open."""
+
+    def __init__(self, family: str, retry_after: float):
+        super().__init__(f"circuit open for {family} endpoints")
+        self.family = family
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker: closed -> open -> half-open -> closed."""
+
+    def __init__(self, family: str, threshold: int = 5, reset_seconds: float = 30.0):
+        self.family = family
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.opened = 0
+        self.rejected = 0
+
+    def check(self) -> bool:
+        """Raise CircuitOpenError unless a call may go ahead.
+
+        Returns True when the call is the half-open trial, whose outcome
+        decides whether the breaker closes.
+        """
+        if self.state == "closed":
+            return False
+        now = time.monotonic()
+        retry_after = self.opened_at + self.reset_seconds - now
+        if retry_after > 0:
+            self.rejected += 1
+            raise CircuitOpenError(self.family, retry_after)
+        # Let one trial call through; if it never reports back, another is
+        # allowed after the next reset period
+        self.state = "half_open"
+        self.opened_at = now
+        return True
+
+    def release_trial(self) -> None:
+        """Free the half-open trial slot of a call that ended without a result.
+
+        A cancelled trial (a losing hedge, a caller's deadline) says nothing
+        about the upstream, so the next call may try straight away instead
+        of being rejected for another reset period.
+        """
+        if self.state == "half_open":
+            self.opened_at = time.monotonic() - self.reset_seconds
+
+    def record_success(self) -> None:
+        self.state = "closed"
+        self.consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        if self.state == "half_open" or self.consecutive_failures >= self.threshold:
+            if self.state != "open":
+                self.opened += 1
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> dict:
+        stats = {
+            "state": self.state,
+            "consecutiveFailures": self.consecutive_failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+        if self.state != "closed":
+            stats["retryInSeconds"] = round(max(self.opened_at + self.reset_seconds - time.monotonic(), 0.0), 1)
+        return stats
+
+
+class HedgePolicy:
+    """Decides when to send a backup request, from recent latency per endpoint.
+
+    The hedge delay is the endpoint's p95 over its last `window` successful
+    responses (recomputed every 16 samples), never below `min_delay`. No
+    hedging happens until an endpoint has `min_samples` observations, and
+    hedges are capped at `budget` (a fraction) of all hedgeable requests.
+    """
+
+    def __init__(self, enabled: bool = True, min_delay: float = 0.05, budget: float = 0.1,
+                 window: int = 256, min_samples: int = 20):
+        self.enabled = enabled
+        self.min_delay = min_delay
+        self.budget = budget
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: dict[str, deque] = {}
+        self._delays: dict[str, float] = {}
+        self._since_update: dict[str, int] = {}
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.over_budget = 0
+
+    def observe(self, endpoint: str, seconds: float) -> None:
+        samples = self._samples.get(endpoint)
+        if samples is None:
+            samples = self._samples[endpoint] = deque(maxlen=self.window)
+        samples.append(seconds)
+        count = self._since_update.get(endpoint, 0) + 1
+        if len(samples) >= self.min_samples and (count >= 16 or endpoint not in self._delays):
+            self._delays[endpoint] = max(percentile(sorted(samples), 0.95), self.min_delay)
+            count = 0
+        self._since_update[endpoint] = count
+
+    def delay(self, endpoint: str) -> Optional[float]:
+        """Seconds to wait before hedging a request, or None to not hedge it."""
+        if not self.enabled:
+            return None
+        self.requests += 1
+        return self._delays.get(endpoint)
+
+    def allow(self) -> bool:
+        """Whether a hedge fits in the budget; counts it if so."""
+        if self.hedged >= self.budget * self.requests:
+            self.over_budget += 1
+            return False
+        self.hedged += 1
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedgeWins": self.hedge_wins,
+            "overBudget": self.over_budget,
+            "delayMs": {endpoint: round(delay * 1000, 1) for endpoint, delay in sorted(self._delays.items())},
+        }
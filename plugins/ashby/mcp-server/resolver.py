@@ -0,0 +1,202 @@
+"""
+Name-to-ID resolution for Ashby reference records.
+
+Write tools need opaque IDs for users, departments, locations, stages and so
+on. NameResolver keeps an in-memory index of each kind's names, loaded on
+first use and refreshed in the background once it is older than `max_age`,
+so a human-readable name can be turned into an ID without a round trip.
+Kinds whose names are only unique within a parent, such as the stages of
+one interview plan, are indexed per scope.
+
+Matching is tried in order: the exact name (ignoring case, accents and
+punctuation), then names that start with or contain every word of the
+query, then close spellings. A query that matches several records equally
+well is rejected with the options rather than guessed, and callers that
+must not guess at all (writes) can ask for exact matches only.
+"""
+
+import asyncio
+import difflib
+import re
+import time
+import unicodedata
+from typing import Awaitable, Callable, Optional
+
+# (kind, scope) -> records of that kind within the scope (None for unscoped kinds)
+Loader = Callable[[str, Optional[str]], Awaitable[list[dict]]]
+
+# Lowest similarity (0-1) accepted for a misspelled name
+FUZZY_CUTOFF = 0.75
+# A fuzzy match must beat the runner-up by this much to be chosen
+FUZZY_MARGIN = 0.05
+# Options listed in an ambiguity error
+MAX_OPTIONS = 5
+
+_UUID = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE)
+
+
+def looks_like_id(value: str) -> bool:
+    return bool(_UUID.match(value))
+
+
+def normalize(name: str) -> str:
+    """Lowercase, accents removed and punctuation collapsed to single spaces."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(re.findall(r"\w+", stripped.lower()))
+
+
+class NameResolutionError(ValueError):
+    """A name that matches no record, or several equally well."""
+
+
+class NameIndex:
+    """Names of one kind of record, each pointing at an ID."""
+
+    def __init__(self, kind: str, records: list[dict], names: Callable[[dict], list[str]],
+                 label: Callable[[dict], str]):
+        self.kind = kind
+        self.loaded_at = time.monotonic()
+        self.labels: dict[str, str] = {}
+        # normalized name -> ids
+        self.exact: dict[str, set[str]] = {}
+        for record in records:
+            record_id = record.get("id")
+            if not record_id:
+                continue
+            self.labels[record_id] = label(record)
+            for name in names(record):
+                if name:
+                    self.exact.setdefault(normalize(name), set()).add(record_id)
+        self._keys = list(self.exact)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def candidates(self, query: str) -> tuple[set[str], str]:
+        """IDs matching `query` at the best matching level, and that level's name."""
+        key = normalize(query)
+        if key in self.exact:
+            return self.exact[key], "exact"
+
+        words = key.split()
+        partial = set()
+        for name in self._keys:
+            if name.startswith(key) or all(word in name.split() for word in words):
+                partial |= self.exact[name]
+        if partial:
+            return partial, "partial"
+
+        scored = sorted(
+            ((difflib.SequenceMatcher(None, key, name).ratio(), name) for name in self._keys),
+            reverse=True,
+        )
+        scored = [(score, name) for score, name in scored if score >= FUZZY_CUTOFF]
+        if not scored:
+            return set(), "none"
+        best = scored[0][0]
+        close = set()
+        for score, name in scored:
+            if best - score > FUZZY_MARGIN:
+                break
+            close |= self.exact[name]
+        return close, "fuzzy"
+
+    def suggestions(self, query: str) -> list[str]:
+        key = normalize(query)
+        return difflib.get_close_matches(key, self._keys, n=MAX_OPTIONS, cutoff=0.5)
+
+
+class NameResolver:
+    """Lazily loaded, periodically refreshed NameIndex per kind and scope."""
+
+    def __init__(self, load: Loader, kinds: dict[str, tuple[Callable[[dict], list[str]], Callable[[dict], str]]],
+                 max_age: float = 900.0, miss_refresh_interval: float = 30.0):
+        self.load = load
+        self.kinds = kinds
+        self.max_age = max_age
+        self.miss_refresh_interval = miss_refresh_interval
+        self._indexes: dict[tuple[str, Optional[str]], NameIndex] = {}
+        self._loading: dict[tuple[str, Optional[str]], asyncio.Task] = {}
+        self.resolved = 0
+        self.refreshes = 0
+
+    async def _refresh(self, key: tuple[str, Optional[str]]) -> NameIndex:
+        task = self._loading.get(key)
+        if task is None:
+            task = self._loading[key] = asyncio.ensure_future(self._build(key))
+            task.add_done_callback(lambda _: self._loading.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _build(self, key: tuple[str, Optional[str]]) -> NameIndex:
+        kind, scope = key
+        names, label = self.kinds[kind]
+        records = await self.load(kind, scope)
+        index = self._indexes[key] = NameIndex(kind, records, names, label)
+        self.refreshes += 1
+        return index
+
+    async def index(self, kind: str, scope: Optional[str] = None) -> NameIndex:
+        """The index of a kind (within `scope`), loading only it on first use.
+
+        A stale index is served as is while a refresh runs in the background.
+        """
+        key = (kind, scope)
+        index = self._indexes.get(key)
+        if index is None:
+            return await self._refresh(key)
+        if time.monotonic() - index.loaded_at > self.max_age and key not in self._loading:
+            self._refresh_in_background(key)
+        return index
+
+    def _refresh_in_background(self, key: tuple[str, Optional[str]]) -> None:
+        async def refresh():
+            try:
+                await self._refresh(key)
+            except Exception:
+                # Keep serving the old index; the next lookup tries again
+                pass
+        asyncio.ensure_future(refresh())
+
+    async def resolve(self, kind: str, value: str, scope: Optional[str] = None, exact: bool = False) -> str:
+        """The ID for `value`, which may already be an ID or a name.
+
+        With `exact`, only a name matching in full (ignoring case, accents
+        and punctuation) is accepted; prefixes and misspellings are rejected
+        with suggestions.
+        """
+        if looks_like_id(value):
+            return value
+        index = await self.index(kind, scope)
+        ids, level = index.candidates(value)
+        if not ids and time.monotonic() - index.loaded_at > self.miss_refresh_interval:
+            # The record may have been created since the index was loaded
+            index = await self._refresh((kind, scope))
+            ids, level = index.candidates(value)
+
+        label = kind.replace("_", " ")
+        if exact and ids and level != "exact":
+            options = ", ".join(f"{index.labels[i]!r} ({i})" for i in sorted(ids, key=index.labels.get)[:MAX_OPTIONS])
+            raise NameResolutionError(f"no {label} is named exactly {value!r} - did you mean {options}? "
+                                      "Writes need the full name or the ID")
+        if len(ids) == 1:
+            self.resolved += 1
+            return next(iter(ids))
+        if not ids:
+            suggestions = index.suggestions(value)
+            hint = f" - did you mean {', '.join(repr(s) for s in suggestions)}?" if suggestions else ""
+            raise NameResolutionError(f"no {label} named {value!r}{hint}")
+        options = ", ".join(f"{index.labels[i]} ({i})" for i in sorted(ids, key=index.labels.get)[:MAX_OPTIONS])
+        more = f" and {len(ids) - MAX_OPTIONS} more" if len(ids) > MAX_OPTIONS else ""
+        raise NameResolutionError(f"{value!r} matches several {label}s ({level} match): {options}{more} - pass the ID")
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        return {
+            "resolved": self.resolved,
+            "refreshes": self.refreshes,
+            "kinds": {
+                f"{kind}:{scope}" if scope else kind: {"records": len(index), "ageSeconds": round(now - index.loaded_at)}
+                for (kind, scope), index in sorted(self._indexes.items(), key=lambda item: (item[0][0], item[0][1] or ""))
+            },
+        }
@@ -0,0 +1,214 @@
+"""
+In-memory calendar of scheduled interviews per interviewer.
+
+Each interviewer's interviews are kept sorted by start time next to a
+running maximum duration, so everything overlapping a time range lies
+between two binary searches: starts after `range_start - max_duration` and
+before `range_end`. Conflict checks and free-slot searches therefore cost
+O(log n + k) for n indexed interviews and k hits, without scanning a
+calendar.
+
+The calendar is fed from interview_schedule_list responses and from the
+schedule create/update/cancel calls the server makes, so it only knows
+about interviews it has seen. Time ranges that a complete, unfiltered
+listing covered are remembered with when they were listed; filtered
+listings (one application's schedules, say) add interviews but say nothing
+about whether a range is complete.
+"""
+
+import time
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+# (interviewer user id, start, end) with times as epoch seconds
+Interval = tuple[str, float, float]
+
+# Listed ranges remembered; the oldest are forgotten first
+MAX_LISTED_WINDOWS = 64
+
+
+def parse_time(value: str) -> float:
+    """Epoch seconds from an ISO 8601 timestamp; naive times are taken as UTC."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def format_time(seconds: float) -> str:
+    return datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def schedule_intervals(schedule: dict) -> list[Interval]:
+    """Interviewer intervals of an Ashby interview schedule record."""
+    intervals = []
+    for event in schedule.get("interviewEvents") or []:
+        if not event.get("startTime") or not event.get("endTime"):
+            continue
+        start, end = parse_time(event["startTime"]), parse_time(event["endTime"])
+        for interviewer in event.get("interviewers") or []:
+            if interviewer.get("id"):
+                intervals.append((interviewer["id"], start, end))
+    return intervals
+
+
+class _InterviewerCalendar:
+    """One interviewer's interviews, sorted by start."""
+
+    __slots__ = ("starts", "entries", "max_duration")
+
+    def __init__(self):
+        self.starts: list[float] = []
+        # (start, end, schedule id), parallel to starts
+        self.entries: list[tuple[float, float, str]] = []
+        self.max_duration = 0.0
+
+    def add(self, start: float, end: float, schedule_id: str) -> None:
+        entry = (start, end, schedule_id)
+        index = bisect_left(self.entries, entry)
+        self.entries.insert(index, entry)
+        self.starts.insert(index, start)
+        self.max_duration = max(self.max_duration, end - start)
+
+    def remove(self, start: float, end: float, schedule_id: str) -> None:
+        entry = (start, end, schedule_id)
+        index = bisect_left(self.entries, entry)
+        if index < len(self.entries) and self.entries[index] == entry:
+            del self.entries[index]
+            del self.starts[index]
+
+    def overlapping(self, start: float, end: float) -> list[tuple[float, float, str]]:
+        low = bisect_left(self.starts, start - self.max_duration)
+        high = bisect_left(self.starts, end)
+        return [entry for entry in self.entries[low:high] if entry[1] > start]
+
+
+class InterviewCalendar:
+    """Scheduled interviews indexed by interviewer."""
+
+    def __init__(self):
+        self._calendars: dict[str, _InterviewerCalendar] = {}
+        self._schedules: dict[str, list[Interval]] = {}
+        # (start, end, listed at) of ranges a complete listing covered, oldest first
+        self._listed: list[tuple[float, float, float]] = []
+
+    def put(self, schedule_id: str, intervals: Iterable[Interval]) -> None:
+        """Replace everything indexed for a schedule."""
+        self.remove(schedule_id)
+        intervals = [i for i in intervals if i[2] > i[1]]
+        if not intervals:
+            return
+        self._schedules[schedule_id] = intervals
+        for interviewer, start, end in intervals:
+            calendar = self._calendars.get(interviewer)
+            if calendar is None:
+                calendar = self._calendars[interviewer] = _InterviewerCalendar()
+            calendar.add(start, end, schedule_id)
+
+    def remove(self, schedule_id: str) -> None:
+        for interviewer, start, end in self._schedules.pop(schedule_id, []):
+            self._calendars[interviewer].remove(start, end, schedule_id)
+
+    def intervals(self, schedule_id: str) -> list[Interval]:
+        return list(self._schedules.get(schedule_id, []))
+
+    def add_schedules(self, schedules: Iterable[dict]) -> None:
+        """Index schedule records from an interview_schedule_list page."""
+        for schedule in schedules:
+            if not schedule.get("id"):
+                continue
+            if schedule.get("status") == "Cancelled":
+                self.remove(schedule["id"])
+            else:
+                self.put(schedule["id"], schedule_intervals(schedule))
+
+    def mark_listed(self, start: float, end: float) -> None:
+        """Record that every interview overlapping [start, end) has just been listed."""
+        self._listed = [w for w in self._listed if not (start <= w[0] and w[1] <= end)]
+        self._listed.append((start, end, time.time()))
+        del self._listed[:-MAX_LISTED_WINDOWS]
+
+    def listed_at(self, start: float, end: float) -> Optional[float]:
+        """When [start, end) was last covered by one complete listing, if ever."""
+        times = [at for listed_start, listed_end, at in self._listed if listed_start <= start and end <= listed_end]
+        return max(times) if times else None
+
+    def conflicts(self, interviewer_ids: Iterable[str], start: float, end: float,
+                  exclude: Optional[str] = None) -> list[dict]:
+        """Indexed interviews that overlap [start, end) for any of the interviewers."""
+        found = []
+        for interviewer in interviewer_ids:
+            calendar = self._calendars.get(interviewer)
+            if calendar is None:
+                continue
+            for busy_start, busy_end, schedule_id in calendar.overlapping(start, end):
+                if schedule_id != exclude:
+                    found.append({
+                        "interviewerUserId": interviewer,
+                        "interviewScheduleId": schedule_id,
+                        "startTime": format_time(busy_start),
+                        "endTime": format_time(busy_end),
+                    })
+        return found
+
+    def busy(self, interviewer_ids: Iterable[str], start: float, end: float) -> list[tuple[float, float]]:
+        """Merged busy periods of the interviewers within [start, end)."""
+        periods = sorted(
+            (busy_start, busy_end)
+            for interviewer in interviewer_ids
+            if interviewer in self._calendars
+            for busy_start, busy_end, _ in self._calendars[interviewer].overlapping(start, end)
+        )
+        merged: list[tuple[float, float]] = []
+        for busy_start, busy_end in periods:
+            if merged and busy_start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], busy_end))
+            else:
+                merged.append((busy_start, busy_end))
+        return merged
+
+    def free_slots(self, interviewer_ids: list[str], start: float, end: float, duration: float,
+                   step: float = 900, limit: int = 10, working_hours: Optional[tuple[int, int]] = None,
+                   weekdays_only: bool = False) -> list[dict]:
+        """Slots of `duration` seconds in [start, end) when every interviewer is free.
+
+        Slots start on multiples of `step` seconds. `working_hours` is a pair
+        of UTC minutes-after-midnight that each slot must fall within.
+        """
+        slots = []
+        busy = self.busy(interviewer_ids, start, end)
+        busy_index = 0
+        candidate = -(-start // step) * step
+        while candidate + duration <= end and len(slots) < limit:
+            slot_end = candidate + duration
+            day = datetime.fromtimestamp(candidate, timezone.utc)
+            midnight = day.replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+            if weekdays_only and day.weekday() >= 5:
+                candidate = midnight + timedelta(days=7 - day.weekday()).total_seconds()
+                candidate = -(-candidate // step) * step
+                continue
+            if working_hours:
+                day_start, day_end = midnight + working_hours[0] * 60, midnight + working_hours[1] * 60
+                if candidate < day_start:
+                    candidate = -(-day_start // step) * step
+                    continue
+                if slot_end > day_end:
+                    candidate = -(-(midnight + 86400 + working_hours[0] * 60) // step) * step
+                    continue
+            while busy_index < len(busy) and busy[busy_index][1] <= candidate:
+                busy_index += 1
+            if busy_index < len(busy) and busy[busy_index][0] < slot_end:
+                candidate = -(-busy[busy_index][1] // step) * step
+                continue
+            slots.append({"startTime": format_time(candidate), "endTime": format_time(slot_end)})
+            candidate = slot_end
+        return slots
+
+    def stats(self) -> dict:
+        return {
+            "schedules": len(self._schedules),
+            "interviewers": len(self._calendars),
+            "interviews": sum(len(c.entries) for c in self._calendars.values()),
+            "listedWindows": len(self._listed),
+        }
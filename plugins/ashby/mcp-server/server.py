@@ -1,35 +1,211 @@
 # /// script
 # dependencies = [
-#   "mcp>=1.0.0",
-#   "requests>=2.31.0",
+#   "mcp>=1.25.0",
+#   "httpx>=0.27.0",
 #   "python-dotenv>=1.0.0"
 # ]
 # ///
 """
 Ashby MCP Server - Comprehensive ATS integration for Claude Code
 
-Provides 34 core tools for managing:
+Provides 55 tools for managing:
 - Candidates: create, search, list, update, notes, tags, resumes
 - Jobs: create, search, list, update, status
 - Applications: create, list, update, stage changes, source tracking
-- Interviews: schedules, lists, updates, cancellations
+- Interviews: schedules, lists, updates, cancellations, free slots
 - Feedback: list feedback, review forms
 - Organization: users, departments, locations
 - Offers: create, list
+- Reference data: interview stages, sources, tags, archive reasons
+- Composite reads: batch, candidate dossier, pipeline snapshot
+- Bulk writes: stage changes, tags, notes, job status
+- Local mirror: sync and query a SQLite copy of candidates, jobs,
+  applications and interview schedules
+- Full-text search of candidate profiles and notes
+- Export: background NDJSON/Parquet export with status
+- Large results and diagnostics: result_read, server_stats
 """
 
 import asyncio
 import json
 import base64
-from typing import Any, Optional
+import difflib
+import hmac
+import ipaddress
+import time
+from collections import OrderedDict
+from contextlib import aclosing, asynccontextmanager
+from functools import partial
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+from urllib.parse import parse_qs, urlsplit
+import math
 import os
+import sys
 from dotenv import load_dotenv
-import requests
+import httpx
+
+from json_codec import get_codec
+from metrics import Metrics, render_prometheus, write_textfile
+from resilience import CircuitBreaker, CircuitOpenError, HedgePolicy, endpoint_family
+from spill import SpillStore
+from validation import ArgumentError, compile_tools
 
 import mcp.types as types
 from mcp.server import Server
+from mcp.server.lowlevel.helper_types import ReadResourceContents
 import mcp.server.stdio
 
+if TYPE_CHECKING:
+    # Rarely used features are imported by their getters on first use
+    from fulltext import FullTextIndex
+    from export import Exporter
+    from mirror import AshbyMirror
+    from resolver import NameResolver
+    from schedule_index import InterviewCalendar
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a numeric setting from the environment."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number, not {value!r}") from None
+
+
+def _parse_deadlines(name: str, tools: Iterable[str]) -> dict[str, float]:
+    """Parse the "tool_name=seconds,tool_name=seconds" setting `name` into a dict."""
+    known = set(tools)
+    deadlines = {}
+    for item in os.getenv(name, '').split(","):
+        if not item.strip():
+            continue
+        tool_name, _, seconds = (part.strip() for part in item.partition("="))
+        try:
+            deadline = float(seconds)
+        except ValueError:
+            raise ValueError(f"{name} entries must look like tool_name=seconds, not {item.strip()!r}") from None
+        if tool_name not in known:
+            close = difflib.get_close_matches(tool_name, known, n=1)
+            hint = f" - did you mean {close[0]!r}?" if close else ""
+            raise ValueError(f"{name} names unknown tool {tool_name!r}{hint}")
+        if deadline <= 0:
+            raise ValueError(f"{name} deadline for {tool_name} must be positive, not {seconds!r}")
+        deadlines[tool_name] = deadline
+    return deadlines
+
+
+def _retry_after_seconds(response: httpx.Response, default: float = 1.0) -> float:
+    """Parse a Retry-After header given either as seconds or as an HTTP date."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return default
+
+
+def _is_upstream_failure(e: Exception) -> bool:
+    """Whether an error means Ashby is unhealthy (as opposed to a bad request)."""
+    if isinstance(e, httpx.HTTPStatusError):
+        return e.response.status_code >= 500
+    return isinstance(e, (httpx.TransportError, asyncio.TimeoutError))
+
+
+class RateLimiter:
+    """Token bucket whose refill rate adapts to Ashby's 429s (AIMD).
+
+    Every throttle halves the rate (down to a tenth of the configured limit)
+    and pauses the bucket for Retry-After; every success adds back 2% of the
+    configured limit.
+    """
+
+    def __init__(self, requests_per_minute: float = 100, burst: int = 10):
+        self.max_rate = requests_per_minute / 60
+        self.min_rate = self.max_rate / 10
+        self.rate = self.max_rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.paused_until = 0.0
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.acquired = 0
+        self.throttled = 0
+        self.waiting = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Wait for a token; returns the seconds spent waiting."""
+        started = time.monotonic()
+        self.waiting += 1
+        try:
+            # The lock keeps waiters first-come, first-served
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    if now < self.paused_until:
+                        await asyncio.sleep(self.paused_until - now)
+                    elif self.tokens >= 1:
+                        self.tokens -= 1
+                        break
+                    else:
+                        await asyncio.sleep((1 - self.tokens) / self.rate)
+        finally:
+            self.waiting -= 1
+        waited = time.monotonic() - started
+        self.acquired += 1
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        return waited
+
+    def try_acquire(self) -> bool:
+        """Take a token only if one is free right now and nobody is queued."""
+        now = time.monotonic()
+        self._refill(now)
+        if self.waiting or now < self.paused_until or self.tokens < 1:
+            return False
+        self.tokens -= 1
+        self.acquired += 1
+        return True
+
+    def on_success(self) -> None:
+        self.rate = min(self.max_rate, self.rate + self.max_rate * 0.02)
+
+    def on_throttle(self, retry_after: float) -> None:
+        now = time.monotonic()
+        self._refill(now)
+        self.throttled += 1
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.tokens = 0.0
+        self.paused_until = max(self.paused_until, now + retry_after)
+
+    def stats(self) -> dict:
+        return {
+            "ratePerMinute": round(self.rate * 60, 1),
+            "maxRatePerMinute": round(self.max_rate * 60, 1),
+            "tokens": round(self.tokens, 2),
+            "pausedForSeconds": round(max(self.paused_until - time.monotonic(), 0.0), 2),
+            "waiting": self.waiting,
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "waitSecondsTotal": round(self.wait_seconds_total, 3),
+            "waitSecondsMax": round(self.wait_seconds_max, 3),
+        }
+
 
 class AshbyClient:
     """Handles Ashby API operations."""
@@ -38,38 +214,332 @@ class AshbyClient:
         self.api_key: Optional[str] = None
         self.base_url = "https://api.ashbyhq.com"
         self.headers = {}
+        self.limits = httpx.Limits()
+        self.timeout = httpx.Timeout(None)
+        self.endpoint_deadlines: dict[str, float] = {}
+        self.rate_limiter = RateLimiter()
+        self.max_retries = 3
+        self.retry_queue_size = 16
+        self.retries_pending = 0
+        self.retries = 0
+        self.retries_rejected = 0
+        self.transport_mode = "live"
+        self.cassette_path: Optional[str] = None
+        self.replay_speed: Optional[float] = None
+        self.hedging = HedgePolicy(enabled=False)
+        self.breaker_threshold = 5
+        self.breaker_reset = 30.0
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self._http: Optional[httpx.AsyncClient] = None
 
     def connect(self) -> bool:
-        """Establishes connection to Ashby using API key from environment."""
+        """Establishes connection to Ashby using API key from environment.
+
+        Every setting is read and checked before any is applied, so a bad one
+        leaves the client unconfigured rather than half configured.
+        """
         try:
-            self.api_key = os.getenv('ASHBY_API_KEY')
-            if not self.api_key:
+            # live (default), record (live plus a cassette) or replay (cassette only)
+            transport_mode = os.getenv('ASHBY_TRANSPORT', 'live')
+            if transport_mode not in ("live", "record", "replay"):
+                raise ValueError(f"ASHBY_TRANSPORT must be live, record or replay, not {transport_mode!r}")
+            default_cassette = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ashby-cassette.ndjson.gz")
+            cassette_path = os.getenv('ASHBY_CASSETTE', default_cassette)
+            replay_speed = _env_float('ASHBY_REPLAY_SPEED', 0.0) or None
+
+            api_key = os.getenv('ASHBY_API_KEY')
+            if not api_key and transport_mode == "replay":
+                api_key = "replay"
+            if not api_key:
                 raise ValueError("ASHBY_API_KEY environment variable not set")
 
-            # Ashby uses Basic Auth with API key as username, empty password
-            auth_string = base64.b64encode(f"{self.api_key}:".encode()).decode()
-            self.headers = {
-                "Authorization": f"Basic {auth_string}",
-                "Content-Type": "application/json"
-            }
-            return True
+            # Connection pool and timeouts; deadlines are keyed by tool name
+            pool_size = int(_env_float('ASHBY_POOL_SIZE', 32))
+            limits = httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=_env_float('ASHBY_KEEPALIVE_EXPIRY', 30.0),
+            )
+            timeout = httpx.Timeout(
+                _env_float('ASHBY_READ_TIMEOUT', 30.0),
+                connect=_env_float('ASHBY_CONNECT_TIMEOUT', 5.0),
+                pool=_env_float('ASHBY_POOL_TIMEOUT', 5.0),
+            )
+            endpoint_deadlines = _parse_deadlines('ASHBY_ENDPOINT_DEADLINES', ENDPOINT_MAP)
+
+            # Client-side rate limiting and retries of throttled reads
+            rate_limiter = RateLimiter(
+                requests_per_minute=_env_float('ASHBY_RATE_LIMIT', 100),
+                burst=int(_env_float('ASHBY_RATE_BURST', 10)),
+            )
+            max_retries = int(_env_float('ASHBY_MAX_RETRIES', 3))
+            retry_queue_size = int(_env_float('ASHBY_RETRY_QUEUE_SIZE', 16))
+
+            # Hedged reads and per-family circuit breakers
+            hedging = HedgePolicy(
+                enabled=os.getenv('ASHBY_HEDGE', '1') not in ('0', 'false', 'no'),
+                min_delay=_env_float('ASHBY_HEDGE_MIN_DELAY', 0.05),
+                budget=_env_float('ASHBY_HEDGE_BUDGET', 0.1),
+            )
+            breaker_threshold = int(_env_float('ASHBY_BREAKER_THRESHOLD', 5))
+            breaker_reset = _env_float('ASHBY_BREAKER_RESET', 30.0)
         except Exception as e:
-            print(f"Ashby connection failed: {str(e)}")
+            print(f"Ashby connection failed: {str(e)}", file=sys.stderr)
             return False
 
-    def _make_request(self, endpoint: str, data: Optional[dict] = None) -> dict:
-        """Make a POST request to the Ashby API (all Ashby endpoints use POST)."""
+        self.transport_mode = transport_mode
+        self.cassette_path = cassette_path
+        self.replay_speed = replay_speed
+        self.limits = limits
+        self.timeout = timeout
+        self.endpoint_deadlines = endpoint_deadlines
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.retry_queue_size = retry_queue_size
+        self.hedging = hedging
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset = breaker_reset
+        # Ashby uses Basic Auth with API key as username, empty password
+        auth_string = base64.b64encode(f"{api_key}:".encode()).decode()
+        self.headers = {
+            "Authorization": f"Basic {auth_string}",
+            "Content-Type": "application/json"
+        }
+        self.api_key = api_key
+        return True
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """Return the shared keep-alive HTTP client, creating it on first use."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=self.timeout,
+                transport=self._make_transport(),
+            )
+        return self._http
+
+    def _make_transport(self) -> httpx.AsyncBaseTransport:
+        """The pooled network transport, or a cassette recorder/replayer around it."""
+        if self.transport_mode in ("record", "replay"):
+            from cassette import RecordingTransport, ReplayTransport
+        if self.transport_mode == "replay":
+            return ReplayTransport(self.cassette_path, speed=self.replay_speed)
+        transport = httpx.AsyncHTTPTransport(limits=self.limits)
+        if self.transport_mode == "record":
+            return RecordingTransport(self.cassette_path, transport)
+        return transport
+
+    async def _make_request(self, endpoint: str, data: Optional[dict] = None,
+                            deadline: Optional[float] = None, idempotent: bool = False) -> dict:
+        """Make a POST request to the Ashby API (all Ashby endpoints use POST).
+
+        `deadline` caps the whole request, including time spent waiting for the
+        rate limiter or a pooled connection, in seconds. Idempotent requests
+        that get a 429 are retried after Retry-After, and slow ones are hedged.
+        Fails fast with CircuitOpenError while the endpoint family's breaker
+        is open.
+        """
         if not self.api_key:
             raise ValueError("Ashby connection not established")
 
-        url = f"{self.base_url}{endpoint}"
-        response = requests.post(
-            url=url,
-            headers=self.headers,
-            json=data or {}
-        )
+        breaker = self._breaker(endpoint)
+        trial = breaker.check()
+        if idempotent:
+            request = self._hedged(endpoint, data or {}, self.max_retries)
+        else:
+            request = self._send(endpoint, data or {}, 0)
+        try:
+            if deadline is not None:
+                result = await asyncio.wait_for(request, deadline)
+            else:
+                result = await request
+        except asyncio.CancelledError:
+            if trial:
+                breaker.release_trial()
+            raise
+        except Exception as e:
+            if _is_upstream_failure(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        breaker.record_success()
+        return result
+
+    def _breaker(self, endpoint: str) -> CircuitBreaker:
+        family = endpoint_family(endpoint)
+        breaker = self.breakers.get(family)
+        if breaker is None:
+            breaker = self.breakers[family] = CircuitBreaker(family, self.breaker_threshold, self.breaker_reset)
+        return breaker
+
+    async def _hedged(self, endpoint: str, data: dict, retries: int) -> dict:
+        """Send a request; if it outlasts the endpoint's p95, race a second copy.
+
+        The backup only goes out if the hedge budget allows it and the rate
+        limiter has a token free right now, so hedging never queues behind
+        or adds to throttling.
+        """
+        primary = asyncio.ensure_future(self._send(endpoint, data, retries))
+        tasks = {primary}
+        try:
+            delay = self.hedging.delay(endpoint)
+            if delay is None:
+                return await primary
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self.hedging.allow() or not self.rate_limiter.try_acquire():
+                return await primary
+            backup = asyncio.ensure_future(self._send(endpoint, data, 0, acquired=True))
+            tasks.add(backup)
+
+            error: Optional[BaseException] = None
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup:
+                            self.hedging.hedge_wins += 1
+                        return task.result()
+                    if task is primary or error is None:
+                        error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _send(self, endpoint: str, data: dict, retries: int, acquired: bool = False) -> dict:
+        attempt = 0
+        if not acquired:
+            await self.rate_limiter.acquire()
+        while True:
+            sent_at = time.monotonic()
+            response = await self._get_http().post(endpoint, json=data)
+            if response.status_code != 429:
+                break
+
+            self.rate_limiter.on_throttle(_retry_after_seconds(response))
+            if attempt >= retries:
+                break
+            if self.retries_pending >= self.retry_queue_size:
+                self.retries_rejected += 1
+                break
+            attempt += 1
+            self.retries += 1
+            self.retries_pending += 1
+            try:
+                # The limiter is now paused for Retry-After, so this waits it out
+                await self.rate_limiter.acquire()
+            finally:
+                self.retries_pending -= 1
+
         response.raise_for_status()
-        return response.json()
+        self.rate_limiter.on_success()
+        self.hedging.observe(endpoint, time.monotonic() - sent_at)
+        return codec.loads(response.content)
+
+    def breaker_stats(self) -> dict:
+        return {family: breaker.stats() for family, breaker in sorted(self.breakers.items())}
+
+    def retry_stats(self) -> dict:
+        return {
+            "retries": self.retries,
+            "pending": self.retries_pending,
+            "rejected": self.retries_rejected,
+            "queueSize": self.retry_queue_size,
+        }
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+
+def canonical_json(arguments: dict) -> str:
+    """Serialize arguments so equal argument sets produce equal strings."""
+    return codec.dumps_canonical(arguments)
+
+
+class ResponseCache:
+    """In-process TTL cache with an LRU size bound for read-only tool responses."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[float, dict]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(name: str, arguments: dict) -> tuple[str, str]:
+        """Key by tool name plus arguments serialized in canonical form."""
+        return name, canonical_json(arguments)
+
+    def get(self, key: tuple[str, str]) -> Optional[dict]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: tuple[str, str], value: dict, ttl: float) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, names) -> None:
+        """Drop every cached entry for the given tool names."""
+        for key in [key for key in self._entries if key[0] in names]:
+            del self._entries[key]
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class SingleFlight:
+    """Coalesces identical in-flight calls so one upstream request serves every waiter."""
+
+    def __init__(self):
+        self._inflight: dict[Any, asyncio.Future] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key, fn):
+        """Await fn(), or join the call already running under `key`."""
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        # Shield so one caller being cancelled doesn't cancel the shared call
+        return await asyncio.shield(task)
+
+    def _finish(self, key, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every waiter went away
+
+    def stats(self) -> dict:
+        return {"calls": self.calls, "coalesced": self.coalesced, "inFlight": len(self._inflight)}
 
 
 # Create server instance
@@ -78,16 +548,64 @@ server = Server("ashby-mcp")
 # Load environment variables
 load_dotenv()
 
-# Configure Ashby client
-ashby_client = AshbyClient()
-if not ashby_client.connect():
-    print("Warning: Ashby connection not initialized - set ASHBY_API_KEY")
+# JSON encoding/decoding (orjson when installed)
+try:
+    codec = get_codec(os.getenv('ASHBY_JSON_CODEC'))
+except ValueError as e:
+    print(f"Warning: {e} - using the standard library", file=sys.stderr)
+    codec = get_codec("json")
+
+# Ashby client, configured on the first tool call so startup stays fast
+_ashby_client: Optional[AshbyClient] = None
+
+
+def get_ashby_client() -> AshbyClient:
+    """Return the shared Ashby client, configuring it on first use."""
+    global _ashby_client
+    if _ashby_client is None:
+        _ashby_client = AshbyClient()
+        if not _ashby_client.connect():
+            print("Warning: Ashby client not configured - tool calls will fail until the setting above is fixed",
+                  file=sys.stderr)
+    return _ashby_client
+
+
+response_cache = ResponseCache(max_entries=int(os.getenv('ASHBY_CACHE_SIZE', '256')))
+single_flight = SingleFlight()
+metrics = Metrics()
 
 
 # =============================================================================
 # TOOL DEFINITIONS (~30 core tools)
 # =============================================================================
 
+# Shared inputs for cursor-paginated list tools (see fetch_all_pages)
+PAGINATION_PROPERTIES = {
+    "all_pages": {
+        "type": "boolean",
+        "description": "Follow nextCursor server-side and return every page merged into one result",
+        "default": False
+    },
+    "max_rows": {"type": "integer", "description": "With all_pages: stop after this many rows (default 1000)"},
+    "max_bytes": {"type": "integer", "description": "With all_pages: stop once rows total this many bytes of JSON"}
+}
+
+# Choices offered by tools whose modules are only imported on first use;
+# keep in step with mirror.TABLES and export.DATASETS / export.FORMATS
+MIRROR_TABLES = ("candidates", "jobs", "applications", "interview_schedules")
+EXPORT_DATASETS = ("applications", "candidates", "jobs", "interview_schedules", "offers", "users", "feedback")
+EXPORT_FORMATS = ("ndjson", "parquet")
+
+# Options shared by the bulk write tools (see bulk_write)
+BULK_PROPERTIES = {
+    "concurrency": {"type": "integer", "description": "Maximum writes in flight (max 32)", "default": 8},
+    "dryRun": {
+        "type": "boolean",
+        "description": "Validate and report what would be written without calling Ashby",
+        "default": False
+    }
+}
+
 TOOLS = [
     # -------------------------------------------------------------------------
     # CANDIDATE TOOLS (8)
@@ -103,7 +621,7 @@ TOOLS = [
                 "phoneNumber": {"type": "string", "description": "Candidate's phone number"},
                 "linkedInUrl": {"type": "string", "description": "LinkedIn profile URL"},
                 "location": {"type": "string", "description": "Candidate's location"},
-                "sourceId": {"type": "string", "description": "Source ID for attribution"}
+                "sourceId": {"type": "string", "description": "Source ID or name for attribution"}
             },
             "required": ["name", "email"]
         }
@@ -126,7 +644,8 @@ TOOLS = [
             "type": "object",
             "properties": {
                 "cursor": {"type": "string", "description": "Pagination cursor from previous response"},
-                "limit": {"type": "integer", "description": "Number of results (max 100)", "default": 50}
+                "limit": {"type": "integer", "description": "Number of results (max 100)", "default": 50},
+                **PAGINATION_PROPERTIES
             }
         }
     ),
@@ -177,7 +696,7 @@ TOOLS = [
             "type": "object",
             "properties": {
                 "candidateId": {"type": "string", "description": "The candidate's unique ID"},
-                "tagId": {"type": "string", "description": "The tag ID to add"}
+                "tagId": {"type": "string", "description": "The tag ID or name to add"}
             },
             "required": ["candidateId", "tagId"]
         }
@@ -204,8 +723,8 @@ TOOLS = [
             "type": "object",
             "properties": {
                 "title": {"type": "string", "description": "Job title"},
-                "departmentId": {"type": "string", "description": "Department ID"},
-                "locationId": {"type": "string", "description": "Location ID"},
+                "departmentId": {"type": "string", "description": "Department ID or name"},
+                "locationId": {"type": "string", "description": "Location ID or name"},
                 "employmentType": {"type": "string", "description": "Full-time, Part-time, Contract, etc."},
                 "description": {"type": "string", "description": "Job description (HTML supported)"}
             },
@@ -233,7 +752,8 @@ TOOLS = [
             "properties": {
                 "cursor": {"type": "string", "description": "Pagination cursor"},
                 "limit": {"type": "integer", "description": "Number of results (max 100)", "default": 50},
-                "includeArchived": {"type": "boolean", "description": "Include archived jobs", "default": False}
+                "includeArchived": {"type": "boolean", "description": "Include archived jobs", "default": False},
+                **PAGINATION_PROPERTIES
             }
         }
     ),
@@ -271,9 +791,9 @@ TOOLS = [
             "type": "object",
             "properties": {
                 "candidateId": {"type": "string", "description": "The candidate's ID"},
-                "jobId": {"type": "string", "description": "The job's ID"},
-                "sourceId": {"type": "string", "description": "Application source ID"},
-                "interviewStageId": {"type": "string", "description": "Initial interview stage ID"}
+                "jobId": {"type": "string", "description": "The job's ID or title"},
+                "sourceId": {"type": "string", "description": "Application source ID or name"},
+                "interviewStageId": {"type": "string", "description": "Initial interview stage ID or name"}
             },
             "required": ["candidateId", "jobId"]
         }
@@ -288,7 +808,8 @@ TOOLS = [
                 "limit": {"type": "integer", "description": "Number of results (max 100)", "default": 50},
                 "jobId": {"type": "string", "description": "Filter by job ID"},
                 "candidateId": {"type": "string", "description": "Filter by candidate ID"},
-                "status": {"type": "string", "description": "Filter by status: Active, Hired, Archived"}
+                "status": {"type": "string", "description": "Filter by status: Active, Hired, Archived"},
+                **PAGINATION_PROPERTIES
             }
         }
     ),
@@ -310,8 +831,8 @@ TOOLS = [
             "type": "object",
             "properties": {
                 "applicationId": {"type": "string", "description": "The application's ID"},
-                "interviewStageId": {"type": "string", "description": "Target interview stage ID"},
-                "archiveReasonId": {"type": "string", "description": "Required when moving to Archived stage"}
+                "interviewStageId": {"type": "string", "description": "Target interview stage ID or name"},
+                "archiveReasonId": {"type": "string", "description": "Archive reason ID or name; required when moving to Archived stage"}
             },
             "required": ["applicationId", "interviewStageId"]
         }
@@ -323,7 +844,7 @@ TOOLS = [
             "type": "object",
             "properties": {
                 "applicationId": {"type": "string", "description": "The application's ID"},
-                "sourceId": {"type": "string", "description": "New source ID (null to clear)"}
+                "sourceId": {"type": ["string", "null"], "description": "New source ID or name (null to clear)"}
             },
             "required": ["applicationId", "sourceId"]
         }
@@ -335,7 +856,7 @@ TOOLS = [
             "type": "object",
             "properties": {
                 "applicationId": {"type": "string", "description": "The application's ID"},
-                "creditedToUserId": {"type": "string", "description": "User to credit the application to"}
+                "creditedToUserId": {"type": "string", "description": "User ID or name to credit the application to"}
             },
             "required": ["applicationId"]
         }
@@ -358,7 +879,7 @@ TOOLS = [
     ),
     types.Tool(
         name="interview_schedule_create",
-        description="Create/schedule a new interview.",
+        description="Create/schedule a new interview. Refused if an interviewer already has an interview at that time, unless allowConflicts is set.",
         inputSchema={
             "type": "object",
             "properties": {
@@ -366,12 +887,13 @@ TOOLS = [
                 "interviewerUserIds": {
                     "type": "array",
                     "items": {"type": "string"},
-                    "description": "List of interviewer user IDs"
+                    "description": "Interviewer user IDs, names or emails"
                 },
                 "startTime": {"type": "string", "description": "ISO 8601 start time"},
                 "endTime": {"type": "string", "description": "ISO 8601 end time"},
-                "interviewStageId": {"type": "string", "description": "Interview stage ID"},
-                "feedbackFormDefinitionId": {"type": "string", "description": "Feedback form to use"}
+                "interviewStageId": {"type": "string", "description": "Interview stage ID or name"},
+                "feedbackFormDefinitionId": {"type": "string", "description": "Feedback form to use"},
+                "allowConflicts": {"type": "boolean", "description": "Schedule even if an interviewer is already booked", "default": False}
             },
             "required": ["applicationId", "interviewerUserIds", "startTime", "endTime"]
         }
@@ -385,7 +907,9 @@ TOOLS = [
                 "cursor": {"type": "string", "description": "Pagination cursor"},
                 "limit": {"type": "integer", "description": "Number of results", "default": 50},
                 "startTimeAfter": {"type": "string", "description": "Filter: start time after (ISO 8601)"},
-                "startTimeBefore": {"type": "string", "description": "Filter: start time before (ISO 8601)"}
+                "startTimeBefore": {"type": "string", "description": "Filter: start time before (ISO 8601)"},
+                "applicationId": {"type": "string", "description": "Filter by application ID"},
+                **PAGINATION_PROPERTIES
             }
         }
     ),
@@ -401,8 +925,9 @@ TOOLS = [
                 "interviewerUserIds": {
                     "type": "array",
                     "items": {"type": "string"},
-                    "description": "Updated list of interviewer IDs"
-                }
+                    "description": "Updated interviewer user IDs, names or emails"
+                },
+                "allowConflicts": {"type": "boolean", "description": "Update even if an interviewer is already booked", "default": False}
             },
             "required": ["interviewScheduleId"]
         }
@@ -431,7 +956,8 @@ TOOLS = [
             "properties": {
                 "cursor": {"type": "string", "description": "Pagination cursor"},
                 "limit": {"type": "integer", "description": "Number of results", "default": 50},
-                "includeDeactivated": {"type": "boolean", "description": "Include deactivated users", "default": False}
+                "includeDeactivated": {"type": "boolean", "description": "Include deactivated users", "default": False},
+                **PAGINATION_PROPERTIES
             }
         }
     ),
@@ -493,7 +1019,8 @@ TOOLS = [
             "properties": {
                 "cursor": {"type": "string", "description": "Pagination cursor"},
                 "limit": {"type": "integer", "description": "Number of results", "default": 50},
-                "applicationId": {"type": "string", "description": "Filter by application ID"}
+                "applicationId": {"type": "string", "description": "Filter by application ID"},
+                **PAGINATION_PROPERTIES
             }
         }
     ),
@@ -507,7 +1034,8 @@ TOOLS = [
         inputSchema={
             "type": "object",
             "properties": {
-                "jobId": {"type": "string", "description": "The job ID to get stages for"}
+                "jobId": {"type": "string", "description": "The job ID to get stages for"},
+                "interviewPlanId": {"type": "string", "description": "The interview plan ID to get stages for (a job's interviewPlanIds, or an application's currentInterviewStage.interviewPlanId)"}
             }
         }
     ),
@@ -564,46 +1092,380 @@ TOOLS = [
             }
         }
     ),
-]
-
 
-@server.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
-    """List available Ashby tools."""
-    return TOOLS
+    # -------------------------------------------------------------------------
+    # COMPOSITE TOOLS (3) - Several Ashby calls in one round trip
+    # -------------------------------------------------------------------------
+    types.Tool(
+        name="batch",
+        description="Run many Ashby tool calls concurrently in one call. Returns a result or error per operation. Use instead of issuing the same kind of call repeatedly.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "operations": {
+                    "type": "array",
+                    "description": "Operations to run (max 100)",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "string", "description": "Optional id for referencing in dependsOn (default: list index)"},
+                            "tool": {"type": "string", "description": "Name of any Ashby API tool, e.g. candidate_info"},
+                            "arguments": {"type": "object", "description": "Arguments for the tool"},
+                            "dependsOn": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Ids of earlier operations that must succeed first"
+                            }
+                        },
+                        "required": ["tool"]
+                    }
+                },
+                "concurrency": {"type": "integer", "description": "Maximum operations in flight (max 32)", "default": 8},
+                "sequential": {"type": "boolean", "description": "Run operations one at a time in list order", "default": False}
+            },
+            "required": ["operations"]
+        }
+    ),
+    types.Tool(
+        name="candidate_dossier",
+        description="Everything about one candidate in a single call: profile, notes, and every application with its stage, feedback and interview schedules. Use instead of calling candidate_info, candidate_list_notes, application_list, feedback_list and interview_schedule_list one by one.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "candidateId": {"type": "string", "description": "The candidate's ID"},
+                "maxBytes": {"type": "integer", "description": "Size budget for the document; long text and the oldest items are trimmed to fit", "default": 60000}
+            },
+            "required": ["candidateId"]
+        }
+    ),
+    types.Tool(
+        name="pipeline_snapshot",
+        description="Count applications by interview stage, status and source for one or more jobs. Use instead of paging through application_list to answer 'how many candidates are in each stage'.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "jobIds": {"type": "array", "items": {"type": "string"}, "description": "Job IDs (max 50)"},
+                "status": {"type": "string", "description": "Only count applications with this status: Active, Hired, Archived"},
+                "maxAgeSeconds": {"type": "number", "description": "Accept a cached snapshot up to this old (0 for fresh data, default 300)"}
+            },
+            "required": ["jobIds"]
+        }
+    ),
 
+    # -------------------------------------------------------------------------
+    # BULK WRITE TOOLS (4) - One write applied to many records
+    # -------------------------------------------------------------------------
+    types.Tool(
+        name="bulk_application_change_stage",
+        description="Move many applications to the same interview stage. Returns the IDs that succeeded and an error for each that failed.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "applicationIds": {"type": "array", "items": {"type": "string"}, "description": "Application IDs (max 500)"},
+                "interviewStageId": {"type": "string", "description": "Target interview stage ID or name"},
+                "archiveReasonId": {"type": "string", "description": "Archive reason ID or name; required when moving to Archived stage"},
+                **BULK_PROPERTIES
+            },
+            "required": ["applicationIds", "interviewStageId"]
+        }
+    ),
+    types.Tool(
+        name="bulk_candidate_add_tag",
+        description="Add the same tag to many candidates. Returns the IDs that succeeded and an error for each that failed.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "candidateIds": {"type": "array", "items": {"type": "string"}, "description": "Candidate IDs (max 500)"},
+                "tagId": {"type": "string", "description": "The tag ID or name to add"},
+                **BULK_PROPERTIES
+            },
+            "required": ["candidateIds", "tagId"]
+        }
+    ),
+    types.Tool(
+        name="bulk_candidate_add_note",
+        description="Add the same note to many candidates. Returns the IDs that succeeded and an error for each that failed.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "candidateIds": {"type": "array", "items": {"type": "string"}, "description": "Candidate IDs (max 500)"},
+                "note": {"type": "string", "description": "The note content"},
+                "sendNotifications": {"type": "boolean", "description": "Send notifications about the note", "default": False},
+                **BULK_PROPERTIES
+            },
+            "required": ["candidateIds", "note"]
+        }
+    ),
+    types.Tool(
+        name="bulk_job_set_status",
+        description="Set the same status on many jobs (Open, Closed, Draft, Archived). Returns the IDs that succeeded and an error for each that failed.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "jobIds": {"type": "array", "items": {"type": "string"}, "description": "Job IDs (max 500)"},
+                "status": {"type": "string", "description": "New status: Open, Closed, Draft, Archived"},
+                **BULK_PROPERTIES
+            },
+            "required": ["jobIds", "status"]
+        }
+    ),
 
-# =============================================================================
-# TOOL ENDPOINT MAPPING
-# =============================================================================
+    # -------------------------------------------------------------------------
+    # LOCAL MIRROR TOOLS (6) - Answered from a local SQLite copy
+    # -------------------------------------------------------------------------
+    types.Tool(
+        name="mirror_sync",
+        description="Sync the local mirror of candidates, jobs, applications and interview schedules from Ashby. Incremental after the first run; a periodic full sync removes records deleted in Ashby.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tables": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": list(MIRROR_TABLES)},
+                    "description": "Tables to sync (default: all)"
+                },
+                "full": {"type": "boolean", "description": "Ignore sync tokens and re-list everything", "default": False}
+            }
+        }
+    ),
+    types.Tool(
+        name="mirror_status",
+        description="Show row counts and how long ago each mirrored table was synced.",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    types.Tool(
+        name="mirror_applications",
+        description="Query mirrored applications joined with candidate and job. Use for questions like 'which candidates are in stage X for job Y'.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "jobId": {"type": "string", "description": "Filter by job ID"},
+                "jobTitle": {"type": "string", "description": "Filter by job title (partial match)"},
+                "stage": {"type": "string", "description": "Filter by interview stage ID or title (partial match)"},
+                "status": {"type": "string", "description": "Filter by status: Active, Hired, Archived"},
+                "candidateName": {"type": "string", "description": "Filter by candidate name (partial match)"},
+                "limit": {"type": "integer", "description": "Maximum rows", "default": 100}
+            }
+        }
+    ),
+    types.Tool(
+        name="mirror_candidates",
+        description="Query mirrored candidates by name or email.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Name (partial match)"},
+                "email": {"type": "string", "description": "Email (partial match)"},
+                "limit": {"type": "integer", "description": "Maximum rows", "default": 100}
+            }
+        }
+    ),
+    types.Tool(
+        name="mirror_jobs",
+        description="Query mirrored jobs by title or status.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Job title (partial match)"},
+                "status": {"type": "string", "description": "Open, Closed, Draft, Archived"},
+                "limit": {"type": "integer", "description": "Maximum rows", "default": 100}
+            }
+        }
+    ),
+    types.Tool(
+        name="mirror_interview_schedules",
+        description="Query mirrored interview schedules joined with application, candidate and job.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "startTimeAfter": {"type": "string", "description": "Start time at or after (ISO 8601)"},
+                "startTimeBefore": {"type": "string", "description": "Start time before (ISO 8601)"},
+                "jobId": {"type": "string", "description": "Filter by job ID"},
+                "candidateId": {"type": "string", "description": "Filter by candidate ID"},
+                "limit": {"type": "integer", "description": "Maximum rows", "default": 100}
+            }
+        }
+    ),
 
-ENDPOINT_MAP = {
-    # Candidates
-    "candidate_create": "/candidate.create",
-    "candidate_search": "/candidate.search",
-    "candidate_list": "/candidate.list",
-    "candidate_info": "/candidate.info",
-    "candidate_update": "/candidate.update",
-    "candidate_add_note": "/candidate.createNote",
-    "candidate_add_tag": "/candidate.addTag",
-    "candidate_list_notes": "/candidate.listNotes",
+    # -------------------------------------------------------------------------
+    # FULL-TEXT SEARCH (1) - Answered from a local index of what has been read
+    # -------------------------------------------------------------------------
+    types.Tool(
+        name="candidate_fulltext_search",
+        description="Search candidate names, emails, locations, tags and notes by keyword across all candidates at once, ranked by relevance. Covers candidates and notes the server has already read (through candidate_list, candidate_list_notes and similar) or written; run candidate_list with all_pages first to cover every profile. Needs the server started with ASHBY_FULLTEXT=1.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Words to find; all must match, the last may be a prefix"},
+                "scope": {"type": "string", "enum": ["all", "profiles", "notes"], "description": "Search profiles, notes or both", "default": "all"},
+                "limit": {"type": "integer", "description": "Maximum candidates", "default": 20}
+            },
+            "required": ["query"]
+        }
+    ),
 
-    # Jobs
-    "job_create": "/job.create",
-    "job_search": "/job.search",
-    "job_list": "/job.list",
-    "job_info": "/job.info",
-    "job_set_status": "/job.setStatus",
+    # -------------------------------------------------------------------------
+    # INTERVIEW CALENDAR (1) - Answered from a local index of schedules
+    # -------------------------------------------------------------------------
+    types.Tool(
+        name="find_free_slots",
+        description="Find times when all the given interviewers are free, from a local calendar of their scheduled interviews. Lists interview schedules for the window first unless it has been listed recently.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "interviewerUserIds": {"type": "array", "items": {"type": "string"}, "description": "Interviewers (IDs, names or emails) who must all be free"},
+                "windowStart": {"type": "string", "description": "Earliest slot start (ISO 8601)"},
+                "windowEnd": {"type": "string", "description": "Latest slot end (ISO 8601)"},
+                "durationMinutes": {"type": "integer", "description": "Slot length", "default": 60},
+                "stepMinutes": {"type": "integer", "description": "Slots start on multiples of this many minutes", "default": 15},
+                "workingHours": {"type": "string", "description": "Only slots within these UTC hours each day, e.g. 09:00-17:00"},
+                "weekdaysOnly": {"type": "boolean", "description": "Skip Saturdays and Sundays", "default": False},
+                "refresh": {"type": "boolean", "description": "List interview schedules from Ashby before answering", "default": False},
+                "limit": {"type": "integer", "description": "Maximum slots", "default": 10}
+            },
+            "required": ["interviewerUserIds", "windowStart", "windowEnd"]
+        }
+    ),
 
-    # Applications
-    "application_create": "/application.create",
-    "application_list": "/application.list",
-    "application_info": "/application.info",
-    "application_change_stage": "/application.change_stage",
-    "application_change_source": "/application.change_source",
-    "application_update": "/application.update",
+    # -------------------------------------------------------------------------
+    # EXPORT (2) - Full datasets streamed to files, for analytics
+    # -------------------------------------------------------------------------
+    types.Tool(
+        name="export_data",
+        description="Export every record of a dataset to an NDJSON file or a directory of Parquet files on the machine running this server. Runs in the background and resumes an interrupted export of the same path. Returns at once; check progress with export_status.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "dataset": {"type": "string", "enum": list(EXPORT_DATASETS), "description": "What to export"},
+                "format": {"type": "string", "enum": list(EXPORT_FORMATS), "default": "ndjson"},
+                "path": {"type": "string", "description": "Output file (NDJSON) or directory (Parquet), relative to the export directory (ASHBY_EXPORT_DIR); default <dataset>.ndjson or <dataset>. Existing output is only replaced if an earlier export wrote it"},
+                "filters": {"type": "object", "description": "Filters passed to the list endpoint, e.g. {\"status\": \"Active\"}"},
+                "restart": {"type": "boolean", "description": "Ignore any checkpoint and start over", "default": False}
+            },
+            "required": ["dataset"]
+        }
+    ),
+    types.Tool(
+        name="export_status",
+        description="Progress of exports started with export_data: rows written, rows per second and status.",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
 
-    # Interviews
+    # -------------------------------------------------------------------------
+    # LARGE RESULTS (1) - Slices of results too big to return in one message
+    # -------------------------------------------------------------------------
+    types.Tool(
+        name="result_read",
+        description="Read part of a large result that another tool stored instead of returning (its response includes a resourceId). Rows are read by page or offset, other results by byte range.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "resourceId": {"type": "string", "description": "resourceId (or uri) from the stored result"},
+                "page": {"type": "integer", "description": "1-based page of rows", "default": 1},
+                "pageSize": {"type": "integer", "description": "Rows per page (max 1000)", "default": 100},
+                "offset": {"type": "integer", "description": "First row to return (instead of page)"},
+                "limit": {"type": "integer", "description": "Rows to return with offset (max 1000)"},
+                "start": {"type": "integer", "description": "Byte offset, for results that are not rows"},
+                "length": {"type": "integer", "description": "Bytes to return (max 65536)"}
+            },
+            "required": ["resourceId"]
+        }
+    ),
+
+    # -------------------------------------------------------------------------
+    # DIAGNOSTICS (1)
+    # -------------------------------------------------------------------------
+    types.Tool(
+        name="server_stats",
+        description="Show per-tool latency percentiles, error counts, response sizes, cache and rate limiter state for this server process.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "format": {
+                    "type": "string",
+                    "enum": ["json", "prometheus"],
+                    "description": "json (default) or Prometheus text exposition format",
+                    "default": "json"
+                }
+            }
+        }
+    ),
+]
+
+# Output shaping accepted by every tool (see shape_output)
+OUTPUT_PROPERTIES = {
+    "fields": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Only return these fields, as dotted paths (e.g. [\"id\", \"name\", \"primaryEmailAddress.value\"]). Lists are mapped element-wise."
+    },
+    "compact": {
+        "type": "boolean",
+        "description": "Return unindented JSON with null values dropped",
+        "default": False
+    }
+}
+for _tool in TOOLS:
+    _tool.inputSchema["properties"].update(OUTPUT_PROPERTIES)
+
+
+# The tool list never changes, so build the response once
+LIST_TOOLS_RESULT = types.ListToolsResult(tools=TOOLS)
+TOOLS_BY_NAME = {tool.name: tool for tool in TOOLS}
+# Compiled once here instead of the SDK re-reading each schema per call
+TOOL_VALIDATORS = compile_tools({tool.name: tool.inputSchema for tool in TOOLS})
+
+
+def validate_arguments(name: str, arguments: dict[str, Any]) -> None:
+    """Raise ArgumentError if the arguments don't fit the tool's inputSchema."""
+    validator = TOOL_VALIDATORS.get(name)
+    if validator is not None:
+        validator(arguments)
+
+
+@server.list_tools()
+async def handle_list_tools(request: types.ListToolsRequest) -> types.ListToolsResult:
+    """List available Ashby tools."""
+    return LIST_TOOLS_RESULT
+
+
+# =============================================================================
+# TOOL ENDPOINT MAPPING
+# =============================================================================
+
+ENDPOINT_MAP = {
+    # Candidates
+    "candidate_create": "/candidate.create",
+    "candidate_search": "/candidate.search",
+    "candidate_list": "/candidate.list",
+    "candidate_info": "/candidate.info",
+    "candidate_update": "/candidate.update",
+    "candidate_add_note": "/candidate.createNote",
+    "candidate_add_tag": "/candidate.addTag",
+    "candidate_list_notes": "/candidate.listNotes",
+
+    # Jobs
+    "job_create": "/job.create",
+    "job_search": "/job.search",
+    "job_list": "/job.list",
+    "job_info": "/job.info",
+    "job_set_status": "/job.setStatus",
+
+    # Applications
+    "application_create": "/application.create",
+    "application_list": "/application.list",
+    "application_info": "/application.info",
+    "application_change_stage": "/application.change_stage",
+    "application_change_source": "/application.change_source",
+    "application_update": "/application.update",
+
+    # Interviews
     "interview_list": "/interview.list",
     "interview_schedule_create": "/interviewSchedule.create",
     "interview_schedule_list": "/interviewSchedule.list",
@@ -632,51 +1494,1766 @@ ENDPOINT_MAP = {
 }
 
 
-@server.call_tool()
+# =============================================================================
+# RESPONSE CACHE
+# =============================================================================
+
+# Reference data that rarely changes, with cache lifetimes in seconds
+CACHE_TTLS = {
+    "department_list": 3600,
+    "location_list": 3600,
+    "source_list": 3600,
+    "candidate_tag_list": 900,
+    "archive_reason_list": 3600,
+    "interview_stage_list": 1800,
+    "feedback_form_list": 3600,
+}
+
+# Write tools and the cached tools whose data they can change
+CACHE_INVALIDATIONS = {
+    "job_create": ("interview_stage_list",),
+    "job_set_status": ("interview_stage_list",),
+    "candidate_add_tag": ("candidate_tag_list",),
+    "application_create": ("pipeline_snapshot",),
+    "application_change_stage": ("pipeline_snapshot",),
+    "application_change_source": ("pipeline_snapshot",),
+    "application_update": ("pipeline_snapshot",),
+}
+
+
+# Tools that only read from Ashby; safe to coalesce
+READ_TOOLS = frozenset(
+    name for name in ENDPOINT_MAP
+    if name.endswith(("_list", "_info", "_search", "_list_notes"))
+)
+
+
+async def call_endpoint(name: str, arguments: dict[str, Any], cached: bool = True, feed: bool = True) -> dict:
+    """Call the Ashby endpoint for a tool.
+
+    Reference data is served from cache, and identical concurrent reads share
+    one upstream request. With `cached=False` the response cache is neither
+    read nor written, for callers that must see records created since. With
+    `feed=False` the response is not added to the full-text index or the
+    interview calendar, for bulk reads that would grow them without bound.
+    """
+    endpoint = ENDPOINT_MAP.get(name)
+    if not endpoint:
+        raise ValueError(f"Unknown tool: {name}")
+
+    ttl = CACHE_TTLS.get(name) if cached else None
+    if ttl:
+        cache_key = response_cache.make_key(name, arguments)
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    client = get_ashby_client()
+
+    async def request():
+        started = time.perf_counter()
+        try:
+            response = await client._make_request(
+                endpoint,
+                data=arguments,
+                deadline=client.endpoint_deadlines.get(name),
+                idempotent=name in READ_TOOLS
+            )
+        finally:
+            metrics.observe("upstream", name, time.perf_counter() - started)
+        if response.get("success") and feed:
+            if name in FULLTEXT_FEEDS:
+                index_response(name, arguments, response)
+            if name in CALENDAR_FEEDS:
+                index_schedules(name, arguments, response)
+        return response
+
+    if name in READ_TOOLS:
+        # Readers that feed the indexes must not end up sharing a request that doesn't
+        response = await single_flight.do((endpoint, canonical_json(arguments), feed), request)
+    else:
+        response = await request()
+
+    if response.get("success"):
+        if ttl:
+            response_cache.set(cache_key, response, ttl)
+        if name in CACHE_INVALIDATIONS:
+            response_cache.invalidate(CACHE_INVALIDATIONS[name])
+    return response
+
+
+# =============================================================================
+# PAGINATION
+# =============================================================================
+
+PAGINATED_TOOLS = {
+    "candidate_list",
+    "application_list",
+    "job_list",
+    "interview_schedule_list",
+    "offer_list",
+    "user_list",
+}
+
+ALL_PAGES_DEFAULT_MAX_ROWS = 1000
+ALL_PAGES_PAGE_SIZE = 100
+
+
+def split_paging_options(arguments: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Separate server-side paging options from the arguments sent to Ashby."""
+    arguments = dict(arguments)
+    options = {key: arguments.pop(key) for key in PAGINATION_PROPERTIES if key in arguments}
+    return arguments, options
+
+
+def _next_cursor(response: dict) -> Optional[str]:
+    return response.get("nextCursor") if response.get("moreDataAvailable") else None
+
+
+async def iter_pages(name: str, arguments: dict[str, Any], **options: Any):
+    """Yield each page response of a list tool in order.
+
+    The request for the next page is in flight while the caller works on the
+    current one. Iteration ends after the last page or a failed response.
+    Use with contextlib.aclosing when breaking out early. `options` are
+    passed on to call_endpoint.
+    """
+    pending = asyncio.ensure_future(call_endpoint(name, arguments, **options))
+    try:
+        while pending is not None:
+            response = await pending
+            pending = None
+            next_cursor = _next_cursor(response) if response.get("success") else None
+            if next_cursor:
+                pending = asyncio.ensure_future(call_endpoint(name, {**arguments, "cursor": next_cursor}, **options))
+            yield response
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+# Page source for exports: every page is read from Ashby and none is kept,
+# so a full export does not fill the response cache, calendar or full-text index
+export_pages = partial(iter_pages, cached=False, feed=False)
+
+
+async def fetch_all_pages(name: str, arguments: dict[str, Any],
+                          max_rows: Optional[int] = None, max_bytes: Optional[int] = None) -> dict:
+    """Follow nextCursor for a list tool and merge every page into one response.
+
+    The request for page N+1 is in flight while page N is being merged. Stops
+    early once max_rows or max_bytes is reached; the merged result then has
+    truncated=true and a nextCursor to resume from (resuming may repeat part
+    of the last page).
+    """
+    max_rows = max_rows or ALL_PAGES_DEFAULT_MAX_ROWS
+    arguments = {"limit": ALL_PAGES_PAGE_SIZE, **arguments}
+
+    rows: list = []
+    total_bytes = 0
+    page_count = 0
+    page_cursor = arguments.get("cursor")
+    resume_cursor = None
+    truncated = False
+
+    async with aclosing(iter_pages(name, arguments)) as pages:
+        async for response in pages:
+            if not response.get("success"):
+                return response
+            page_count += 1
+            next_cursor = _next_cursor(response)
+
+            for row in response.get("results", []):
+                if max_bytes is not None:
+                    row_bytes = len(codec.dumps(row))
+                    if total_bytes + row_bytes > max_bytes:
+                        truncated = True
+                        break
+                    total_bytes += row_bytes
+                if len(rows) >= max_rows:
+                    truncated = True
+                    break
+                rows.append(row)
+            else:
+                page_cursor = next_cursor
+                continue
+
+            resume_cursor = page_cursor
+            break
+
+    merged = {
+        "results": rows,
+        "rowCount": len(rows),
+        "pageCount": page_count,
+        "truncated": truncated,
+    }
+    if max_bytes is not None:
+        merged["byteCount"] = total_bytes
+    if truncated:
+        merged["nextCursor"] = resume_cursor
+    return {"success": True, "results": merged}
+
+
+# =============================================================================
+# LOCAL MIRROR
+# =============================================================================
+
+_mirror: Optional["AshbyMirror"] = None
+
+
+def get_mirror() -> "AshbyMirror":
+    """Open the local mirror on first use."""
+    global _mirror
+    if _mirror is None:
+        from mirror import AshbyMirror
+        default_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ashby-mirror.sqlite3")
+        _mirror = AshbyMirror(
+            os.getenv('ASHBY_MIRROR_PATH', default_path),
+            full_sync_seconds=_env_float('ASHBY_MIRROR_FULL_SYNC', 86400.0),
+        )
+    return _mirror
+
+
+def _mirror_result(rows: list[dict], tables: list[str]) -> dict:
+    mirror = get_mirror()
+    return {"success": True, "results": {
+        "results": rows,
+        "rowCount": len(rows),
+        "queryMs": mirror.last_query_ms,
+        "freshness": mirror.freshness(tables),
+    }}
+
+
+async def mirror_sync(arguments: dict[str, Any]) -> dict:
+    mirror = get_mirror()
+    tables = arguments.get("tables") or list(MIRROR_TABLES)
+    full = arguments.get("full", False)
+    results = await asyncio.gather(*(mirror.sync(call_endpoint, table, full=full) for table in tables))
+    return {"success": True, "results": {"synced": results, "freshness": mirror.freshness(tables)}}
+
+
+async def mirror_status(arguments: dict[str, Any]) -> dict:
+    mirror = get_mirror()
+    return {"success": True, "results": {"path": mirror.path, "freshness": mirror.freshness()}}
+
+
+async def mirror_applications(arguments: dict[str, Any]) -> dict:
+    rows = get_mirror().applications(
+        job_id=arguments.get("jobId"),
+        job_title=arguments.get("jobTitle"),
+        stage=arguments.get("stage"),
+        status=arguments.get("status"),
+        candidate_name=arguments.get("candidateName"),
+        limit=arguments.get("limit", 100),
+    )
+    return _mirror_result(rows, ["applications", "candidates", "jobs"])
+
+
+async def mirror_candidates(arguments: dict[str, Any]) -> dict:
+    rows = get_mirror().candidates(
+        name=arguments.get("name"),
+        email=arguments.get("email"),
+        limit=arguments.get("limit", 100),
+    )
+    return _mirror_result(rows, ["candidates"])
+
+
+async def mirror_jobs(arguments: dict[str, Any]) -> dict:
+    rows = get_mirror().jobs(
+        title=arguments.get("title"),
+        status=arguments.get("status"),
+        limit=arguments.get("limit", 100),
+    )
+    return _mirror_result(rows, ["jobs"])
+
+
+async def mirror_interview_schedules(arguments: dict[str, Any]) -> dict:
+    rows = get_mirror().interview_schedules(
+        start_after=arguments.get("startTimeAfter"),
+        start_before=arguments.get("startTimeBefore"),
+        job_id=arguments.get("jobId"),
+        candidate_id=arguments.get("candidateId"),
+        limit=arguments.get("limit", 100),
+    )
+    return _mirror_result(rows, ["interview_schedules", "applications", "candidates", "jobs"])
+
+
+# =============================================================================
+# FULL-TEXT SEARCH
+# =============================================================================
+
+# Tools whose successful responses are added to the full-text index, and
+# whether they carry candidate profiles or notes
+FULLTEXT_FEEDS = {
+    "candidate_list": "profiles",
+    "candidate_search": "profiles",
+    "candidate_info": "profiles",
+    "candidate_create": "profiles",
+    "candidate_update": "profiles",
+    "candidate_add_tag": "profiles",
+    "candidate_list_notes": "notes",
+    "candidate_add_note": "notes",
+}
+# Off unless asked for: the index keeps candidate names, emails and notes on disk
+FULLTEXT_ENABLED = os.getenv('ASHBY_FULLTEXT', '0') == '1'
+
+_fulltext: Optional["FullTextIndex"] = None
+
+
+def get_fulltext() -> "FullTextIndex":
+    """Open the full-text index on first use."""
+    global _fulltext
+    if _fulltext is None:
+        from fulltext import FullTextIndex
+        default_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ashby-fulltext.sqlite3")
+        _fulltext = FullTextIndex(os.getenv('ASHBY_FULLTEXT_PATH', default_path))
+    return _fulltext
+
+
+def index_response(name: str, arguments: dict[str, Any], response: dict) -> None:
+    """Add the candidates or notes in a response to the full-text index.
+
+    Indexing is best effort: a failure is logged and the tool call goes on.
+    """
+    if not FULLTEXT_ENABLED:
+        return
+    import sqlite3
+
+    results = response.get("results")
+    records = results if isinstance(results, list) else [results] if isinstance(results, dict) else []
+    try:
+        if FULLTEXT_FEEDS[name] == "profiles":
+            get_fulltext().add_candidates(records)
+        elif arguments.get("candidateId"):
+            get_fulltext().add_notes(arguments["candidateId"], records)
+    except sqlite3.Error as e:
+        print(f"Warning: could not update the full-text index: {e}", file=sys.stderr)
+
+
+async def candidate_fulltext_search(arguments: dict[str, Any]) -> dict:
+    if not FULLTEXT_ENABLED:
+        raise ValueError("Full-text search is off - start the server with ASHBY_FULLTEXT=1 to index candidates "
+                         "and notes as they are read (stored in ASHBY_FULLTEXT_PATH)")
+    index = get_fulltext()
+    kinds = {"profiles": ["profile"], "notes": ["note"]}.get(arguments.get("scope", "all"))
+    rows = index.search(arguments.get("query", ""), kinds=kinds, limit=arguments.get("limit", 20))
+    return {"success": True, "results": {
+        "results": rows,
+        "rowCount": len(rows),
+        "queryMs": index.last_query_ms,
+        "indexed": index.stats(),
+    }}
+
+
+# =============================================================================
+# INTERVIEW CALENDAR
+# =============================================================================
+
+# Tools whose successful responses update the interview calendar
+CALENDAR_FEEDS = {
+    "interview_schedule_list",
+    "interview_schedule_create",
+    "interview_schedule_update",
+    "interview_schedule_cancel",
+}
+# Writes checked against the calendar before they are sent
+CONFLICT_CHECKED_TOOLS = {"interview_schedule_create", "interview_schedule_update"}
+# Seconds after which find_free_slots lists schedules again before answering
+CALENDAR_MAX_AGE = _env_float('ASHBY_CALENDAR_MAX_AGE', 300)
+
+_interview_calendar: Optional["InterviewCalendar"] = None
+
+
+def get_interview_calendar() -> "InterviewCalendar":
+    """Create the interview calendar on first use."""
+    global _interview_calendar
+    if _interview_calendar is None:
+        from schedule_index import InterviewCalendar
+        _interview_calendar = InterviewCalendar()
+    return _interview_calendar
+
+
+def _requested_intervals(arguments: dict[str, Any], schedule_id: Optional[str]) -> list[tuple[str, float, float]]:
+    """Interviewer intervals a create or update call asks for.
+
+    An update that leaves out the interviewers or the end time keeps what the
+    calendar already has for the schedule; a new start alone moves the
+    interview and keeps its length.
+    """
+    from schedule_index import parse_time
+
+    current = get_interview_calendar().intervals(schedule_id) if schedule_id else []
+    start = parse_time(arguments["startTime"]) if arguments.get("startTime") else None
+    end = parse_time(arguments["endTime"]) if arguments.get("endTime") else None
+    interviewers = arguments.get("interviewerUserIds")
+    if current and (start is None or end is None or interviewers is None):
+        _, current_start, current_end = current[0]
+        if end is None:
+            end = current_end if start is None else start + (current_end - current_start)
+        start = current_start if start is None else start
+        interviewers = interviewers if interviewers is not None else list(dict.fromkeys(i[0] for i in current))
+    if start is None or end is None or not interviewers:
+        return []
+    return [(interviewer, start, end) for interviewer in interviewers]
+
+
+def index_schedules(name: str, arguments: dict[str, Any], response: dict) -> None:
+    """Apply a schedule listing or write to the interview calendar."""
+    calendar = get_interview_calendar()
+    results = response.get("results")
+    if name == "interview_schedule_list":
+        calendar.add_schedules(results if isinstance(results, list) else [])
+    elif name == "interview_schedule_cancel":
+        calendar.remove(arguments.get("interviewScheduleId"))
+    else:
+        record = results if isinstance(results, dict) else {}
+        schedule_id = arguments.get("interviewScheduleId") or record.get("id")
+        if not schedule_id:
+            return
+        intervals = _requested_intervals(arguments, schedule_id)
+        if intervals:
+            calendar.put(schedule_id, intervals)
+        else:
+            calendar.add_schedules([record])
+
+
+async def list_calendar_window(window_start: float, window_end: float, refresh: bool = False) -> Optional[dict]:
+    """List the interview schedules overlapping a window into the calendar.
+
+    Skipped while an earlier listing of the window is younger than
+    CALENDAR_MAX_AGE. Returns the failed page if Ashby refuses the listing.
+    """
+    from schedule_index import format_time
+
+    calendar = get_interview_calendar()
+    # Only these unfiltered listings count; other listings (one
+    # application's schedules, say) may leave interviews in the window out
+    listed_at = calendar.listed_at(window_start, window_end)
+    if not refresh and listed_at is not None and time.time() - listed_at <= CALENDAR_MAX_AGE:
+        return None
+    # Schedules that started up to a day before the window can still overlap it
+    listing = {
+        "startTimeAfter": format_time(window_start - 86400),
+        "startTimeBefore": format_time(window_end),
+        "limit": ALL_PAGES_PAGE_SIZE,
+    }
+    async with aclosing(iter_pages("interview_schedule_list", listing)) as pages:
+        async for page in pages:
+            if not page.get("success"):
+                return page
+    calendar.mark_listed(window_start, window_end)
+    return None
+
+
+async def schedule_conflicts(arguments: dict[str, Any]) -> tuple[list[dict], Optional[str]]:
+    """Interviews a schedule create or update would clash with.
+
+    The requested time is listed from Ashby first unless the calendar saw it
+    recently. Also returns why the check could not be made, if it could not.
+    """
+    schedule_id = arguments.get("interviewScheduleId")
+    if not any(key in arguments for key in ("startTime", "endTime", "interviewerUserIds")):
+        return [], None
+    intervals = _requested_intervals(arguments, schedule_id)
+    if not intervals:
+        return [], "the interview's times and interviewers are not all known - pass startTime, endTime and interviewerUserIds"
+    _, start, end = intervals[0]
+    failed = await list_calendar_window(start, end)
+    if failed is not None:
+        return [], f"listing interview schedules failed: {failed.get('errors')}"
+    return get_interview_calendar().conflicts([i[0] for i in intervals], start, end, exclude=schedule_id), None
+
+
+def _parse_working_hours(value: str) -> tuple[int, int]:
+    try:
+        start, end = (int(h) * 60 + int(m) for h, m in (part.strip().split(":") for part in value.split("-")))
+    except ValueError:
+        raise ValueError(f"workingHours must look like 09:00-17:00, got {value!r}")
+    if not 0 <= start < end <= 24 * 60:
+        raise ValueError(f"workingHours must be a range within one day, got {value!r}")
+    return start, end
+
+
+async def find_free_slots(arguments: dict[str, Any]) -> dict:
+    from schedule_index import format_time, parse_time
+
+    interviewers = arguments.get("interviewerUserIds") or []
+    if not interviewers:
+        raise ValueError("interviewerUserIds must name at least one interviewer")
+    window_start, window_end = parse_time(arguments["windowStart"]), parse_time(arguments["windowEnd"])
+    working_hours = _parse_working_hours(arguments["workingHours"]) if arguments.get("workingHours") else None
+    calendar = get_interview_calendar()
+    failed = await list_calendar_window(window_start, window_end, refresh=arguments.get("refresh", False))
+    if failed is not None:
+        return failed
+
+    started = time.perf_counter()
+    slots = calendar.free_slots(
+        interviewers,
+        window_start,
+        window_end,
+        duration=arguments.get("durationMinutes", 60) * 60,
+        step=max(arguments.get("stepMinutes", 15), 1) * 60,
+        limit=arguments.get("limit", 10),
+        working_hours=working_hours,
+        weekdays_only=arguments.get("weekdaysOnly", False),
+    )
+    return {"success": True, "results": {
+        "slots": slots,
+        "busy": [
+            {"startTime": format_time(start), "endTime": format_time(end)}
+            for start, end in calendar.busy(interviewers, window_start, window_end)
+        ][:50],
+        "queryMs": round((time.perf_counter() - started) * 1000, 2),
+        "calendar": calendar.stats(),
+    }}
+
+
+# =============================================================================
+# NAME RESOLUTION
+# =============================================================================
+
+# Arguments that accept a name in place of an ID, and the kind of record named
+NAME_ARGUMENTS = {
+    "departmentId": "department",
+    "locationId": "location",
+    "sourceId": "source",
+    "interviewStageId": "interview_stage",
+    "archiveReasonId": "archive_reason",
+    "tagId": "candidate_tag",
+    "creditedToUserId": "user",
+    "interviewerUserIds": "user",
+    "jobId": "job",
+    "jobIds": "job",
+}
+
+
+def _user_label(user: dict) -> str:
+    return f"{user.get('firstName', '')} {user.get('lastName', '')}".strip() or user.get("email", "")
+
+
+# kind -> (list tool, names a record goes by, label shown in errors)
+NAME_KINDS = {
+    "user": ("user_list", lambda u: [_user_label(u), u.get("email")], _user_label),
+    "department": ("department_list", lambda d: [d.get("name")], lambda d: d.get("name", "")),
+    "location": ("location_list", lambda loc: [loc.get("name")], lambda loc: loc.get("name", "")),
+    "source": ("source_list", lambda s: [s.get("title")], lambda s: s.get("title", "")),
+    "interview_stage": ("interview_stage_list", lambda s: [s.get("title")], lambda s: s.get("title", "")),
+    "archive_reason": ("archive_reason_list", lambda r: [r.get("text")], lambda r: r.get("text", "")),
+    "candidate_tag": ("candidate_tag_list", lambda t: [t.get("title")], lambda t: t.get("title", "")),
+    "job": ("job_list", lambda j: [j.get("title")], lambda j: j.get("title", "")),
+}
+# Kinds named uniquely only within a parent: kind -> list tool argument naming the parent.
+# Stage titles repeat across interview plans, so stages are looked up in one plan.
+SCOPED_NAME_KINDS = {"interview_stage": "interviewPlanId"}
+NAME_INDEX_MAX_AGE = _env_float('ASHBY_NAME_INDEX_MAX_AGE', 900)
+
+
+async def load_names(kind: str, scope: Optional[str]) -> list[dict]:
+    """Every record of a kind (within its scope), for the name index.
+
+    Read past the response cache, which may predate records the index is
+    being refreshed to find.
+    """
+    tool = NAME_KINDS[kind][0]
+    arguments = {SCOPED_NAME_KINDS[kind]: scope} if kind in SCOPED_NAME_KINDS else {}
+    if tool not in PAGINATED_TOOLS:
+        response = await call_endpoint(tool, arguments, cached=False)
+        if not response.get("success"):
+            raise RuntimeError(f"{tool} failed: {response.get('errors')}")
+        return response.get("results", [])
+    records: list[dict] = []
+    async with aclosing(iter_pages(tool, {**arguments, "limit": ALL_PAGES_PAGE_SIZE}, cached=False)) as pages:
+        async for response in pages:
+            if not response.get("success"):
+                raise RuntimeError(f"{tool} failed: {response.get('errors')}")
+            records.extend(response.get("results", []))
+    return records
+
+
+_name_resolver: Optional["NameResolver"] = None
+
+
+def get_name_resolver() -> "NameResolver":
+    """Create the name resolver on first use; it loads each kind when first asked."""
+    global _name_resolver
+    if _name_resolver is None:
+        from resolver import NameResolver
+        _name_resolver = NameResolver(
+            load_names,
+            {kind: (names, label) for kind, (_, names, label) in NAME_KINDS.items()},
+            max_age=NAME_INDEX_MAX_AGE,
+        )
+    return _name_resolver
+
+
+async def interview_plan_for(arguments: dict[str, Any]) -> str:
+    """The interview plan of the application or job a call acts on.
+
+    A bulk call uses its first application's plan; applications on other
+    plans then fail individually, since stage IDs belong to one plan.
+    """
+    from resolver import NameResolutionError
+
+    application_id = arguments.get("applicationId") or next(iter(arguments.get("applicationIds") or []), None)
+    if application_id:
+        response = await call_endpoint("application_info", {"applicationId": application_id})
+        plan = ((response.get("results") or {}).get("currentInterviewStage") or {}).get("interviewPlanId")
+    elif arguments.get("jobId"):
+        response = await call_endpoint("job_info", {"jobId": arguments["jobId"]})
+        job = response.get("results") or {}
+        plan = job.get("defaultInterviewPlanId") or next(iter(job.get("interviewPlanIds") or []), None)
+    else:
+        raise NameResolutionError("interview stage names are looked up in the interview plan of an "
+                                  "applicationId or jobId - pass one, or pass the stage ID")
+    if not response.get("success") or not plan:
+        raise NameResolutionError("could not find the interview plan to look the stage name up in - "
+                                  "pass the stage ID")
+    return plan
+
+
+async def resolve_names(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Replace names given for ID arguments with the IDs they refer to.
+
+    Only the kinds named are loaded. Write tools accept exact names only, so
+    a prefix or misspelling never changes the wrong record.
+    """
+    if NAME_ARGUMENTS.keys().isdisjoint(arguments):
+        return arguments
+    from resolver import looks_like_id
+
+    pending = [
+        key for key, value in arguments.items()
+        if key in NAME_ARGUMENTS and (
+            (isinstance(value, str) and not looks_like_id(value))
+            or (isinstance(value, list) and any(isinstance(v, str) and not looks_like_id(v) for v in value))
+        )
+    ]
+    if not pending:
+        return arguments
+
+    exact = name not in READ_TOOLS and (name in ENDPOINT_MAP or name in BULK_TOOLS)
+    arguments = dict(arguments)
+    # Scoped kinds last: their scope may come from an argument resolved first (a job title)
+    for key in sorted(pending, key=lambda k: NAME_ARGUMENTS[k] in SCOPED_NAME_KINDS):
+        kind = NAME_ARGUMENTS[key]
+        scope = await interview_plan_for(arguments) if kind in SCOPED_NAME_KINDS else None
+        value = arguments[key]
+        if isinstance(value, list):
+            arguments[key] = [await get_name_resolver().resolve(kind, v, scope, exact) if isinstance(v, str) else v
+                              for v in value]
+        else:
+            arguments[key] = await get_name_resolver().resolve(kind, value, scope, exact)
+    return arguments
+
+
+# =============================================================================
+# BATCH
+# =============================================================================
+
+BATCH_MAX_OPERATIONS = 100
+BATCH_MAX_CONCURRENCY = 32
+
+
+async def batch(arguments: dict[str, Any]) -> dict:
+    """Run many Ashby tool calls in one MCP call with bounded concurrency.
+
+    An operation waits for everything listed in its dependsOn (ids of earlier
+    operations) and is skipped if any of them failed. sequential=true runs
+    operations strictly in list order.
+    """
+    operations = arguments.get("operations") or []
+    if len(operations) > BATCH_MAX_OPERATIONS:
+        raise ValueError(f"batch accepts at most {BATCH_MAX_OPERATIONS} operations")
+
+    ids = [str(op.get("id", index)) for index, op in enumerate(operations)]
+    if len(set(ids)) != len(ids):
+        raise ValueError("batch operation ids must be unique")
+    for index, op in enumerate(operations):
+        if op.get("tool") not in ENDPOINT_MAP:
+            raise ValueError(f"operation {ids[index]}: unknown tool {op.get('tool')!r}")
+        for dep in op.get("dependsOn", []):
+            if dep not in ids[:index]:
+                raise ValueError(f"operation {ids[index]}: dependsOn {dep!r} must name an earlier operation")
+
+    sequential = arguments.get("sequential", False)
+    concurrency = 1 if sequential else min(max(arguments.get("concurrency", 8), 1), BATCH_MAX_CONCURRENCY)
+    semaphore = asyncio.Semaphore(concurrency)
+    finished = {op_id: asyncio.Event() for op_id in ids}
+    succeeded: dict[str, bool] = {}
+
+    async def run_one(index: int) -> dict:
+        op_id, op = ids[index], operations[index]
+        item = {"id": op_id, "tool": op["tool"]}
+        try:
+            deps = list(op.get("dependsOn", []))
+            if sequential and index > 0:
+                deps.append(ids[index - 1])
+            for dep in deps:
+                await finished[dep].wait()
+            failed = [dep for dep in op.get("dependsOn", []) if not succeeded[dep]]
+            if failed:
+                item.update(ok=False, skipped=True, error=f"dependency failed: {', '.join(failed)}")
+                return item
+
+            validate_arguments(op["tool"], op.get("arguments") or {})
+            op_arguments, output = split_output_options(op.get("arguments") or {})
+            async with semaphore:
+                response = await dispatch_tool(op["tool"], op_arguments)
+            if response.get("success"):
+                result = response.get("results", response)
+                if output.get("fields"):
+                    result = project(result, output["fields"])
+                item.update(ok=True, result=result)
+            else:
+                item.update(ok=False, error=response.get("errors", ["Unknown error"]))
+            return item
+        except Exception as e:
+            item.update(ok=False, error=format_error(op["tool"], e))
+            return item
+        finally:
+            succeeded[op_id] = item.get("ok", False)
+            finished[op_id].set()
+
+    started = time.perf_counter()
+    items = await asyncio.gather(*(run_one(index) for index in range(len(operations))))
+    return {"success": True, "results": {
+        "results": items,
+        "succeeded": sum(1 for item in items if item["ok"]),
+        "failed": sum(1 for item in items if not item["ok"] and not item.get("skipped")),
+        "skipped": sum(1 for item in items if item.get("skipped")),
+        "seconds": round(time.perf_counter() - started, 3),
+    }}
+
+
+# =============================================================================
+# BULK WRITES
+# =============================================================================
+
+BULK_MAX_ITEMS = 500
+BULK_MAX_CONCURRENCY = 32
+
+# Bulk tool -> (single-record tool, array argument, per-call ID argument)
+BULK_TOOLS = {
+    "bulk_application_change_stage": ("application_change_stage", "applicationIds", "applicationId"),
+    "bulk_candidate_add_tag": ("candidate_add_tag", "candidateIds", "candidateId"),
+    "bulk_candidate_add_note": ("candidate_add_note", "candidateIds", "candidateId"),
+    "bulk_job_set_status": ("job_set_status", "jobIds", "jobId"),
+}
+
+
+async def bulk_write(name: str, arguments: dict[str, Any]) -> dict:
+    """Apply one write tool to many IDs with bounded concurrency.
+
+    Every other argument is passed unchanged to each call. Writes still go
+    through the shared rate limiter, so a large batch paces itself instead of
+    drawing 429s. Duplicate IDs are written once. dryRun=true validates and
+    reports the planned calls without sending any.
+    """
+    tool, ids_argument, id_argument = BULK_TOOLS[name]
+    arguments = dict(arguments)
+    ids = list(dict.fromkeys(arguments.pop(ids_argument, None) or []))
+    concurrency = min(max(arguments.pop("concurrency", 8), 1), BULK_MAX_CONCURRENCY)
+    dry_run = arguments.pop("dryRun", False)
+    if not ids:
+        raise ValueError(f"{name} needs at least one ID in {ids_argument}")
+    if len(ids) > BULK_MAX_ITEMS:
+        raise ValueError(f"{name} accepts at most {BULK_MAX_ITEMS} IDs")
+    required = [key for key in TOOLS_BY_NAME[tool].inputSchema.get("required", []) if key != id_argument]
+    missing = [key for key in required if arguments.get(key) in (None, "")]
+    if missing:
+        raise ValueError(f"{name} needs {', '.join(missing)}")
+
+    if dry_run:
+        limiter = get_ashby_client().rate_limiter
+        return {"success": True, "results": {
+            "dryRun": True,
+            "tool": tool,
+            "count": len(ids),
+            "arguments": arguments,
+            ids_argument: ids,
+            "estimatedSeconds": round(max(len(ids) - limiter.tokens, 0) / limiter.rate, 1),
+        }}
+
+    semaphore = asyncio.Semaphore(concurrency)
+    succeeded: list[str] = []
+    failed: list[dict] = []
+
+    async def write(record_id: str) -> None:
+        try:
+            async with semaphore:
+                response = await call_endpoint(tool, {**arguments, id_argument: record_id})
+        except Exception as e:
+            failed.append({"id": record_id, "error": format_error(tool, e)})
+            return
+        if response.get("success"):
+            succeeded.append(record_id)
+        else:
+            failed.append({"id": record_id, "error": response.get("errors", ["Unknown error"])})
+
+    started = time.perf_counter()
+    await asyncio.gather(*(write(record_id) for record_id in ids))
+    order = {record_id: index for index, record_id in enumerate(ids)}
+    return {"success": True, "results": {
+        "tool": tool,
+        "requested": len(ids),
+        "succeeded": len(succeeded),
+        "failed": len(failed),
+        "succeededIds": sorted(succeeded, key=order.get),
+        "failures": sorted(failed, key=lambda item: order[item["id"]]),
+        "seconds": round(time.perf_counter() - started, 3),
+    }}
+
+
+# =============================================================================
+# CANDIDATE DOSSIER
+# =============================================================================
+
+DOSSIER_MAX_CONCURRENCY = 8
+DOSSIER_DEFAULT_MAX_BYTES = 60000
+# Applied in order until the document fits: drop bulky metadata, shorten long
+# strings, then keep fewer items
+DOSSIER_BULKY_FIELDS = frozenset({"formDefinition", "hiringTeam", "creditedToUser", "customFields", "fileHandles"})
+DOSSIER_STRING_LIMITS = (2000, 500, 160)
+DOSSIER_LIST_LIMITS = (20, 5, 1)
+
+
+def _drop_fields(value: Any, fields: frozenset) -> Any:
+    if isinstance(value, dict):
+        return {k: _drop_fields(v, fields) for k, v in value.items() if k not in fields}
+    if isinstance(value, list):
+        return [_drop_fields(v, fields) for v in value]
+    return value
+
+
+def _shorten_strings(value: Any, limit: int) -> Any:
+    if isinstance(value, str):
+        return value if len(value) <= limit else value[:limit] + "..."
+    if isinstance(value, dict):
+        return {k: _shorten_strings(v, limit) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_shorten_strings(v, limit) for v in value]
+    return value
+
+
+def _limit_lists(dossier: dict, limit: int) -> None:
+    """Keep the first `limit` notes and applications, and feedback and schedules per application."""
+    for key in ("notes", "applications"):
+        if len(dossier.get(key, [])) > limit:
+            dossier[key] = dossier[key][:limit]
+    for application in dossier.get("applications", []):
+        for key in ("feedback", "interviewSchedules"):
+            if len(application.get(key, [])) > limit:
+                application[key] = application[key][:limit]
+
+
+def fit_dossier(dossier: dict, max_bytes: int) -> dict:
+    """Trim a dossier until its compact JSON fits in max_bytes, noting what was cut.
+
+    Lists are already newest first, so cutting them keeps the most recent items.
+    """
+    size = len(codec.dumps(dossier).encode())
+    trimmed = []
+    if size > max_bytes:
+        dossier = _drop_fields(dossier, DOSSIER_BULKY_FIELDS)
+        trimmed.append(f"dropped {', '.join(sorted(DOSSIER_BULKY_FIELDS))}")
+        size = len(codec.dumps(dossier).encode())
+    for limit in DOSSIER_STRING_LIMITS:
+        if size <= max_bytes:
+            break
+        dossier = _shorten_strings(dossier, limit)
+        trimmed.append(f"text over {limit} characters shortened")
+        size = len(codec.dumps(dossier).encode())
+    for limit in DOSSIER_LIST_LIMITS:
+        if size <= max_bytes:
+            break
+        _limit_lists(dossier, limit)
+        trimmed.append(f"notes, applications, feedback and schedules cut to {limit} per list")
+        size = len(codec.dumps(dossier).encode())
+    dossier["byteCount"] = size
+    if trimmed:
+        dossier["trimmed"] = trimmed
+    return dossier
+
+
+async def candidate_dossier(arguments: dict[str, Any]) -> dict:
+    """Fetch a candidate's profile, notes and applications with feedback and schedules.
+
+    The candidate, notes and application list are fetched together, then
+    application_info, feedback_list and interview_schedule_list for every
+    application, all through one bounded worker pool. A failed secondary
+    call is reported under "errors" instead of failing the whole dossier.
+    """
+    candidate_id = arguments.get("candidateId")
+    if not candidate_id:
+        raise ValueError("candidate_dossier needs a candidateId")
+    max_bytes = arguments.get("maxBytes", DOSSIER_DEFAULT_MAX_BYTES)
+    semaphore = asyncio.Semaphore(DOSSIER_MAX_CONCURRENCY)
+    errors: dict[str, Any] = {}
+
+    async def fetch(label: str, name: str, tool_arguments: dict) -> Any:
+        try:
+            async with semaphore:
+                response = await call_endpoint(name, tool_arguments)
+        except Exception as e:
+            errors[label] = format_error(name, e)
+            return None
+        if not response.get("success"):
+            errors[label] = response.get("errors", ["Unknown error"])
+            return None
+        return response.get("results")
+
+    started = time.perf_counter()
+    candidate, notes, applications = await asyncio.gather(
+        fetch("candidate", "candidate_info", {"candidateId": candidate_id}),
+        fetch("notes", "candidate_list_notes", {"candidateId": candidate_id}),
+        fetch("applications", "application_list", {"candidateId": candidate_id, "limit": ALL_PAGES_PAGE_SIZE}),
+    )
+    if candidate is None:
+        return {"success": False, "errors": errors["candidate"]}
+
+    async def expand(application: dict) -> dict:
+        application_id = application["id"]
+        info, feedback, schedules = await asyncio.gather(
+            fetch(f"{application_id}.info", "application_info", {"applicationId": application_id}),
+            fetch(f"{application_id}.feedback", "feedback_list", {"applicationId": application_id}),
+            fetch(f"{application_id}.interviewSchedules", "interview_schedule_list", {"applicationId": application_id}),
+        )
+        return {**application, **(info or {}), "feedback": feedback or [], "interviewSchedules": schedules or []}
+
+    # Most recently updated first, so trimming to fit drops the oldest
+    applications = sorted(applications or [], key=lambda a: a.get("updatedAt") or "", reverse=True)
+    dossier: dict[str, Any] = {
+        "candidate": candidate,
+        "notes": notes or [],
+        "applications": list(await asyncio.gather(*(expand(a) for a in applications))),
+    }
+    if errors:
+        dossier["errors"] = errors
+    dossier["seconds"] = round(time.perf_counter() - started, 3)
+    return {"success": True, "results": fit_dossier(dossier, max_bytes)}
+
+
+# =============================================================================
+# PIPELINE SNAPSHOT
+# =============================================================================
+
+PIPELINE_MAX_JOBS = 50
+PIPELINE_MAX_CONCURRENCY = 8
+PIPELINE_MAX_APPLICATIONS = 20000
+PIPELINE_CACHE_TTL = _env_float('ASHBY_PIPELINE_CACHE_TTL', 300.0)
+
+
+async def _job_pipeline(job_id: str, status: Optional[str]) -> dict:
+    """Count one job's applications by stage, status and source, page by page."""
+    arguments: dict[str, Any] = {"jobId": job_id, "limit": ALL_PAGES_PAGE_SIZE}
+    if status:
+        arguments["status"] = status
+    stages: dict[str, list] = {}
+    statuses: dict[str, int] = {}
+    sources: dict[str, int] = {}
+    job_title = None
+    count = 0
+    truncated = False
+
+    async with aclosing(iter_pages("application_list", arguments)) as pages:
+        async for response in pages:
+            if not response.get("success"):
+                return {"jobId": job_id, "error": response.get("errors", ["Unknown error"])}
+            for application in response.get("results", []):
+                stage = application.get("currentInterviewStage") or {}
+                title = stage.get("title") or "No stage"
+                order = stage.get("orderInInterviewPlan")
+                entry = stages.setdefault(title, [order if order is not None else 1 << 30, 0])
+                entry[1] += 1
+                app_status = application.get("status") or "Unknown"
+                statuses[app_status] = statuses.get(app_status, 0) + 1
+                source = (application.get("source") or {}).get("title") or "Unknown"
+                sources[source] = sources.get(source, 0) + 1
+                job_title = job_title or (application.get("job") or {}).get("title")
+                count += 1
+            if count >= PIPELINE_MAX_APPLICATIONS:
+                truncated = _next_cursor(response) is not None
+                break
+
+    snapshot = {
+        "jobId": job_id,
+        "jobTitle": job_title,
+        "applications": count,
+        "byStage": [{"stage": title, "count": n} for title, (_, n) in sorted(stages.items(), key=lambda item: item[1][0])],
+        "byStatus": dict(sorted(statuses.items(), key=lambda item: -item[1])),
+        "bySource": dict(sorted(sources.items(), key=lambda item: -item[1])),
+        "fetchedAt": time.time(),
+    }
+    if truncated:
+        snapshot["truncated"] = True
+    return snapshot
+
+
+async def pipeline_snapshot(arguments: dict[str, Any]) -> dict:
+    """Stage, status and source counts for one or more jobs.
+
+    Jobs are fetched concurrently and aggregated page by page, so only the
+    counts are held in memory. Per-job snapshots are cached for
+    ASHBY_PIPELINE_CACHE_TTL seconds and dropped when an application changes;
+    maxAgeSeconds=0 forces a fresh fetch.
+    """
+    job_ids = list(dict.fromkeys(arguments.get("jobIds") or []))
+    if not job_ids:
+        raise ValueError("pipeline_snapshot needs at least one jobId")
+    if len(job_ids) > PIPELINE_MAX_JOBS:
+        raise ValueError(f"pipeline_snapshot accepts at most {PIPELINE_MAX_JOBS} jobs")
+    status = arguments.get("status")
+    max_age = arguments.get("maxAgeSeconds", PIPELINE_CACHE_TTL)
+    semaphore = asyncio.Semaphore(PIPELINE_MAX_CONCURRENCY)
+
+    async def one(job_id: str) -> dict:
+        key = response_cache.make_key("pipeline_snapshot", {"jobId": job_id, "status": status})
+        cached = response_cache.get(key)
+        if cached is not None and time.time() - cached["fetchedAt"] <= max_age:
+            return {**cached, "cached": True}
+        try:
+            async with semaphore:
+                snapshot = await _job_pipeline(job_id, status)
+        except Exception as e:
+            return {"jobId": job_id, "error": format_error("application_list", e)}
+        if "error" not in snapshot and PIPELINE_CACHE_TTL > 0:
+            response_cache.set(key, snapshot, PIPELINE_CACHE_TTL)
+        return snapshot
+
+    started = time.perf_counter()
+    now = time.time()
+    jobs = [
+        {**{k: v for k, v in job.items() if k != "fetchedAt"}, "ageSeconds": round(now - job["fetchedAt"])}
+        if "fetchedAt" in job else job
+        for job in await asyncio.gather(*(one(job_id) for job_id in job_ids))
+    ]
+
+    results: dict[str, Any] = {"jobs": jobs}
+    if len(jobs) > 1:
+        totals: dict[str, int] = {}
+        for job in jobs:
+            for key, n in job.get("byStatus", {}).items():
+                totals[key] = totals.get(key, 0) + n
+        results["totals"] = {"applications": sum(job.get("applications", 0) for job in jobs), "byStatus": totals}
+    results["seconds"] = round(time.perf_counter() - started, 3)
+    return {"success": True, "results": results}
+
+
+# =============================================================================
+# OUTPUT SHAPING
+# =============================================================================
+
+def _parse_field_path(field: str) -> list[str]:
+    """Turn "$.a[].b" / "a[*].b" / "a.b" into ["a", "b"]."""
+    field = field.strip()
+    if field.startswith("$"):
+        field = field[1:].lstrip(".")
+    field = field.replace("[*]", "").replace("[]", "")
+    return [part for part in field.split(".") if part]
+
+
+def _pick(value: Any, paths: list[list[str]]) -> Any:
+    if isinstance(value, list):
+        return [_pick(item, paths) for item in value]
+    if not isinstance(value, dict):
+        return value
+    nested: dict[str, list[list[str]]] = {}
+    for path in paths:
+        nested.setdefault(path[0], []).append(path[1:])
+    picked = {}
+    for key, rests in nested.items():
+        if key not in value:
+            continue
+        if any(not rest for rest in rests):
+            picked[key] = value[key]
+        else:
+            picked[key] = _pick(value[key], rests)
+    return picked
+
+
+def project(results: Any, fields: list[str]) -> Any:
+    """Keep only the requested fields of each record in a tool result.
+
+    Server-built results that wrap their rows in {"results": [...], ...}
+    (all_pages, mirror queries, batch) are projected row by row and keep
+    their summary keys.
+    """
+    paths = [path for path in map(_parse_field_path, fields) if path]
+    if not paths:
+        return results
+    if isinstance(results, dict) and isinstance(results.get("results"), list):
+        return {**results, "results": _pick(results["results"], paths)}
+    return _pick(results, paths)
+
+
+def drop_nulls(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: drop_nulls(item) for key, item in value.items() if item is not None}
+    if isinstance(value, list):
+        return [drop_nulls(item) for item in value]
+    return value
+
+
+class OutputStats:
+    """Per-tool response sizes: bytes sent vs. what the full indented payload would be."""
+
+    def __init__(self):
+        self.tools: dict[str, dict[str, int]] = {}
+
+    def record(self, name: str, sent_bytes: int, full_bytes: int) -> None:
+        entry = self.tools.setdefault(name, {"calls": 0, "bytesSent": 0, "bytesFull": 0})
+        entry["calls"] += 1
+        entry["bytesSent"] += sent_bytes
+        entry["bytesFull"] += full_bytes
+
+    def stats(self) -> dict:
+        result = {}
+        for name, entry in self.tools.items():
+            saved = entry["bytesFull"] - entry["bytesSent"]
+            result[name] = {
+                **entry,
+                "savedPercent": round(100 * saved / entry["bytesFull"], 1) if entry["bytesFull"] else 0.0,
+            }
+        return result
+
+
+output_stats = OutputStats()
+
+# Rows serialized to estimate the full size of a shaped row result
+FULL_SIZE_SAMPLE_ROWS = 20
+
+
+def estimate_full_bytes(results: Any) -> int:
+    """Size of the full indented rendering of `results`, estimated from a sample.
+
+    Only used for the savings statistics, so a large row result is never
+    serialized a second time just to be measured.
+    """
+    rows = results.get("results") if isinstance(results, dict) else results
+    if not isinstance(rows, list) or len(rows) <= FULL_SIZE_SAMPLE_ROWS:
+        return len(codec.dumps(results, indent=True).encode())
+    sample = rows[:FULL_SIZE_SAMPLE_ROWS]
+    estimate = len(codec.dumps(sample, indent=True).encode()) * len(rows) // len(sample)
+    if rows is not results:
+        estimate += len(codec.dumps({k: v for k, v in results.items() if k != "results"}, indent=True).encode())
+    return estimate
+
+
+def split_output_options(arguments: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Separate output shaping options from the arguments passed to the tool."""
+    arguments = dict(arguments)
+    options = {key: arguments.pop(key) for key in OUTPUT_PROPERTIES if key in arguments}
+    return arguments, options
+
+
+def shape_output(name: str, results: Any, fields: Optional[list[str]] = None, compact: bool = False) -> str:
+    """Project and serialize a tool result, recording its size.
+
+    When the output differs from the default (full, indented), the size of
+    the default rendering is estimated so the savings can be measured.
+    Plain-text results are returned unchanged.
+    """
+    if isinstance(results, str):
+        output_stats.record(name, len(results.encode()), len(results.encode()))
+        return results
+    started = time.perf_counter()
+    shaped = project(results, fields) if fields else results
+    if compact:
+        shaped = drop_nulls(shaped)
+    full_bytes = None
+    spilled = spill_rows(name, shaped, compact)
+    if spilled is None:
+        text = codec.dumps(shaped, indent=not compact)
+        if SPILL_THRESHOLD and name not in SPILL_EXEMPT and len(text) > SPILL_THRESHOLD:
+            spilled = spill_text(name, text)
+            if not (fields or compact):
+                # The stored text is the default rendering
+                full_bytes = spilled[1]
+    if spilled is not None:
+        text = codec.dumps(spilled[0], indent=not compact)
+    metrics.observe("serialization", name, time.perf_counter() - started)
+    sent_bytes = len(text.encode())
+    if full_bytes is None:
+        # Spilled rows are stored as compact NDJSON, which is not the default rendering either
+        full_bytes = estimate_full_bytes(results) if fields or compact or spilled is not None else sent_bytes
+    output_stats.record(name, sent_bytes, full_bytes)
+    return text
+
+
+# =============================================================================
+# EXPORT
+# =============================================================================
+
+EXPORT_DIR = os.getenv('ASHBY_EXPORT_DIR') or os.path.join(os.path.dirname(os.path.abspath(__file__)), "exports")
+
+# path -> (exporter, task) for exports started in this process
+_exports: dict[str, tuple["Exporter", asyncio.Task]] = {}
+
+
+def export_path(path: Optional[str], dataset: str, output_format: str) -> str:
+    """Where an export goes: `path` taken relative to EXPORT_DIR, which it must stay inside."""
+    from export import default_path
+
+    root = os.path.realpath(EXPORT_DIR)
+    resolved = os.path.realpath(os.path.join(root, path) if path else default_path(root, dataset, output_format))
+    if resolved == root or os.path.commonpath([root, resolved]) != root:
+        raise ValueError(f"Export path must be a file or directory inside {root}")
+    return resolved
+
+
+async def export_data(arguments: dict[str, Any]) -> dict:
+    dataset = arguments.get("dataset")
+    output_format = arguments.get("format", "ndjson")
+    from export import Exporter
+
+    path = export_path(arguments.get("path"), dataset, output_format)
+    running = _exports.get(path)
+    if running is not None and not running[1].done():
+        raise ValueError(f"An export to {path} is already running - see export_status")
+
+    exporter = Exporter(export_pages, dataset, path, output_format,
+                        filters=arguments.get("filters"), resume=not arguments.get("restart", False))
+    task = asyncio.ensure_future(exporter.run())
+    # Failures are reported through export_status
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    _exports[path] = (exporter, task)
+    await asyncio.sleep(0)
+    return {"success": True, "results": exporter.stats()}
+
+
+async def export_status(arguments: dict[str, Any]) -> dict:
+    return {"success": True, "results": [exporter.stats() for exporter, _ in _exports.values()]}
+
+
+# =============================================================================
+# LARGE RESULTS
+# =============================================================================
+
+# Results bigger than this (bytes of JSON) are stored on disk and returned as a
+# resource handle with a summary; 0 disables spilling
+SPILL_THRESHOLD = int(_env_float('ASHBY_SPILL_THRESHOLD', 262144))
+SPILL_PAGE_SIZE = 100
+SPILL_MAX_PAGE_SIZE = 1000
+SPILL_TEXT_CHUNK = 65536
+SPILL_PREVIEW_ROWS = 3
+# Rows sampled to estimate the size of a row result before serializing it
+SPILL_SAMPLE_ROWS = 20
+# Tools whose output is never spilled
+SPILL_EXEMPT = frozenset({"result_read", "server_stats"})
+
+spill_store = SpillStore(
+    os.getenv('ASHBY_SPILL_DIR') or None,
+    max_bytes=int(_env_float('ASHBY_SPILL_MAX_BYTES', 512 * 1024 * 1024)),
+    max_entries=int(_env_float('ASHBY_SPILL_MAX_ENTRIES', 32)),
+)
+
+
+def spill_rows(name: str, shaped: Any, compact: bool) -> Optional[tuple[dict, int]]:
+    """Write an oversized row result straight to the spill store.
+
+    The size is estimated from a sample of rows, so a large result is never
+    serialized as one string. Returns the summary to send and the stored
+    size, or None when the result should be returned inline.
+    """
+    if not SPILL_THRESHOLD or name in SPILL_EXEMPT:
+        return None
+    if isinstance(shaped, list):
+        rows, meta = shaped, {}
+    elif isinstance(shaped, dict) and isinstance(shaped.get("results"), list):
+        rows, meta = shaped["results"], {k: v for k, v in shaped.items() if k != "results"}
+    else:
+        return None
+    if len(rows) <= SPILL_PREVIEW_ROWS:
+        return None
+    sample = rows[:SPILL_SAMPLE_ROWS]
+    estimate = len(codec.dumps(sample, indent=not compact)) * len(rows) / len(sample)
+    if estimate <= SPILL_THRESHOLD:
+        return None
+
+    entry = spill_store.put_rows(name, (codec.dumps(row) for row in rows), meta)
+    pages = math.ceil(len(rows) / SPILL_PAGE_SIZE)
+    return {
+        **meta,
+        "spilled": entry.describe(),
+        "pageSize": SPILL_PAGE_SIZE,
+        "pages": pages,
+        "preview": rows[:SPILL_PREVIEW_ROWS],
+        "hint": f"{len(rows)} rows ({entry.bytes} bytes) are too many to return at once. "
+                f"Read them with result_read using resourceId {entry.id!r} and page 1-{pages}, "
+                "or narrow the call with fields.",
+    }, entry.bytes
+
+
+def spill_text(name: str, text: str) -> tuple[dict, int]:
+    """Store an oversized non-row result for reading back by byte range."""
+    entry = spill_store.put_text(name, text)
+    return {
+        "spilled": entry.describe(),
+        "preview": text[:500],
+        "hint": f"The result is {entry.bytes} bytes. Read it with result_read using resourceId {entry.id!r} "
+                f"and start/length (up to {SPILL_TEXT_CHUNK} bytes at a time).",
+    }, entry.bytes
+
+
+async def result_read(arguments: dict[str, Any]) -> dict:
+    """Read a slice of a spilled result: rows by page or offset, text by byte range."""
+    entry = spill_store.get(str(arguments.get("resourceId", "")))
+    if entry.rows is not None:
+        page_size = min(max(int(arguments.get("pageSize", SPILL_PAGE_SIZE)), 1), SPILL_MAX_PAGE_SIZE)
+        if "offset" in arguments:
+            offset = max(int(arguments["offset"]), 0)
+            limit = min(max(int(arguments.get("limit", page_size)), 0), SPILL_MAX_PAGE_SIZE)
+        else:
+            offset = (max(int(arguments.get("page", 1)), 1) - 1) * page_size
+            limit = page_size
+        rows = [codec.loads(line) for line in spill_store.read_rows(entry, offset, limit)]
+        return {"success": True, "results": {
+            "resourceId": entry.id,
+            "offset": offset,
+            "rows": rows,
+            "rowCount": entry.rows,
+            "hasMore": offset + len(rows) < entry.rows,
+        }}
+    start = max(int(arguments.get("start", 0)), 0)
+    length = min(max(int(arguments.get("length", SPILL_TEXT_CHUNK)), 0), SPILL_TEXT_CHUNK)
+    return {"success": True, "results": {
+        "resourceId": entry.id,
+        "start": start,
+        "text": spill_store.read_bytes(entry, start, length),
+        "bytes": entry.bytes,
+        "hasMore": start + length < entry.bytes,
+    }}
+
+
+@server.list_resources()
+async def handle_list_resources() -> list[types.Resource]:
+    """List spilled results that can still be read."""
+    return [
+        types.Resource(
+            uri=entry.uri,
+            name=f"{entry.tool} result {entry.id}",
+            description=f"{entry.rows} rows" if entry.rows is not None else "JSON document",
+            mimeType="application/json",
+            size=entry.bytes,
+        )
+        for entry in spill_store.entries()
+    ]
+
+
+@server.read_resource()
+async def handle_read_resource(uri) -> list[ReadResourceContents]:
+    """Read a spilled result. Query parameters select the slice, e.g. ?page=2 or ?start=0&length=65536."""
+    query = {key: values[0] for key, values in parse_qs(urlsplit(str(uri)).query).items()}
+    response = await result_read({"resourceId": str(uri), **query})
+    return [ReadResourceContents(content=codec.dumps(response["results"], indent=True), mime_type="application/json")]
+
+
+# =============================================================================
+# DIAGNOSTICS
+# =============================================================================
+
+# Optional node_exporter textfile-collector output, rewritten at most every interval
+METRICS_TEXTFILE = os.getenv('ASHBY_METRICS_TEXTFILE')
+METRICS_INTERVAL = _env_float('ASHBY_METRICS_INTERVAL', 15.0)
+_metrics_written_at = 0.0
+
+
+def prometheus_text() -> str:
+    """All server metrics in the Prometheus text exposition format."""
+    client = get_ashby_client()
+    limiter = client.rate_limiter.stats()
+    cache = response_cache.stats()
+    counters = {
+        "response_bytes_total": ("Bytes returned to the client per tool", {
+            (("tool", tool),): entry["bytesSent"] for tool, entry in sorted(output_stats.tools.items())
+        }),
+        "cache_hits_total": ("Response cache hits", {(): cache["hits"]}),
+        "cache_misses_total": ("Response cache misses", {(): cache["misses"]}),
+        "coalesced_calls_total": ("Reads that shared an in-flight request", {(): single_flight.stats()["coalesced"]}),
+        "rate_limited_total": ("429 responses from Ashby", {(): limiter["throttled"]}),
+        "rate_limiter_wait_seconds_total": ("Time spent waiting for rate limiter tokens", {(): limiter["waitSecondsTotal"]}),
+        "retries_total": ("Requests retried after a 429", {(): client.retries}),
+        "hedged_requests_total": ("Backup requests sent for slow reads", {(): client.hedging.hedged}),
+        "hedge_wins_total": ("Hedged reads answered by the backup request", {(): client.hedging.hedge_wins}),
+        "circuit_rejected_total": ("Calls failed fast by an open circuit breaker", {
+            (("family", family),): breaker.rejected for family, breaker in sorted(client.breakers.items())
+        }),
+    }
+    gauges = {
+        "rate_limit_per_minute": ("Current adaptive request rate", {(): limiter["ratePerMinute"]}),
+        "rate_limiter_waiting": ("Requests waiting for a token", {(): limiter["waiting"]}),
+        "uptime_seconds": ("Seconds since the server started", {(): round(time.time() - metrics.started, 1)}),
+        "circuit_open": ("1 while an endpoint family's circuit breaker is not closed", {
+            (("family", family),): int(breaker.state != "closed") for family, breaker in sorted(client.breakers.items())
+        }),
+    }
+    return render_prometheus(metrics, counters, gauges)
+
+
+def maybe_write_textfile() -> None:
+    """Refresh ASHBY_METRICS_TEXTFILE if it is set and the interval has passed."""
+    global _metrics_written_at
+    if not METRICS_TEXTFILE or time.monotonic() - _metrics_written_at < METRICS_INTERVAL:
+        return
+    _metrics_written_at = time.monotonic()
+    try:
+        write_textfile(METRICS_TEXTFILE, prometheus_text())
+    except OSError as e:
+        print(f"Warning: could not write {METRICS_TEXTFILE}: {e}", file=sys.stderr)
+
+
+async def server_stats(arguments: dict[str, Any]) -> dict:
+    if arguments.get("format") == "prometheus":
+        return {"success": True, "results": prometheus_text()}
+    client = get_ashby_client()
+    tools = metrics.summary()
+    for name, entry in output_stats.stats().items():
+        tools.setdefault(name, {})["bytes"] = entry
+    return {"success": True, "results": {
+        "uptimeSeconds": round(time.time() - metrics.started, 1),
+        "tools": tools,
+        "errorsByStatus": metrics.errors_by_status(),
+        "cache": response_cache.stats(),
+        "spillStore": spill_store.stats(),
+        "interviewCalendar": _interview_calendar.stats() if _interview_calendar else None,
+        "nameIndex": _name_resolver.stats() if _name_resolver else None,
+        "clients": client_limits.stats(),
+        "singleFlight": single_flight.stats(),
+        "rateLimiter": client.rate_limiter.stats(),
+        "retries": client.retry_stats(),
+        "hedging": client.hedging.stats(),
+        "circuitBreakers": client.breaker_stats(),
+    }}
+
+
+# Tools answered by the server itself rather than a single Ashby endpoint
+LOCAL_TOOLS = {
+    "batch": batch,
+    "candidate_dossier": candidate_dossier,
+    "pipeline_snapshot": pipeline_snapshot,
+    **{name: partial(bulk_write, name) for name in BULK_TOOLS},
+    "mirror_sync": mirror_sync,
+    "mirror_status": mirror_status,
+    "mirror_applications": mirror_applications,
+    "mirror_candidates": mirror_candidates,
+    "mirror_jobs": mirror_jobs,
+    "mirror_interview_schedules": mirror_interview_schedules,
+    "candidate_fulltext_search": candidate_fulltext_search,
+    "find_free_slots": find_free_slots,
+    "export_data": export_data,
+    "export_status": export_status,
+    "result_read": result_read,
+    "server_stats": server_stats,
+}
+
+
+async def dispatch_tool(name: str, arguments: dict[str, Any]) -> dict:
+    """Run a tool and return its Ashby-style response envelope."""
+    arguments = await resolve_names(name, arguments)
+    if name in LOCAL_TOOLS:
+        return await LOCAL_TOOLS[name](arguments)
+    if name in CONFLICT_CHECKED_TOOLS:
+        arguments = dict(arguments)
+        if not arguments.pop("allowConflicts", False):
+            conflicts, skipped = await schedule_conflicts(arguments)
+            if conflicts:
+                return {"success": False, "errors": [
+                    f"interviewer {c['interviewerUserId']} already has interview schedule "
+                    f"{c['interviewScheduleId']} from {c['startTime']} to {c['endTime']}"
+                    for c in conflicts
+                ] + ["Pick another time (find_free_slots can suggest one) or pass allowConflicts: true"]}
+            if skipped:
+                response = await call_endpoint(name, arguments)
+                if response.get("success") and isinstance(response.get("results"), dict):
+                    # Don't let a write that went unchecked read as conflict-free
+                    response = {**response, "results": {**response["results"], "conflictCheck": f"skipped: {skipped}"}}
+                return response
+    if name in PAGINATED_TOOLS:
+        arguments, paging = split_paging_options(arguments)
+        if paging.get("all_pages"):
+            return await fetch_all_pages(
+                name,
+                arguments,
+                max_rows=paging.get("max_rows"),
+                max_bytes=paging.get("max_bytes")
+            )
+    return await call_endpoint(name, arguments)
+
+
+def format_error(name: str, e: Exception) -> str:
+    """Describe a failed tool call for the model."""
+    if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 429:
+        retry_after = _retry_after_seconds(e.response)
+        return f"Rate limited by Ashby: {name} was not run - wait {retry_after:.0f}s before retrying"
+    if isinstance(e, httpx.HTTPStatusError):
+        return f"HTTP Error: {e.response.status_code} - {e.response.text}"
+    if isinstance(e, (httpx.TimeoutException, asyncio.TimeoutError)):
+        return f"Timeout: {name} did not complete in time - retry or narrow the request"
+    if isinstance(e, CircuitOpenError):
+        return (f"Ashby unavailable: {e.family} endpoints are failing, so {name} was not run - "
+                f"retry in {e.retry_after:.0f}s")
+    if isinstance(e, ArgumentError):
+        return f"Invalid arguments for {name}: {e} - {name} was not run"
+    return f"Error executing {name}: {str(e)}"
+
+
+def error_status(e: Exception) -> str:
+    """Label a failed tool call for the error counters."""
+    if isinstance(e, httpx.HTTPStatusError):
+        return str(e.response.status_code)
+    if isinstance(e, (httpx.TimeoutException, asyncio.TimeoutError)):
+        return "timeout"
+    if isinstance(e, CircuitOpenError):
+        return "circuit_open"
+    if isinstance(e, ArgumentError):
+        return "invalid_arguments"
+    return "exception"
+
+
+# =============================================================================
+# CLIENTS
+# =============================================================================
+
+# Tool calls one client may have running at once; more wait
+CLIENT_CONCURRENCY = int(_env_float('ASHBY_CLIENT_CONCURRENCY', 16))
+
+
+class ClientLimits:
+    """A concurrency limit per HTTP client.
+
+    Over HTTP many clients share this process, its connection pool and its
+    rate limit; the limit stops one busy client from taking all of them. A
+    client is the bearer token it authenticated with, or its address when
+    no tokens are configured, so reconnecting or opening more sessions
+    doesn't earn more slots.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._slots: dict[str, asyncio.Semaphore] = {}
+        # client -> calls holding or waiting for one of its slots
+        self._users: dict[str, int] = {}
+        # Times a client went from idle to active; clients aren't remembered
+        # once idle, so client churn doesn't grow memory
+        self.arrivals = 0
+        self.queued = 0
+
+    @staticmethod
+    def client() -> Optional[str]:
+        """Who is making the current call; None outside an HTTP request."""
+        try:
+            request = server.request_context.request
+        except LookupError:
+            return None
+        if request is None:
+            return None
+        return request.scope.get("state", {}).get("ashby_client")
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one of the calling client's slots; a no-op over stdio."""
+        client = self.client()
+        if client is None:
+            yield
+            return
+        semaphore = self._slots.get(client)
+        if semaphore is None:
+            semaphore = self._slots[client] = asyncio.Semaphore(self.limit)
+            self.arrivals += 1
+        if semaphore.locked():
+            self.queued += 1
+        self._users[client] = self._users.get(client, 0) + 1
+        try:
+            async with semaphore:
+                yield
+        finally:
+            self._users[client] -= 1
+            if not self._users[client]:
+                del self._users[client]
+                del self._slots[client]
+
+    def stats(self) -> dict:
+        return {
+            "active": len(self._slots),
+            "arrivals": self.arrivals,
+            "concurrencyLimit": self.limit,
+            "queued": self.queued,
+            "inFlight": sum(self.limit - s._value for s in self._slots.values()),
+        }
+
+
+client_limits = ClientLimits(CLIENT_CONCURRENCY)
+
+
+# run_tool checks arguments with the precompiled TOOL_VALIDATORS, so the SDK's
+# per-call jsonschema pass is skipped
+@server.call_tool(validate_input=False)
 async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextContent]:
     """Handle tool calls by routing to Ashby API endpoints."""
-    try:
-        endpoint = ENDPOINT_MAP.get(name)
-        if not endpoint:
-            raise ValueError(f"Unknown tool: {name}")
+    async with client_limits.slot():
+        return await run_tool(name, arguments)
+
 
-        response = ashby_client._make_request(endpoint, data=arguments)
+async def run_tool(name: str, arguments: dict[str, Any]) -> list[types.TextContent]:
+    """Run a tool call and format its result or error as text."""
+    started = time.perf_counter()
+    try:
+        validate_arguments(name, arguments)
+        arguments, output = split_output_options(arguments)
+        response = await dispatch_tool(name, arguments)
 
         # Format response nicely
         if response.get("success"):
             results = response.get("results", response)
             return [types.TextContent(
                 type="text",
-                text=json.dumps(results, indent=2)
+                text=shape_output(name, results, output.get("fields"), output.get("compact", False))
             )]
         else:
+            metrics.error(name, "ashby_error")
             errors = response.get("errors", ["Unknown error"])
             return [types.TextContent(
                 type="text",
                 text=f"Error: {json.dumps(errors)}"
             )]
 
-    except requests.exceptions.HTTPError as e:
-        return [types.TextContent(
-            type="text",
-            text=f"HTTP Error: {e.response.status_code} - {e.response.text}"
-        )]
     except Exception as e:
+        metrics.error(name, error_status(e))
         return [types.TextContent(
             type="text",
-            text=f"Error executing {name}: {str(e)}"
+            text=format_error(name, e)
         )]
+    finally:
+        metrics.observe("tool", name, time.perf_counter() - started)
+        maybe_write_textfile()
 
 
-async def run():
-    """Run the MCP server."""
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options()
-        )
+def _csv_env(name: str) -> list[str]:
+    return [item.strip() for item in os.getenv(name, '').split(",") if item.strip()]
+
+
+class MCPEndpoint:
+    """ASGI app for the /mcp endpoint.
+
+    When tokens are configured every request must carry one of them, and the
+    token names the client for ClientLimits; otherwise the client is its
+    address.
+    """
+
+    def __init__(self, session_manager, tokens: list[str]):
+        self.session_manager = session_manager
+        self.tokens = tokens
+
+    async def __call__(self, scope, receive, send) -> None:
+        if self.tokens:
+            headers = dict(scope.get("headers") or [])
+            supplied = headers.get(b"authorization", b"").decode(errors="replace")
+            matched = [index for index, token in enumerate(self.tokens)
+                       if hmac.compare_digest(supplied, f"Bearer {token}")]
+            if not matched:
+                await send({"type": "http.response.start", "status": 401,
+                            "headers": [(b"content-type", b"text/plain"), (b"www-authenticate", b"Bearer")]})
+                await send({"type": "http.response.body", "body": b"Unauthorized"})
+                return
+            client = f"token-{matched[0] + 1}"
+        else:
+            client = f"address-{(scope.get('client') or ('unknown',))[0]}"
+        scope.setdefault("state", {})["ashby_client"] = client
+        await self.session_manager.handle_request(scope, receive, send)
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def transport_security(host: str, port: int):
+    """DNS rebinding protection: only localhost and ASHBY_MCP_ALLOWED_HOSTS may be named.
+
+    Without it, any web page the user opens could reach the server through a
+    hostname that resolves to 127.0.0.1.
+    """
+    from mcp.server.transport_security import TransportSecuritySettings
+
+    hosts = ["localhost", "127.0.0.1", "[::1]"] + _csv_env('ASHBY_MCP_ALLOWED_HOSTS')
+    if not _is_loopback(host) and host not in ("0.0.0.0", "::"):
+        hosts.append(f"[{host}]" if ":" in host else host)
+    return TransportSecuritySettings(
+        enable_dns_rebinding_protection=True,
+        allowed_hosts=[h for name in hosts for h in (name, f"{name}:{port}")],
+        allowed_origins=[f"{scheme}://{h}" for name in hosts for h in (name, f"{name}:{port}")
+                         for scheme in ("http", "https")],
+    )
+
+
+async def serve_http(host: str, port: int) -> None:
+    """Serve MCP over Streamable HTTP at http://host:port/mcp.
+
+    Every client shares this process's Ashby client, caches, indexes and
+    rate limiter.
+    """
+    # Imported here so stdio startup doesn't pay for the HTTP stack
+    import uvicorn
+    from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+    from starlette.applications import Starlette
+    from starlette.routing import Route
+
+    tokens = _csv_env('ASHBY_MCP_TOKEN')
+    if not tokens and not _is_loopback(host):
+        raise SystemExit(f"Refusing to listen on {host} without ASHBY_MCP_TOKEN - "
+                         "anyone who can reach it could act with your Ashby API key")
+    session_manager = StreamableHTTPSessionManager(app=server, security_settings=transport_security(host, port))
+
+    @asynccontextmanager
+    async def lifespan(app):
+        async with session_manager.run():
+            yield
+
+    app = Starlette(
+        routes=[Route("/mcp", endpoint=MCPEndpoint(session_manager, tokens))],
+        lifespan=lifespan,
+    )
+    config = uvicorn.Config(app, host=host, port=port, log_level=os.getenv('ASHBY_MCP_LOG_LEVEL', 'warning'))
+    print(f"Ashby MCP server listening on http://{host}:{port}/mcp", file=sys.stderr)
+    await uvicorn.Server(config).serve()
+
+
+async def run(transport: str = "stdio", host: str = "127.0.0.1", port: int = 8000):
+    """Run the MCP server over stdio or Streamable HTTP."""
+    try:
+        if transport == "http":
+            await serve_http(host, port)
+        else:
+            async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+                await server.run(
+                    read_stream,
+                    write_stream,
+                    server.create_initialization_options()
+                )
+    finally:
+        for _, task in _exports.values():
+            task.cancel()
+        if _ashby_client is not None:
+            await _ashby_client.aclose()
+        if _mirror is not None:
+            _mirror.close()
+        if _fulltext is not None:
+            _fulltext.close()
+        spill_store.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(run())
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Ashby MCP server")
+    parser.add_argument("--transport", choices=["stdio", "http"], default=os.getenv('ASHBY_MCP_TRANSPORT', 'stdio'),
+                        help="stdio for one client per process, http to share one server between clients")
+    parser.add_argument("--host", default=os.getenv('ASHBY_MCP_HOST', '127.0.0.1'))
+    parser.add_argument("--port", type=int, default=int(os.getenv('ASHBY_MCP_PORT', '8000')))
+    args = parser.parse_args()
+    asyncio.run(run(args.transport, args.host, args.port))
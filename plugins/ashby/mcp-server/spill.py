@@ -0,0 +1,157 @@
+"""
+On-disk store for tool results too large to return in one message.
+
+Row results are written as NDJSON with an in-memory index of line offsets,
+so any page of rows can be read back with one seek. Other results are kept
+as JSON text and read back by byte range. The store is bounded by total
+bytes and entry count and evicts the least recently read entry first.
+Files live in a private temporary directory removed on close().
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from array import array
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+URI_PREFIX = "ashby://results/"
+
+
+class SpillEntry:
+    """One stored result."""
+
+    def __init__(self, entry_id: str, tool: str, path: str, meta: dict):
+        self.id = entry_id
+        self.tool = tool
+        self.path = path
+        self.meta = meta
+        self.bytes = 0
+        # Byte offset of each row, or None for a text entry
+        self.offsets: Optional[array] = None
+        self.created_at = time.time()
+
+    @property
+    def uri(self) -> str:
+        return URI_PREFIX + self.id
+
+    @property
+    def rows(self) -> Optional[int]:
+        return None if self.offsets is None else len(self.offsets)
+
+    def describe(self) -> dict:
+        description = {"resourceId": self.id, "uri": self.uri, "tool": self.tool, "bytes": self.bytes}
+        if self.rows is not None:
+            description["rows"] = self.rows
+        return description
+
+
+class SpillStore:
+    """LRU-bounded directory of spilled results."""
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 512 * 1024 * 1024, max_entries: int = 32):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, SpillEntry] = OrderedDict()
+        self._owns_directory = directory is None
+        self.total_bytes = 0
+        self.spilled = 0
+        self.evictions = 0
+
+    def _new_entry(self, tool: str, meta: dict, suffix: str) -> SpillEntry:
+        if self.directory is None:
+            self.directory = tempfile.mkdtemp(prefix="ashby-mcp-results-")
+        os.makedirs(self.directory, exist_ok=True)
+        entry_id = uuid.uuid4().hex[:16]
+        return SpillEntry(entry_id, tool, os.path.join(self.directory, entry_id + suffix), meta)
+
+    def put_rows(self, tool: str, lines: Iterable[str], meta: Optional[dict] = None) -> SpillEntry:
+        """Store rows given as one compact JSON document per line."""
+        entry = self._new_entry(tool, meta or {}, ".ndjson")
+        entry.offsets = array("q")
+        position = 0
+        with open(entry.path, "wb") as f:
+            for line in lines:
+                data = line.encode() + b"\n"
+                entry.offsets.append(position)
+                f.write(data)
+                position += len(data)
+        entry.bytes = position
+        return self._add(entry)
+
+    def put_text(self, tool: str, text: str, meta: Optional[dict] = None) -> SpillEntry:
+        entry = self._new_entry(tool, meta or {}, ".json")
+        data = text.encode()
+        with open(entry.path, "wb") as f:
+            f.write(data)
+        entry.bytes = len(data)
+        return self._add(entry)
+
+    def _add(self, entry: SpillEntry) -> SpillEntry:
+        self._entries[entry.id] = entry
+        self.total_bytes += entry.bytes
+        self.spilled += 1
+        # Never evict the entry just added, even if it alone is over budget
+        while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes):
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+        return entry
+
+    def _remove(self, entry_id: str) -> None:
+        entry = self._entries.pop(entry_id)
+        self.total_bytes -= entry.bytes
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+
+    def get(self, entry_id: str) -> SpillEntry:
+        """Look up an entry by id or URI and mark it recently used."""
+        if entry_id.startswith(URI_PREFIX):
+            entry_id = entry_id[len(URI_PREFIX):].split("?", 1)[0]
+        entry = self._entries.get(entry_id)
+        if entry is None:
+            raise ValueError(f"Result {entry_id} is not stored (it may have been evicted) - rerun the tool")
+        self._entries.move_to_end(entry_id)
+        return entry
+
+    def read_rows(self, entry: SpillEntry, offset: int, limit: int) -> list[bytes]:
+        """Raw JSON lines for rows [offset, offset + limit)."""
+        if entry.offsets is None:
+            raise ValueError("This result is not a list of rows - read it by byte range")
+        offset = max(offset, 0)
+        end = min(offset + max(limit, 0), len(entry.offsets))
+        if offset >= end:
+            return []
+        start_byte = entry.offsets[offset]
+        end_byte = entry.offsets[end] if end < len(entry.offsets) else entry.bytes
+        with open(entry.path, "rb") as f:
+            f.seek(start_byte)
+            return f.read(end_byte - start_byte).splitlines()
+
+    def read_bytes(self, entry: SpillEntry, start: int, length: int) -> str:
+        """Text for bytes [start, start + length); partial characters at the edges are dropped."""
+        with open(entry.path, "rb") as f:
+            f.seek(max(start, 0))
+            return f.read(max(length, 0)).decode(errors="ignore")
+
+    def entries(self) -> list[SpillEntry]:
+        return list(self._entries.values())
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "maxBytes": self.max_bytes,
+            "spilled": self.spilled,
+            "evictions": self.evictions,
+        }
+
+    def close(self) -> None:
+        for entry_id in list(self._entries):
+            self._remove(entry_id)
+        if self._owns_directory and self.directory is not None:
+            shutil.rmtree(self.directory, ignore_errors=True)
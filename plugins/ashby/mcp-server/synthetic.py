@@ -0,0 +1,387 @@
+"""
+Deterministic synthetic Ashby records for benchmarks and the mock server.
+
+Records follow the shape of real Ashby API responses closely enough to
+exercise serialization and parsing realistically (nested objects, nulls,
+long text). The same seed always produces the same data.
+"""
+
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+FIRST_NAMES = ["Ada", "Grace", "Alan", "Linus", "Margaret", "Dennis", "Barbara", "Ken", "Frances", "Edsger",
+               "Radia", "Guido", "Katherine", "Bjarne", "Hedy", "Tim", "Shafi", "Donald", "Jean", "Niklaus"]
+LAST_NAMES = ["Lovelace", "Hopper", "Turing", "Torvalds", "Hamilton", "Ritchie", "Liskov", "Thompson", "Allen",
+              "Dijkstra", "Perlman", "van Rossum", "Johnson", "Stroustrup", "Lamarr", "Berners-Lee", "Goldwasser",
+              "Knuth", "Sammet", "Wirth"]
+COMPANIES = ["Initech", "Globex", "Hooli", "Pied Piper", "Umbrella", "Stark Industries", "Wayne Enterprises", "Acme"]
+TITLES = ["Software Engineer", "Senior Software Engineer", "Staff Engineer", "Product Designer",
+          "Engineering Manager", "Data Scientist", "Recruiter", "Account Executive"]
+STAGES = ["Application Review", "Recruiter Screen", "Technical Screen", "Onsite", "Offer", "Hired", "Archived"]
+SOURCES = ["LinkedIn", "Referral", "Careers Page", "Agency", "Conference", "Sourced"]
+CITIES = ["San Francisco", "New York", "London", "Berlin", "Toronto", "Remote"]
+DEPARTMENTS = ["Engineering", "Design", "Product", "Sales", "Marketing", "People"]
+LOREM = ("Strong communicator with clear examples of ownership. Walked through a past migration in detail, "
+         "covering trade-offs, rollout and what they would change. Some gaps on distributed systems depth "
+         "but learned quickly when prompted. Would be a good addition to the team.").split()
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _id(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _time(rng: random.Random, days: int = 365) -> str:
+    moment = BASE_TIME + timedelta(seconds=rng.randrange(days * 86400))
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(LOREM) for _ in range(words))
+
+
+def _user(rng: random.Random) -> dict:
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    return {
+        "id": _id(rng),
+        "firstName": first,
+        "lastName": last,
+        "email": f"{first.lower()}.{last.lower().replace(' ', '')}@example.com",
+        "globalRole": rng.choice(["Organization Admin", "Elevated Access", "Limited Access"]),
+        "isEnabled": True,
+        "updatedAt": _time(rng),
+    }
+
+
+def candidate(rng: random.Random, index: int) -> dict:
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    email = f"{first.lower()}.{last.lower().replace(' ', '')}{index}@example.com"
+    email_address = {"value": email, "type": "Personal", "isPrimary": True}
+    phone = {"value": f"+1 555 {rng.randrange(1000000):07d}", "type": "Mobile", "isPrimary": True}
+    city = rng.choice(CITIES)
+    return {
+        "id": _id(rng),
+        "createdAt": _time(rng),
+        "updatedAt": _time(rng),
+        "name": f"{first} {last}",
+        "primaryEmailAddress": email_address,
+        "emailAddresses": [email_address],
+        "primaryPhoneNumber": phone,
+        "phoneNumbers": [phone],
+        "socialLinks": [{"type": "LinkedIn", "url": f"https://linkedin.com/in/{first.lower()}-{index}"}],
+        "tags": [{"id": _id(rng), "title": rng.choice(["Strong", "Boomerang", "Diversity"]), "isArchived": False}
+                 for _ in range(rng.randrange(3))],
+        "position": rng.choice(TITLES),
+        "company": rng.choice(COMPANIES),
+        "school": None,
+        "applicationIds": [_id(rng) for _ in range(rng.randrange(1, 3))],
+        "resumeFileHandle": {"id": _id(rng), "name": f"{first}_{last}_resume.pdf", "handle": _id(rng)},
+        "fileHandles": [],
+        "customFields": [],
+        "profileUrl": f"https://app.ashbyhq.com/candidates/{index}",
+        "source": {"id": _id(rng), "title": rng.choice(SOURCES), "isArchived": False},
+        "creditedToUser": _user(rng),
+        "timezone": None,
+        "location": {
+            "id": _id(rng),
+            "locationSummary": city,
+            "locationComponents": [{"type": "City", "name": city}],
+        },
+    }
+
+
+def job(rng: random.Random, index: int) -> dict:
+    return {
+        "id": _id(rng),
+        "title": f"{rng.choice(TITLES)} {index}",
+        "confidential": False,
+        "status": rng.choice(["Open", "Open", "Open", "Closed", "Draft", "Archived"]),
+        "employmentType": "FullTime",
+        "locationId": _id(rng),
+        "departmentId": _id(rng),
+        "defaultInterviewPlanId": _id(rng),
+        "interviewPlanIds": [_id(rng)],
+        "customFields": [],
+        "jobPostingIds": [_id(rng)],
+        "customRequisitionId": None,
+        "brandId": None,
+        "hiringTeam": [{**_user(rng), "role": "Hiring Manager"}, {**_user(rng), "role": "Recruiter"}],
+        "createdAt": _time(rng),
+        "updatedAt": _time(rng),
+        "openedAt": _time(rng),
+        "closedAt": None,
+        "author": _user(rng),
+    }
+
+
+def application(rng: random.Random, index: int) -> dict:
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    stage_order = rng.randrange(len(STAGES))
+    status = "Hired" if STAGES[stage_order] == "Hired" else "Archived" if STAGES[stage_order] == "Archived" else "Active"
+    return {
+        "id": _id(rng),
+        "createdAt": _time(rng),
+        "updatedAt": _time(rng),
+        "status": status,
+        "customFields": [],
+        "candidate": {
+            "id": _id(rng),
+            "name": f"{first} {last}",
+            "primaryEmailAddress": {"value": f"{first.lower()}{index}@example.com", "type": "Personal", "isPrimary": True},
+        },
+        "currentInterviewStage": {
+            "id": _id(rng),
+            "title": STAGES[stage_order],
+            "type": "Active",
+            "orderInInterviewPlan": stage_order,
+            "interviewStageGroupId": _id(rng),
+            "interviewPlanId": _id(rng),
+        },
+        "source": {"id": _id(rng), "title": rng.choice(SOURCES), "isArchived": False},
+        "archiveReason": None,
+        "archivedAt": None,
+        "job": {"id": _id(rng), "title": rng.choice(TITLES), "locationId": _id(rng), "departmentId": _id(rng)},
+        "creditedToUser": _user(rng),
+        "hiringTeam": [{**_user(rng), "role": "Recruiter"}],
+        "appliedViaJobPostingId": None,
+    }
+
+
+def feedback(rng: random.Random, index: int) -> dict:
+    fields = [
+        {"id": _id(rng), "type": "Score", "path": "overall_recommendation", "title": "Overall recommendation"},
+        {"id": _id(rng), "type": "RichText", "path": "notes", "title": "Interview notes"},
+        {"id": _id(rng), "type": "Score", "path": "technical", "title": "Technical ability"},
+        {"id": _id(rng), "type": "Score", "path": "communication", "title": "Communication"},
+    ]
+    return {
+        "id": _id(rng),
+        "applicationId": _id(rng),
+        "interviewId": _id(rng),
+        "submittedAt": _time(rng),
+        "submittedByUser": _user(rng),
+        "formDefinition": {
+            "sections": [{
+                "title": "Feedback",
+                "fields": [{"field": {**field, "humanReadablePath": field["title"], "isNullable": False}}
+                           for field in fields],
+            }],
+        },
+        "submittedValues": {
+            "overall_recommendation": {"score": rng.randrange(1, 5)},
+            "notes": _text(rng, rng.randrange(80, 300)),
+            "technical": {"score": rng.randrange(1, 5)},
+            "communication": {"score": rng.randrange(1, 5)},
+        },
+    }
+
+
+def note(rng: random.Random, index: int) -> dict:
+    return {
+        "id": _id(rng),
+        "createdAt": _time(rng),
+        "content": _text(rng, rng.randrange(10, 80)),
+        "author": _user(rng),
+    }
+
+
+def user(rng: random.Random, index: int) -> dict:
+    return _user(rng)
+
+
+def department(rng: random.Random, index: int) -> dict:
+    return {"id": _id(rng), "name": f"{DEPARTMENTS[index % len(DEPARTMENTS)]} {index // len(DEPARTMENTS) or ''}".strip(),
+            "isArchived": False, "parentId": None}
+
+
+def location(rng: random.Random, index: int) -> dict:
+    city = CITIES[index % len(CITIES)]
+    return {"id": _id(rng), "name": f"{city} {index // len(CITIES) or ''}".strip(), "isArchived": False,
+            "isRemote": city == "Remote", "address": {"postalAddress": {"addressLocality": city}}}
+
+
+def interview_stage(rng: random.Random, index: int) -> dict:
+    return {"id": _id(rng), "title": STAGES[index % len(STAGES)], "type": "Active",
+            "orderInInterviewPlan": index % len(STAGES), "interviewStageGroupId": _id(rng),
+            "interviewPlanId": _id(rng)}
+
+
+def source(rng: random.Random, index: int) -> dict:
+    return {"id": _id(rng), "title": SOURCES[index % len(SOURCES)], "isArchived": False,
+            "sourceType": {"id": _id(rng), "title": "Inbound", "isArchived": False}}
+
+
+def candidate_tag(rng: random.Random, index: int) -> dict:
+    return {"id": _id(rng), "title": f"Tag {index}", "isArchived": False}
+
+
+def archive_reason(rng: random.Random, index: int) -> dict:
+    return {"id": _id(rng), "text": rng.choice(["Not a fit", "Withdrew", "Hired elsewhere", "Compensation"]),
+            "reasonType": rng.choice(["RejectedByCandidate", "RejectedByOrg", "Other"]), "isArchived": False}
+
+
+def feedback_form(rng: random.Random, index: int) -> dict:
+    return {"id": _id(rng), "title": f"Interview scorecard {index}", "isArchived": False,
+            "formDefinition": feedback(rng, index)["formDefinition"]}
+
+
+def interview(rng: random.Random, index: int) -> dict:
+    return {"id": _id(rng), "title": rng.choice(["Technical Screen", "System Design", "Culture", "Hiring Manager"]),
+            "isArchived": False, "isDebrief": False, "instructionsHtml": f"<p>{_text(rng, 20)}</p>",
+            "jobId": None, "feedbackFormDefinitionId": _id(rng)}
+
+
+def interview_schedule(rng: random.Random, index: int) -> dict:
+    start = BASE_TIME + timedelta(days=rng.randrange(365), hours=rng.randrange(8, 18))
+    events = []
+    for _ in range(rng.randrange(1, 4)):
+        end = start + timedelta(minutes=rng.choice([30, 45, 60]))
+        events.append({
+            "id": _id(rng),
+            "interviewId": _id(rng),
+            "startTime": start.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            "endTime": end.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            "interviewers": [_user(rng) for _ in range(rng.randrange(1, 3))],
+            "location": None,
+            "meetingLink": f"https://meet.example.com/{index}",
+        })
+        start = end
+    return {
+        "id": _id(rng),
+        "status": rng.choice(["Scheduled", "Scheduled", "Complete", "Cancelled"]),
+        "applicationId": _id(rng),
+        "interviewStageId": _id(rng),
+        "interviewEvents": events,
+        "createdAt": _time(rng),
+        "updatedAt": _time(rng),
+    }
+
+
+def offer(rng: random.Random, index: int) -> dict:
+    return {
+        "id": _id(rng),
+        "decidedAt": None,
+        "applicationId": _id(rng),
+        "acceptanceStatus": rng.choice(["Pending", "Accepted", "Declined"]),
+        "offerStatus": rng.choice(["WaitingOnApprovalStart", "WaitingOnCandidateResponse", "CandidateAccepted"]),
+        "latestVersion": {
+            "id": _id(rng),
+            "startDate": _time(rng)[:10],
+            "salary": {"currencyCode": "USD", "value": rng.randrange(90, 250) * 1000},
+            "createdAt": _time(rng),
+            "author": _user(rng),
+        },
+    }
+
+
+# Record kind -> generator(rng, index)
+GENERATORS: dict[str, Callable[[random.Random, int], dict]] = {
+    "candidate": candidate,
+    "job": job,
+    "application": application,
+    "feedback": feedback,
+    "note": note,
+    "user": user,
+    "department": department,
+    "location": location,
+    "interview_stage": interview_stage,
+    "source": source,
+    "candidate_tag": candidate_tag,
+    "archive_reason": archive_reason,
+    "feedback_form": feedback_form,
+    "interview": interview,
+    "interview_schedule": interview_schedule,
+    "offer": offer,
+}
+
+
+def records(kind: str, count: int, seed: int = 0) -> list[dict]:
+    """Generate `count` records of one kind."""
+    rng = random.Random(f"{kind}:{seed}")
+    generate = GENERATORS[kind]
+    return [generate(rng, index) for index in range(count)]
+
+
+def list_response(kind: str, count: int, seed: int = 0, next_cursor: Any = None) -> dict:
+    """An Ashby list-endpoint envelope holding `count` records."""
+    return {
+        "success": True,
+        "results": records(kind, count, seed),
+        "moreDataAvailable": next_cursor is not None,
+        "nextCursor": next_cursor,
+    }
+
+
+class Dataset:
+    """A linked set of records: applications point at real candidates and jobs,
+    schedules, feedback, offers and notes point at real applications and
+    candidates, and interviewers are real users.
+
+    `size` is the number of candidates; other kinds scale from it.
+    """
+
+    # Reference lists stay small regardless of dataset size
+    FIXED_COUNTS = {
+        "department": 12, "location": 12, "interview_stage": 3 * len(STAGES), "source": 6, "candidate_tag": 20,
+        "archive_reason": 8, "feedback_form": 5, "interview": 10,
+    }
+
+    def __init__(self, size: int = 500, seed: int = 0):
+        self.size = size
+        self.seed = seed
+        counts = {
+            "candidate": size,
+            "job": max(size // 20, 1),
+            "application": size * 3 // 2,
+            "user": max(size // 10, 1),
+            "interview_schedule": size // 2,
+            "feedback": size,
+            "offer": max(size // 20, 1),
+            "note": size * 2,
+            **self.FIXED_COUNTS,
+        }
+        self.kinds: dict[str, list[dict]] = {kind: records(kind, count, seed) for kind, count in counts.items()}
+        self._link()
+        self.by_id: dict[str, dict[str, dict]] = {
+            kind: {r["id"]: r for r in rows} for kind, rows in self.kinds.items()
+        }
+        self.notes_by_candidate: dict[str, list[dict]] = {}
+        for n in self.kinds["note"]:
+            self.notes_by_candidate.setdefault(n.pop("candidateId"), []).append(n)
+
+    def _link(self) -> None:
+        rng = random.Random(f"links:{self.seed}")
+        candidates, jobs = self.kinds["candidate"], self.kinds["job"]
+        applications = self.kinds["application"]
+        # Each interview plan has one stage of every title, so titles repeat across plans
+        stages = self.kinds["interview_stage"]
+        plans = [stage["interviewPlanId"] for stage in stages[::len(STAGES)]]
+        for index, stage in enumerate(stages):
+            stage["interviewPlanId"] = plans[index // len(STAGES)]
+        for j in jobs:
+            j["defaultInterviewPlanId"] = rng.choice(plans)
+            j["interviewPlanIds"] = [j["defaultInterviewPlanId"]]
+        for candidate_record in candidates:
+            candidate_record["applicationIds"] = []
+        for a in applications:
+            c, j = rng.choice(candidates), rng.choice(jobs)
+            stage = rng.choice([s for s in stages if s["interviewPlanId"] == j["defaultInterviewPlanId"]])
+            a["candidate"] = {"id": c["id"], "name": c["name"], "primaryEmailAddress": c["primaryEmailAddress"]}
+            a["job"] = {"id": j["id"], "title": j["title"], "locationId": j["locationId"], "departmentId": j["departmentId"]}
+            a["currentInterviewStage"] = dict(stage)
+            a["status"] = {"Hired": "Hired", "Archived": "Archived"}.get(stage["title"], "Active")
+            c["applicationIds"].append(a["id"])
+        for kind in ("interview_schedule", "feedback", "offer"):
+            for r in self.kinds[kind]:
+                r["applicationId"] = rng.choice(applications)["id"]
+        for n in self.kinds["note"]:
+            n["candidateId"] = rng.choice(candidates)["id"]
+        # Interviewers are drawn from a small pool of real users, so calendars overlap
+        interviewers = self.kinds["user"][:max(len(self.kinds["user"]) // 4, 2)]
+        for s in self.kinds["interview_schedule"]:
+            for event in s["interviewEvents"]:
+                count = min(len(event["interviewers"]), len(interviewers))
+                event["interviewers"] = [dict(u) for u in rng.sample(interviewers, count)]
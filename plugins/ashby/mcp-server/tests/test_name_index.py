@@ -0,0 +1,56 @@
+"""
+Name resolution against the mock Ashby API.
+
+    uv run python -m unittest discover tests
+"""
+
+import json
+import os
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("ASHBY_API_KEY", "test")
+os.environ.setdefault("ASHBY_RATE_LIMIT", "1000000")
+os.environ.setdefault("ASHBY_RATE_BURST", "1000")
+os.environ.setdefault("ASHBY_FULLTEXT_PATH", ":memory:")
+
+import mock_ashby  # noqa: E402
+import server  # noqa: E402
+
+
+class NameIndexRefreshTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.mock = mock_ashby.start_in_thread(size=200)
+        server.get_ashby_client().base_url = self.mock.base_url
+        server._name_resolver = None
+
+    def tearDown(self):
+        self.mock.shutdown()
+        self.mock.server_close()
+
+    async def call(self, name: str, arguments: dict) -> str:
+        return (await server.handle_call_tool(name, arguments))[0].text
+
+    async def test_refresh_finds_record_created_after_cached_listing(self):
+        dataset = self.mock.state.dataset
+        candidate = dataset.kinds["candidate"][0]
+        existing = dataset.kinds["candidate_tag"][0]
+
+        # Load the index and leave the tag listing in the response cache
+        await self.call("candidate_add_tag", {"candidateId": candidate["id"], "tagId": existing["title"]})
+        self.assertTrue((await server.call_endpoint("candidate_tag_list", {}))["success"])
+
+        with self.mock.state.lock:
+            created = self.mock.state.create("candidate_tag", {"title": "Strong Hire"})["results"]
+        resolver = server.get_name_resolver()
+        resolver.max_age = resolver.miss_refresh_interval = 0
+
+        text = await self.call("candidate_add_tag", {"candidateId": candidate["id"], "tagId": "Strong Hire"})
+        self.assertNotIn("no candidate tag named", text)
+        self.assertIn(created["id"], [tag["id"] for tag in json.loads(text)["tags"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
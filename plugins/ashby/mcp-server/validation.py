@@ -0,0 +1,188 @@
+"""
+Tool argument validation compiled from the tools' inputSchemas.
+
+Each schema is turned once into nested Python closures that only answer
+"valid or not", which costs about a microsecond per call. Only when a call
+is invalid is the schema walked again to say exactly what is wrong, e.g.
+"missing required argument 'candidateId'" or "unknown argument 'candidateID'
+- did you mean 'candidateId'?", so bad calls are rejected before a round
+trip to Ashby.
+
+The compiler handles the keywords the Ashby tools use (type, properties,
+required, items, enum). A schema using anything else is checked with a
+prebuilt jsonschema validator instead. Unlike plain JSON Schema, unknown
+top-level arguments are rejected, because they are almost always typos.
+"""
+
+import difflib
+from typing import Any, Callable
+
+# Keywords the compiler understands; the rest only annotate
+COMPILED_KEYWORDS = frozenset({"type", "properties", "required", "items", "enum"})
+ANNOTATIONS = frozenset({"description", "default", "title", "examples"})
+
+Check = Callable[[Any], bool]
+
+
+class ArgumentError(ValueError):
+    """Tool arguments that don't match the tool's inputSchema."""
+
+    def __init__(self, tool: str, problems: list[str]):
+        super().__init__("; ".join(problems))
+        self.tool = tool
+        self.problems = problems
+
+
+def _is_integer(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+TYPE_CHECKS: dict[str, Check] = {
+    "string": lambda v: isinstance(v, str),
+    "integer": _is_integer,
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "array": lambda v: isinstance(v, list),
+    "object": lambda v: isinstance(v, dict),
+    "null": lambda v: v is None,
+}
+
+TYPE_NAMES = {
+    "string": "a string", "integer": "an integer", "number": "a number", "boolean": "true or false",
+    "array": "a list", "object": "an object", "null": "null",
+}
+
+
+def compilable(schema: dict) -> bool:
+    """Whether every keyword in the schema is one the compiler handles."""
+    for key, value in schema.items():
+        if key not in COMPILED_KEYWORDS and key not in ANNOTATIONS:
+            return False
+        if key == "properties" and not all(compilable(s) for s in value.values()):
+            return False
+        if key == "items" and not (isinstance(value, dict) and compilable(value)):
+            return False
+    return True
+
+
+def _compile_type(type_: Any) -> Check:
+    if isinstance(type_, str):
+        return TYPE_CHECKS[type_]
+    checks = tuple(TYPE_CHECKS[t] for t in type_)
+    return lambda v: any(check(v) for check in checks)
+
+
+def compile_schema(schema: dict, strict: bool = False) -> Check:
+    """A function returning whether a value matches `schema`.
+
+    With `strict`, object keys not listed in `properties` are invalid.
+    """
+    checks: list[Check] = []
+    if "type" in schema:
+        checks.append(_compile_type(schema["type"]))
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+        checks.append(lambda v: v in allowed)
+    if "items" in schema:
+        item_check = compile_schema(schema["items"])
+        checks.append(lambda v: not isinstance(v, list) or all(item_check(item) for item in v))
+    if "properties" in schema or "required" in schema:
+        properties = {key: compile_schema(sub) for key, sub in schema.get("properties", {}).items()}
+        required = tuple(schema.get("required", ()))
+
+        def check_object(value: Any) -> bool:
+            if not isinstance(value, dict):
+                return True
+            for key in required:
+                if key not in value:
+                    return False
+            for key, item in value.items():
+                check = properties.get(key)
+                if check is None:
+                    if strict:
+                        return False
+                elif not check(item):
+                    return False
+            return True
+        checks.append(check_object)
+
+    if not checks:
+        return lambda v: True
+    if len(checks) == 1:
+        return checks[0]
+    first, *rest = checks
+    return lambda v: first(v) and all(check(v) for check in rest)
+
+
+def _describe(value: Any) -> str:
+    text = repr(value)
+    return text if len(text) <= 40 else text[:37] + "..."
+
+
+def explain(schema: dict, value: Any, path: str = "", strict: bool = False) -> list[str]:
+    """Everything wrong with `value` against `schema`, as readable messages."""
+    where = f"'{path}'" if path else "arguments"
+    type_ = schema.get("type")
+    if type_ is not None:
+        types = [type_] if isinstance(type_, str) else list(type_)
+        if not any(TYPE_CHECKS[t](value) for t in types):
+            expected = " or ".join(TYPE_NAMES[t] for t in types)
+            return [f"{where} must be {expected}, got {_describe(value)}"]
+    if "enum" in schema and value not in schema["enum"]:
+        return [f"{where} must be one of {', '.join(map(str, schema['enum']))}, got {_describe(value)}"]
+
+    problems = []
+    if isinstance(value, list) and "items" in schema:
+        for index, item in enumerate(value):
+            problems.extend(explain(schema["items"], item, f"{path}[{index}]"))
+    if isinstance(value, dict):
+        properties = schema.get("properties", {})
+        prefix = f"{path}." if path else ""
+        for key in schema.get("required", ()):
+            if key not in value:
+                problems.append(f"missing required argument '{prefix}{key}'")
+        for key, item in value.items():
+            if key in properties:
+                problems.extend(explain(properties[key], item, prefix + key))
+            elif strict:
+                close = difflib.get_close_matches(key, list(properties), n=1, cutoff=0.6)
+                hint = f" - did you mean '{prefix}{close[0]}'?" if close else ""
+                problems.append(f"unknown argument '{prefix}{key}'{hint}")
+    return problems
+
+
+class ToolValidator:
+    """Validates one tool's arguments; compiled once from its inputSchema."""
+
+    def __init__(self, tool: str, schema: dict):
+        self.tool = tool
+        self.schema = schema
+        self.compiled = compilable(schema)
+        if self.compiled:
+            self.is_valid = compile_schema(schema, strict=True)
+        else:
+            import jsonschema
+
+            validator = jsonschema.validators.validator_for(schema)(schema)
+            self.is_valid = validator.is_valid
+            self._validator = validator
+
+    def __call__(self, arguments: dict) -> None:
+        """Raise ArgumentError unless `arguments` match the schema."""
+        if self.is_valid(arguments):
+            return
+        if self.compiled:
+            problems = explain(self.schema, arguments, strict=True)
+        else:
+            problems = [
+                f"'{'.'.join(map(str, e.absolute_path))}': {e.message}" if e.absolute_path else e.message
+                for e in self._validator.iter_errors(arguments)
+            ]
+        raise ArgumentError(self.tool, problems or ["arguments do not match the tool's inputSchema"])
+
+
+def compile_tools(schemas: dict[str, dict]) -> dict[str, ToolValidator]:
+    """A validator per tool name."""
+    return {name: ToolValidator(name, schema) for name, schema in schemas.items()}